@@ -3,11 +3,16 @@ ClarifaiUtil.py - Utility module for Clarifai audio transcription functionality
 Contains all Clarifai-specific API calls and data handling
 """
 
-import base64
+import hashlib
 import io
+import mmap
 import os
+import threading
 import time
-from typing import Optional, Dict, Any, Generator, Iterator
+import wave
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Generator, Iterator, List
 from clarifai_grpc.channel.clarifai_channel import ClarifaiChannel
 from clarifai_grpc.grpc.api import resources_pb2, service_pb2, service_pb2_grpc
 from clarifai_grpc.grpc.api.status import status_code_pb2
@@ -29,6 +34,180 @@ except ImportError:
     AUDIO_CONVERSION_AVAILABLE = False
     AudioSegment = None
 
+# NumPy for pause detection when splitting long audio
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+# xxHash for fast upload digests used as cache keys (SHA-256 fallback)
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+    xxhash = None
+
+
+# Maximum number of chunk transcriptions remembered per streaming client
+CHUNK_CACHE_MAX_ENTRIES = 256
+
+# WAV codecs for streaming chunks (None keeps pydub's native 16-bit PCM export)
+STREAMING_WIRE_FORMATS = {
+    "pcm16": None,
+    "mulaw": "pcm_mulaw",
+    "pcm8": "pcm_u8"
+}
+
+
+# Placeholder texts extract_transcription_text returns when the model gave no text;
+# they describe the failure and are never part of a transcript
+NO_TRANSCRIPTION_TEXT = "No transcription available"
+EMPTY_RESPONSE_TEXT = "Model returned empty response - may not be deployed or compatible with audio format"
+NO_TEXT_DATA_TEXT = "Model did not return text data - may not support this audio format"
+NO_TEXT_RESULTS = (NO_TRANSCRIPTION_TEXT, EMPTY_RESPONSE_TEXT, NO_TEXT_DATA_TEXT)
+
+# Pause detection for long-audio chunking: energy window size, and how far back
+# from each chunk limit to look for the quietest window to cut at
+PAUSE_WINDOW_MS = 30
+PAUSE_SEARCH_SECONDS = 5
+
+
+def get_wire_format_codec(wire_format: Optional[str] = None) -> Optional[str]:
+    """
+    Resolve a streaming wire format to the ffmpeg codec used for chunk export
+    
+    Args:
+        wire_format: "pcm16", "mulaw" or "pcm8". Uses config.STREAMING_WIRE_FORMAT if None
+        
+    Returns:
+        ffmpeg audio codec name, or None for native 16-bit PCM
+        
+    Raises:
+        ValueError: If wire_format is not supported
+    """
+    wire_format = (wire_format or config.STREAMING_WIRE_FORMAT).lower()
+    if wire_format not in STREAMING_WIRE_FORMATS:
+        raise ValueError(
+            f"Unsupported wire format: {wire_format}. "
+            f"Available formats: {list(STREAMING_WIRE_FORMATS.keys())}"
+        )
+    return STREAMING_WIRE_FORMATS[wire_format]
+
+
+def content_digest(data) -> str:
+    """
+    Hex digest of an upload's bytes for use as a cache key
+    
+    XXH3-128 when xxhash is installed (many times faster than SHA-256 on large
+    files), otherwise SHA-256. Keys are only compared within one process's caches,
+    so mixing the two across installs is harmless.
+    
+    Args:
+        data: bytes or any buffer (e.g. a memoryview from UploadedFile.getbuffer())
+        
+    Returns:
+        Hex digest string
+    """
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.sha256(data).hexdigest()
+
+
+def is_pcm_wav(audio_bytes: bytes) -> bool:
+    """
+    Check for an uncompressed PCM WAV header (RIFF/WAVE with format tag 1)
+    
+    Args:
+        audio_bytes: Audio file bytes
+        
+    Returns:
+        True if the data starts with a PCM WAV header
+    """
+    return (
+        len(audio_bytes) > 44
+        and audio_bytes[:4] == b'RIFF'
+        and audio_bytes[8:16] == b'WAVEfmt '
+        and audio_bytes[20:22] == b'\x01\x00'
+    )
+
+
+def is_speech_ready_wav(audio_bytes: bytes, sample_rate: int) -> bool:
+    """
+    Check whether a WAV is already mono 16-bit PCM at the given sample rate
+    
+    Args:
+        audio_bytes: Audio file bytes
+        sample_rate: Expected sample rate in Hz
+        
+    Returns:
+        True if the header matches, so conversion to WAV would not change the audio
+    """
+    return (
+        is_pcm_wav(audio_bytes)
+        and int.from_bytes(audio_bytes[22:24], 'little') == 1
+        and int.from_bytes(audio_bytes[24:28], 'little') == sample_rate
+        and int.from_bytes(audio_bytes[34:36], 'little') == 16
+    )
+
+
+def split_wav_at_pauses(wav_bytes: bytes, max_chunk_seconds: float) -> List[bytes]:
+    """
+    Split mono 16-bit PCM WAV into chunks no longer than max_chunk_seconds
+    
+    Each cut is placed in the quietest PAUSE_WINDOW_MS window within the
+    PAUSE_SEARCH_SECONDS before the chunk limit, so words are rarely split.
+    
+    Args:
+        wav_bytes: Mono 16-bit PCM WAV bytes
+        max_chunk_seconds: Maximum chunk duration in seconds
+        
+    Returns:
+        List of WAV chunks; the original bytes as the only element when the
+        audio is short enough or not mono 16-bit
+    """
+    with wave.open(io.BytesIO(wav_bytes), 'rb') as wav:
+        channels, sample_width, rate = wav.getnchannels(), wav.getsampwidth(), wav.getframerate()
+        frames = wav.readframes(wav.getnframes())
+    
+    max_len = int(max_chunk_seconds * rate)
+    samples = np.frombuffer(frames, dtype='<i2') if (channels, sample_width) == (1, 2) else None
+    if samples is None or len(samples) <= max_len:
+        return [wav_bytes]
+    
+    # Mean energy per window, computed once for the whole signal
+    window = max(1, rate * PAUSE_WINDOW_MS // 1000)
+    n_windows = len(samples) // window
+    energy = np.square(samples[:n_windows * window].astype(np.float32)).reshape(n_windows, window).mean(axis=1)
+    search_windows = max(1, int(PAUSE_SEARCH_SECONDS * rate) // window)
+    
+    bounds = []
+    start = 0
+    while len(samples) - start > max_len:
+        limit_window = (start + max_len) // window
+        first_window = max(start // window + 1, limit_window - search_windows)
+        if first_window < limit_window:
+            quietest = first_window + int(np.argmin(energy[first_window:limit_window]))
+            cut = quietest * window + window // 2
+        else:
+            cut = start + max_len
+        bounds.append((start, cut))
+        start = cut
+    bounds.append((start, len(samples)))
+    
+    chunks = []
+    for begin, end in bounds:
+        out = io.BytesIO()
+        with wave.open(out, 'wb') as chunk_wav:
+            chunk_wav.setnchannels(1)
+            chunk_wav.setsampwidth(2)
+            chunk_wav.setframerate(rate)
+            chunk_wav.writeframes(samples[begin:end].tobytes())
+        chunks.append(out.getvalue())
+    return chunks
+
 
 class ClarifaiTranscriber:
     """Handler for Clarifai audio transcription"""
@@ -50,6 +229,54 @@ class ClarifaiTranscriber:
         
         # Use models from config
         self.models = config.AVAILABLE_MODELS
+        # Selectbox options and name -> position lookup, built once instead of per rerun
+        self.model_names = tuple(self.models)
+        self.model_index = {name: i for i, name in enumerate(self.model_names)}
+        
+        # Bounded pool for concurrent model requests; the apps share one client per PAT
+        # across sessions, so this caps in-flight chunk requests for all users together
+        self._request_pool = ThreadPoolExecutor(
+            max_workers=max(1, config.LONG_AUDIO_MAX_WORKERS),
+            thread_name_prefix="audio-rpc"
+        )
+        
+        # Open request groups for transcribe_wav_grouped, per (model, temperature, max_tokens),
+        # and the number of reserved calls that have not arrived yet
+        self._group_lock = threading.Condition()
+        self._open_groups = {}
+        self._expected_calls = 0
+    
+    @property
+    def supports_batch_api(self) -> bool:
+        """Whether concurrent transcribe_wav_grouped calls are sent as multi-input requests"""
+        return config.BATCH_API_MAX_INPUTS > 1
+    
+    def reserve_grouped_call(self) -> Dict[str, bool]:
+        """
+        Announce a transcribe_wav_grouped call that will follow shortly (e.g. a batch file still converting)
+        
+        Open groups keep waiting while reserved calls are outstanding, and are sent as
+        soon as none are. Every ticket must reach transcribe_wav_grouped or
+        release_grouped_call.
+        
+        Returns:
+            Ticket to pass to transcribe_wav_grouped and release_grouped_call
+        """
+        with self._group_lock:
+            self._expected_calls += 1
+        return {"used": False}
+    
+    def release_grouped_call(self, ticket: Optional[Dict[str, bool]]):
+        """Withdraw a reservation that did not reach transcribe_wav_grouped (no-op otherwise)"""
+        with self._group_lock:
+            self._use_ticket(ticket)
+    
+    def _use_ticket(self, ticket: Optional[Dict[str, bool]]):
+        # Called with _group_lock held
+        if ticket is not None and not ticket["used"]:
+            ticket["used"] = True
+            self._expected_calls -= 1
+            self._group_lock.notify_all()
     
     def analyze_audio_quality(self, audio_bytes: bytes) -> Dict[str, Any]:
         """
@@ -197,6 +424,13 @@ class ClarifaiTranscriber:
         if trim_silence is None:
             trim_silence = config.TRIM_SILENCE
         
+        # A speech-ready WAV with no enhancements selected would come back unchanged;
+        # skip the ffmpeg decode and re-encode round-trip
+        enhancements = gain_db != 0.0 or (high_quality and (normalize_audio or trim_silence or noise_reduce))
+        if target_format.lower() == "wav" and not enhancements and is_speech_ready_wav(audio_bytes, target_sample_rate):
+            print(f"✅ Audio is already {target_sample_rate}Hz mono 16-bit WAV, skipping conversion")
+            return audio_bytes
+        
         try:
             # Create audio segment from bytes
             audio_io = io.BytesIO(audio_bytes)
@@ -325,8 +559,16 @@ class ClarifaiTranscriber:
             # Try to detect format and load audio
             # pydub can auto-detect most common formats
             try:
-                # Try common formats
-                audio_segment = AudioSegment.from_file(audio_io)
+                # PCM WAV (e.g. ffmpeg-extracted video audio) is parsed natively by
+                # pydub; anything else is decoded through an ffmpeg subprocess
+                if is_pcm_wav(audio_bytes):
+                    try:
+                        audio_segment = AudioSegment.from_file(audio_io, format="wav")
+                    except Exception:
+                        audio_io.seek(0)
+                        audio_segment = AudioSegment.from_file(audio_io)
+                else:
+                    audio_segment = AudioSegment.from_file(audio_io)
                 print(f"🎵 Original audio: {len(audio_segment)}ms, {audio_segment.frame_rate}Hz, {audio_segment.channels}ch, {audio_segment.sample_width * 8}bit")
             except Exception as e:
                 # If auto-detection fails, try specific formats
@@ -388,15 +630,19 @@ class ClarifaiTranscriber:
             # Convert to high-quality WAV format
             wav_io = io.BytesIO()
             
-            # Export with optimal parameters for speech recognition
-            export_params = [
-                "-ac", "1",  # Force mono
-                "-ar", str(target_sample_rate),  # Use specified sample rate
-                "-sample_fmt", "s16",  # 16-bit signed integer
-                "-acodec", "pcm_s16le"  # PCM 16-bit little-endian
-            ]
-            
-            audio_segment.export(wav_io, format="wav", parameters=export_params)
+            if (audio_segment.channels, audio_segment.frame_rate, audio_segment.sample_width) == (1, target_sample_rate, 2):
+                # Already mono 16-bit at the target rate: pydub writes the WAV itself
+                audio_segment.export(wav_io, format="wav")
+            else:
+                # Export with optimal parameters for speech recognition
+                export_params = [
+                    "-ac", "1",  # Force mono
+                    "-ar", str(target_sample_rate),  # Use specified sample rate
+                    "-sample_fmt", "s16",  # 16-bit signed integer
+                    "-acodec", "pcm_s16le"  # PCM 16-bit little-endian
+                ]
+                
+                audio_segment.export(wav_io, format="wav", parameters=export_params)
             
             wav_bytes = wav_io.getvalue()
             
@@ -455,26 +701,34 @@ class ClarifaiTranscriber:
         """
         return self.models.get(model_name, {})
     
-    def validate_audio_data(self, audio_bytes: Any) -> bytes:
+    def validate_audio_data(self, audio_bytes: Any, convert: bool = True) -> bytes:
         """
         Validate and convert audio data to bytes, converting to WAV format for better compatibility
         
         Args:
-            audio_bytes: Audio data to validate
+            audio_bytes: Audio data to validate (bytes, or a bytes-like buffer
+                such as a memoryview over an mmap'd file)
+            convert: Convert to WAV with the config defaults (False only validates)
             
         Returns:
-            Validated audio data as bytes in WAV format
+            Validated audio data as bytes, in WAV format when convert is True
             
         Raises:
             TypeError: If data type is invalid
             ValueError: If data is empty
         """
-        if not isinstance(audio_bytes, bytes):
+        if isinstance(audio_bytes, (bytearray, memoryview, mmap.mmap)):
+            # Protobuf bytes fields and pydub both need real bytes; this is the one copy
+            audio_bytes = bytes(audio_bytes)
+        elif not isinstance(audio_bytes, bytes):
             raise TypeError(f"Expected bytes, got {type(audio_bytes).__name__}")
         
         if len(audio_bytes) == 0:
             raise ValueError("Audio data is empty")
         
+        if not convert:
+            return audio_bytes
+        
         # Convert to WAV format for better model compatibility
         wav_bytes = self.convert_to_wav(audio_bytes)
         return wav_bytes
@@ -495,6 +749,29 @@ class ClarifaiTranscriber:
             temperature: Temperature parameter for inference
             max_tokens: Maximum tokens for output
             
+        Returns:
+            Configured Clarifai PostModelOutputsRequest object
+        """
+        return self.create_batch_transcription_request(
+            [audio_bytes], model_info, temperature, max_tokens
+        )
+    
+    def create_batch_transcription_request(
+        self,
+        audio_list: List[bytes],
+        model_info: Dict[str, str],
+        temperature: float = 0.01,
+        max_tokens: int = 1000
+    ):
+        """
+        Create a Clarifai transcription request carrying several audio inputs
+        
+        Args:
+            audio_list: Raw audio data for each input, in output order
+            model_info: Model configuration
+            temperature: Temperature parameter for inference
+            max_tokens: Maximum tokens for output
+            
         Returns:
             Configured Clarifai PostModelOutputsRequest object
         """
@@ -503,18 +780,18 @@ class ClarifaiTranscriber:
             app_id=model_info["app_id"]
         )
         
-        # Create audio object with raw bytes
-        audio_obj = resources_pb2.Audio(base64=audio_bytes)
-        
-        # Build the request structure
-        data_obj = resources_pb2.Data(audio=audio_obj)
-        input_obj = resources_pb2.Input(data=data_obj)
+        # Create audio objects with raw bytes - the proto field is named `base64`
+        # but typed as bytes, so no base64 encoding is applied client-side
+        input_objs = [
+            resources_pb2.Input(data=resources_pb2.Data(audio=resources_pb2.Audio(base64=audio_bytes)))
+            for audio_bytes in audio_list
+        ]
         
         # Build request parameters
         request_params = {
             "user_app_id": user_app_id,
             "model_id": model_info["model_id"],
-            "inputs": [input_obj]
+            "inputs": input_objs
         }
         
         # Add deployment_id if available for dedicated deployed models
@@ -541,31 +818,34 @@ class ClarifaiTranscriber:
         Returns:
             Extracted transcription text
         """
+        if not response.outputs:
+            return NO_TRANSCRIPTION_TEXT
+        return self._extract_output_text(response.outputs[0])
+    
+    def _extract_output_text(self, output) -> str:
+        """Transcription text of a single model output"""
         transcription = ""
         
-        if response.outputs:
-            output = response.outputs[0]
-            
-            # Try to get text from concepts first
-            if output.data.concepts:
-                for concept in output.data.concepts:
-                    transcription += concept.name + " "
-            
-            # If no concepts, try text data
-            if not transcription and output.data.text and output.data.text.raw:
-                transcription = output.data.text.raw
-            
-            # If still no transcription, check if response indicates model issues
-            if not transcription:
-                # Check if the model returned a successful status but no content
-                # This often indicates model deployment or compatibility issues
-                if hasattr(output.data, 'text') and output.data.text:
-                    if not output.data.text.raw:
-                        return "Model returned empty response - may not be deployed or compatible with audio format"
-                else:
-                    return "Model did not return text data - may not support this audio format"
+        # Try to get text from concepts first
+        if output.data.concepts:
+            for concept in output.data.concepts:
+                transcription += concept.name + " "
         
-        return transcription.strip() if transcription else "No transcription available"
+        # If no concepts, try text data
+        if not transcription and output.data.text and output.data.text.raw:
+            transcription = output.data.text.raw
+        
+        # If still no transcription, check if response indicates model issues
+        if not transcription:
+            # Check if the model returned a successful status but no content
+            # This often indicates model deployment or compatibility issues
+            if hasattr(output.data, 'text') and output.data.text:
+                if not output.data.text.raw:
+                    return EMPTY_RESPONSE_TEXT
+            else:
+                return NO_TEXT_DATA_TEXT
+        
+        return transcription.strip() if transcription else NO_TRANSCRIPTION_TEXT
     
     def transcribe_audio(
         self, 
@@ -640,6 +920,67 @@ class ClarifaiTranscriber:
             # Re-raise API errors to be handled by caller
             raise Exception(f"Transcription failed: {str(e)}")
     
+    def transcribe_audio_chunked(
+        self,
+        audio_bytes: bytes,
+        model_name: str,
+        temperature: float = 0.01,
+        max_tokens: int = 1000,
+        max_chunk_seconds: Optional[float] = None
+    ) -> Optional[str]:
+        """
+        Transcribe long audio as pause-aligned chunks sent to the model concurrently
+        
+        Short audio, non-WAV input, or a missing NumPy install fall through to
+        a single transcribe_audio call.
+        
+        Args:
+            audio_bytes: Raw audio data as bytes
+            model_name: Name of the model to use
+            temperature: Temperature parameter for inference (default: 0.01)
+            max_tokens: Maximum tokens for output per chunk (default: 1000)
+            max_chunk_seconds: Maximum chunk duration (uses config default if None)
+            
+        Returns:
+            Chunk transcriptions joined in order, or None if failed
+            
+        Raises:
+            ValueError: If model is unknown or audio data is invalid
+            TypeError: If audio_bytes is not bytes
+            Exception: For API errors
+        """
+        if max_chunk_seconds is None:
+            max_chunk_seconds = config.LONG_AUDIO_CHUNK_SECONDS
+        
+        chunks = split_wav_at_pauses(audio_bytes, max_chunk_seconds) if (
+            NUMPY_AVAILABLE and is_pcm_wav(audio_bytes)
+        ) else [audio_bytes]
+        if len(chunks) == 1:
+            return self.transcribe_audio(audio_bytes, model_name, temperature, max_tokens)
+        
+        # Fail once, before fanning out, rather than once per chunk
+        if model_name not in self.models:
+            raise ValueError(f"Unknown model: {model_name}")
+        
+        print(f"✂️ Split long audio into {len(chunks)} chunks of up to {max_chunk_seconds}s")
+        
+        def transcribe_chunk(chunk_bytes: bytes) -> str:
+            # Errors propagate: a failed chunk fails the whole transcription
+            text = self.transcribe_audio(chunk_bytes, model_name, temperature, max_tokens)
+            return text.strip() if text else ""
+        
+        # gRPC stubs are thread-safe, so the chunks share this client's channel and pool
+        texts = list(self._request_pool.map(transcribe_chunk, chunks))
+        
+        # Placeholders for chunks without speech are dropped rather than stitched into the text
+        spoken = [text for text in texts if text and text not in NO_TEXT_RESULTS]
+        if len(spoken) < len(texts):
+            print(f"⚠️ {len(texts) - len(spoken)} of {len(chunks)} chunks returned no text")
+        if not spoken:
+            # Nothing usable: surface the model's own message
+            return next((text for text in texts if text in NO_TEXT_RESULTS), NO_TRANSCRIPTION_TEXT)
+        return " ".join(spoken)
+    
     def transcribe_audio_with_quality(
         self,
         audio_bytes: bytes,
@@ -686,59 +1027,48 @@ class ClarifaiTranscriber:
             else:
                 print(f"🌐 Using shared compute for: {model_name}")
             
-            # Apply custom quality settings temporarily
-            original_hq = config.HIGH_QUALITY_CONVERSION
-            original_sample_rate = config.TARGET_SAMPLE_RATE
-            original_normalize = config.NORMALIZE_AUDIO
-            original_trim = config.TRIM_SILENCE
-            
-            # Override config with user settings
-            if high_quality_conversion is not None:
-                config.HIGH_QUALITY_CONVERSION = high_quality_conversion
-            if target_sample_rate is not None:
-                config.TARGET_SAMPLE_RATE = target_sample_rate
-            if normalize_audio is not None:
-                config.NORMALIZE_AUDIO = normalize_audio
-            if trim_silence is not None:
-                config.TRIM_SILENCE = trim_silence
+            # Settings are passed down explicitly rather than by changing the shared
+            # config, which other sessions and worker threads read concurrently
+            high_quality_conversion = config.HIGH_QUALITY_CONVERSION if high_quality_conversion is None else high_quality_conversion
+            target_sample_rate = config.TARGET_SAMPLE_RATE if target_sample_rate is None else target_sample_rate
+            normalize_audio = config.NORMALIZE_AUDIO if normalize_audio is None else normalize_audio
+            trim_silence = config.TRIM_SILENCE if trim_silence is None else trim_silence
             
-            try:
-                # Validate audio data with custom settings
-                validated_audio = self.validate_audio_data(audio_bytes)
-                
-                # Create the request with processed audio bytes
-                request = self.create_transcription_request(
-                    validated_audio, model_info, temperature, max_tokens
-                )
-                
-                # Add authentication
-                metadata = (('authorization', 'Key ' + self.api_key),)
-                
-                # Make the request
-                response = self.stub.PostModelOutputs(request, metadata=metadata)
-                
-                # Check response status
-                if response.status.code != status_code_pb2.SUCCESS:
-                    raise Exception(f"Clarifai API error: {response.status.description}")
-                
-                # Extract transcription text
-                transcription_result = self.extract_transcription_text(response)
-                
-                # Print the transcription result with quality info
-                quality_info = "Enhanced" if config.HIGH_QUALITY_CONVERSION else "Basic"
-                print(f"🎙️ Transcription Result from {model_name} ({quality_info} Quality):")
-                print(f"📝 Text: '{transcription_result}'")
-                print(f"📊 Length: {len(transcription_result)} characters")
-                print(f"🎛️ Settings: {config.TARGET_SAMPLE_RATE}Hz, Normalize: {config.NORMALIZE_AUDIO}, Trim: {config.TRIM_SILENCE}")
-                
-                return transcription_result
-                
-            finally:
-                # Restore original config settings
-                config.HIGH_QUALITY_CONVERSION = original_hq
-                config.TARGET_SAMPLE_RATE = original_sample_rate
-                config.NORMALIZE_AUDIO = original_normalize
-                config.TRIM_SILENCE = original_trim
+            # Validate and convert audio data with the requested settings
+            validated_audio = self.prepare_wav(
+                audio_bytes,
+                high_quality_conversion=high_quality_conversion,
+                target_sample_rate=target_sample_rate,
+                normalize_audio=normalize_audio,
+                trim_silence=trim_silence
+            )
+            
+            # Create the request with processed audio bytes
+            request = self.create_transcription_request(
+                validated_audio, model_info, temperature, max_tokens
+            )
+            
+            # Add authentication
+            metadata = (('authorization', 'Key ' + self.api_key),)
+            
+            # Make the request
+            response = self.stub.PostModelOutputs(request, metadata=metadata)
+            
+            # Check response status
+            if response.status.code != status_code_pb2.SUCCESS:
+                raise Exception(f"Clarifai API error: {response.status.description}")
+            
+            # Extract transcription text
+            transcription_result = self.extract_transcription_text(response)
+            
+            # Print the transcription result with quality info
+            quality_info = "Enhanced" if high_quality_conversion else "Basic"
+            print(f"🎙️ Transcription Result from {model_name} ({quality_info} Quality):")
+            print(f"📝 Text: '{transcription_result}'")
+            print(f"📊 Length: {len(transcription_result)} characters")
+            print(f"🎛️ Settings: {target_sample_rate}Hz, Normalize: {normalize_audio}, Trim: {trim_silence}")
+            
+            return transcription_result
             
         except (TypeError, ValueError) as e:
             # Re-raise validation errors to be handled by caller
@@ -747,6 +1077,202 @@ class ClarifaiTranscriber:
             # Re-raise API errors to be handled by caller
             raise Exception(f"Transcription failed: {str(e)}")
 
+    def prepare_wav(
+        self,
+        audio_bytes: bytes,
+        high_quality_conversion: bool = None,
+        target_sample_rate: int = None,
+        normalize_audio: bool = None,
+        trim_silence: bool = None
+    ) -> bytes:
+        """
+        Validate audio and convert it to the WAV sent to the API (the CPU-bound stage)
+        
+        Args:
+            audio_bytes: Raw audio data as bytes
+            high_quality_conversion: Enable high-quality conversion (uses config default if None)
+            target_sample_rate: Target sample rate in Hz (uses config default if None)
+            normalize_audio: Enable audio normalization (uses config default if None)
+            trim_silence: Enable silence trimming (uses config default if None)
+            
+        Returns:
+            Converted WAV bytes
+            
+        Raises:
+            TypeError: If audio_bytes is not bytes
+            ValueError: If audio data is empty
+        """
+        audio_bytes = self.validate_audio_data(audio_bytes, convert=False)
+        return self.convert_to_wav(
+            audio_bytes,
+            high_quality=high_quality_conversion,
+            target_sample_rate=target_sample_rate,
+            normalize_audio=normalize_audio,
+            trim_silence=trim_silence
+        )
+    
+    def transcribe_wav(
+        self,
+        wav_bytes: bytes,
+        model_name: str,
+        temperature: float = 0.01,
+        max_tokens: int = 1000
+    ) -> Optional[str]:
+        """
+        Send already prepared audio to the model without converting it again (the network-bound stage)
+        
+        Args:
+            wav_bytes: Audio from prepare_wav
+            model_name: Name of the model to use
+            temperature: Temperature parameter for inference (default: 0.01)
+            max_tokens: Maximum tokens for output (default: 1000)
+            
+        Returns:
+            Transcription text
+            
+        Raises:
+            ValueError: If model is unknown
+            Exception: For API errors
+        """
+        model_info = self.models.get(model_name)
+        if not model_info:
+            raise ValueError(f"Unknown model: {model_name}")
+        
+        request = self.create_transcription_request(
+            wav_bytes, model_info, temperature, max_tokens
+        )
+        
+        # Add authentication
+        metadata = (('authorization', 'Key ' + self.api_key),)
+        
+        # Make the request
+        response = self.stub.PostModelOutputs(request, metadata=metadata)
+        
+        # Check response status
+        if response.status.code != status_code_pb2.SUCCESS:
+            raise Exception(f"Clarifai API error: {response.status.description}")
+        
+        # Extract transcription text
+        transcription_result = self.extract_transcription_text(response)
+        
+        print(f"🎙️ Transcription Result from {model_name}:")
+        print(f"📝 Text: '{transcription_result}'")
+        print(f"📊 Length: {len(transcription_result)} characters")
+        
+        return transcription_result
+    
+    def transcribe_wav_grouped(
+        self,
+        wav_bytes: bytes,
+        model_name: str,
+        temperature: float = 0.01,
+        max_tokens: int = 1000,
+        ticket: Optional[Dict[str, bool]] = None
+    ) -> Optional[str]:
+        """
+        transcribe_wav for concurrent callers: calls arriving together are sent as one request
+        
+        The first caller opens a group and waits while calls reserved with
+        reserve_grouped_call are still outstanding, up to config.BATCH_API_WINDOW_MS,
+        then posts every input in a single PostModelOutputs request. A group is sent
+        early once it holds config.BATCH_API_MAX_INPUTS calls. Inputs whose output
+        failed, or the whole group if the request failed, are retried one by one.
+        
+        Args:
+            wav_bytes: Audio from prepare_wav
+            model_name: Name of the model to use
+            temperature: Temperature parameter for inference (default: 0.01)
+            max_tokens: Maximum tokens for output (default: 1000)
+            ticket: Reservation from reserve_grouped_call for this call, if any
+            
+        Returns:
+            Transcription text
+            
+        Raises:
+            ValueError: If model is unknown
+            Exception: For API errors
+        """
+        if not self.supports_batch_api:
+            self.release_grouped_call(ticket)
+            return self.transcribe_wav(wav_bytes, model_name, temperature, max_tokens)
+        
+        model_info = self.models.get(model_name)
+        if not model_info:
+            self.release_grouped_call(ticket)
+            raise ValueError(f"Unknown model: {model_name}")
+        
+        key = (model_name, temperature, max_tokens)
+        slot = {"wav": wav_bytes, "done": threading.Event()}
+        with self._group_lock:
+            self._use_ticket(ticket)
+            group = self._open_groups.get(key)
+            is_leader = group is None
+            if is_leader:
+                group = self._open_groups[key] = {"slots": []}
+            group["slots"].append(slot)
+            if len(group["slots"]) >= config.BATCH_API_MAX_INPUTS:
+                # Full: later callers start a new group
+                del self._open_groups[key]
+            self._group_lock.notify_all()
+            
+            if is_leader:
+                # Wait only while more callers are on their way and the group is still open
+                deadline = time.monotonic() + config.BATCH_API_WINDOW_MS / 1000
+                while self._open_groups.get(key) is group and self._expected_calls > 0:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._group_lock.wait(remaining)
+                if self._open_groups.get(key) is group:
+                    del self._open_groups[key]
+        
+        if not is_leader:
+            slot["done"].wait()
+        else:
+            slots = group["slots"]
+            try:
+                if len(slots) == 1:
+                    slot["retry"] = True
+                else:
+                    self._post_group(slots, model_name, model_info, temperature, max_tokens)
+            finally:
+                for s in slots:
+                    s["done"].set()
+        
+        if slot.get("retry"):
+            # Sent on its own, from this caller's thread so retries still run in parallel
+            return self.transcribe_wav(wav_bytes, model_name, temperature, max_tokens)
+        return slot["text"]
+    
+    def _post_group(self, slots: List[Dict[str, Any]], model_name: str, model_info: Dict[str, str],
+                    temperature: float, max_tokens: int):
+        """Send a group of inputs in one request, marking each slot with its text or for a retry"""
+        try:
+            request = self.create_batch_transcription_request(
+                [s["wav"] for s in slots], model_info, temperature, max_tokens
+            )
+            metadata = (('authorization', 'Key ' + self.api_key),)
+            response = self.stub.PostModelOutputs(request, metadata=metadata)
+            
+            # MIXED_STATUS: some inputs failed, each output carries its own status
+            if response.status.code not in (status_code_pb2.SUCCESS, status_code_pb2.MIXED_STATUS):
+                raise Exception(f"Clarifai API error: {response.status.description}")
+            if len(response.outputs) != len(slots):
+                raise Exception(f"Clarifai API returned {len(response.outputs)} outputs for {len(slots)} inputs")
+        except Exception as e:
+            print(f"⚠️ Grouped request of {len(slots)} inputs failed, retrying individually: {e}")
+            for s in slots:
+                s["retry"] = True
+            return
+        
+        # Outputs come back in input order
+        for s, output in zip(slots, response.outputs):
+            if output.status.code and output.status.code != status_code_pb2.SUCCESS:
+                s["retry"] = True
+            else:
+                s["text"] = self._extract_output_text(output)
+        print(f"📦 Sent {len(slots)} inputs to {model_name} in one request")
+    
     def transcribe_audio_with_wav(
         self,
         audio_bytes: bytes,
@@ -785,62 +1311,20 @@ class ClarifaiTranscriber:
             if not model_info:
                 raise ValueError(f"Unknown model: {model_name}")
             
-            # Apply custom quality settings temporarily
-            original_hq = config.HIGH_QUALITY_CONVERSION
-            original_sample_rate = config.TARGET_SAMPLE_RATE
-            original_normalize = config.NORMALIZE_AUDIO
-            original_trim = config.TRIM_SILENCE
-            
-            # Override config with user settings
-            if high_quality_conversion is not None:
-                config.HIGH_QUALITY_CONVERSION = high_quality_conversion
-            if target_sample_rate is not None:
-                config.TARGET_SAMPLE_RATE = target_sample_rate
-            if normalize_audio is not None:
-                config.NORMALIZE_AUDIO = normalize_audio
-            if trim_silence is not None:
-                config.TRIM_SILENCE = trim_silence
+            # Validate and convert to WAV with the caller's settings in one pass; the
+            # same bytes are sent to the API and returned for playback. Settings are
+            # passed down rather than written into the shared config, so concurrent
+            # calls (batch mode) never see each other's values.
+            converted_wav = self.prepare_wav(
+                audio_bytes,
+                high_quality_conversion=high_quality_conversion,
+                target_sample_rate=target_sample_rate,
+                normalize_audio=normalize_audio,
+                trim_silence=trim_silence
+            )
             
-            try:
-                # Convert to WAV with custom settings
-                converted_wav = self.convert_to_wav(audio_bytes)
-                
-                # Validate audio data (which also converts if needed)
-                validated_audio = self.validate_audio_data(audio_bytes)
-                
-                # Create the request with processed audio bytes
-                request = self.create_transcription_request(
-                    validated_audio, model_info, temperature, max_tokens
-                )
-                
-                # Add authentication
-                metadata = (('authorization', 'Key ' + self.api_key),)
-                
-                # Make the request
-                response = self.stub.PostModelOutputs(request, metadata=metadata)
-                
-                # Check response status
-                if response.status.code != status_code_pb2.SUCCESS:
-                    raise Exception(f"Clarifai API error: {response.status.description}")
-                
-                # Extract transcription text
-                transcription_result = self.extract_transcription_text(response)
-                
-                # Print the transcription result with quality info
-                quality_info = "Enhanced" if config.HIGH_QUALITY_CONVERSION else "Basic"
-                print(f"🎙️ Transcription Result from {model_name} ({quality_info} Quality):")
-                print(f"📝 Text: '{transcription_result}'")
-                print(f"📊 Length: {len(transcription_result)} characters")
-                print(f"🎛️ Settings: {config.TARGET_SAMPLE_RATE}Hz, Normalize: {config.NORMALIZE_AUDIO}, Trim: {config.TRIM_SILENCE}")
-                
-                return transcription_result, converted_wav
-                
-            finally:
-                # Restore original config settings
-                config.HIGH_QUALITY_CONVERSION = original_hq
-                config.TARGET_SAMPLE_RATE = original_sample_rate
-                config.NORMALIZE_AUDIO = original_normalize
-                config.TRIM_SILENCE = original_trim
+            transcription_result = self.transcribe_wav(converted_wav, model_name, temperature, max_tokens)
+            return transcription_result, converted_wav
             
         except (TypeError, ValueError) as e:
             # Re-raise validation errors to be handled by caller
@@ -861,7 +1345,8 @@ class ClarifaiTranscriber:
         normalize_audio: bool = None,
         trim_silence: bool = None,
         noise_reduce: bool = False,
-        gain_db: float = 0.0
+        gain_db: float = 0.0,
+        precomputed_analysis: Optional[Dict[str, Any]] = None
     ) -> tuple[Optional[str], Optional[bytes], Optional[Dict[str, Any]]]:
         """
         Advanced transcription with format control and audio analysis
@@ -878,14 +1363,19 @@ class ClarifaiTranscriber:
             trim_silence: Enable silence trimming
             noise_reduce: Enable basic noise reduction
             gain_db: Audio gain adjustment in dB
+            precomputed_analysis: analyze_audio_quality result for these same bytes,
+                skips decoding the audio a second time
             
         Returns:
             Tuple of (transcription_text, processed_audio_bytes, audio_analysis)
         """
         try:
-            # First, analyze the original audio
-            print("🔍 Analyzing original audio quality...")
-            audio_analysis = self.analyze_audio_quality(audio_bytes)
+            # First, analyze the original audio (unless the caller already did)
+            if precomputed_analysis is not None:
+                audio_analysis = precomputed_analysis
+            else:
+                print("🔍 Analyzing original audio quality...")
+                audio_analysis = self.analyze_audio_quality(audio_bytes)
             
             # Validate model
             model_info = config.get_model_info(model_name)
@@ -980,6 +1470,9 @@ class ClarifaiOpenAIStreamer:
         
         # Use models from config
         self.models = config.AVAILABLE_MODELS
+        
+        # Chunk fingerprint -> transcribed text, bounded LRU
+        self._chunk_cache = OrderedDict()
     
     def get_streaming_model_url(self, model_name: str) -> str:
         """
@@ -1015,7 +1508,8 @@ class ClarifaiOpenAIStreamer:
         audio_bytes: bytes, 
         chunk_duration_ms: int = 5000,
         high_quality_conversion: bool = False,
-        target_sample_rate: int = 16000
+        target_sample_rate: int = 16000,
+        wire_format: Optional[str] = None
     ) -> Iterator[bytes]:
         """
         Split audio into chunks for streaming processing with optional preprocessing
@@ -1025,10 +1519,17 @@ class ClarifaiOpenAIStreamer:
             chunk_duration_ms: Duration of each chunk in milliseconds
             high_quality_conversion: Apply audio enhancement before chunking
             target_sample_rate: Target sample rate for processing
+            wire_format: WAV encoding for chunks ("pcm16", "mulaw", "pcm8").
+                Uses config.STREAMING_WIRE_FORMAT if None
             
         Yields:
             Audio chunk as bytes (preprocessed if high_quality_conversion=True)
+            
+        Raises:
+            ValueError: If wire_format is not supported
         """
+        codec = get_wire_format_codec(wire_format)
+        
         if not AUDIO_CONVERSION_AVAILABLE:
             # If pydub not available, yield entire audio as single chunk
             yield audio_bytes
@@ -1058,24 +1559,102 @@ class ClarifaiOpenAIStreamer:
             if total_duration <= chunk_duration_ms:
                 # Audio is smaller than chunk size, return as single chunk
                 chunk_io = io.BytesIO()
-                audio_segment.export(chunk_io, format="wav")
+                audio_segment.export(chunk_io, format="wav", codec=codec)
                 yield chunk_io.getvalue()
                 return
             
             # Split into chunks and yield immediately (memory efficient)
+            # A single export buffer is reused across chunks; getvalue() copies
+            # the contents out so yielded bytes are unaffected by truncation
+            chunk_io = io.BytesIO()
             for start in range(0, total_duration, chunk_duration_ms):
                 end = min(start + chunk_duration_ms, total_duration)
                 chunk = audio_segment[start:end]
-                
+
                 # Export chunk to bytes and yield immediately
-                chunk_io = io.BytesIO()
-                chunk.export(chunk_io, format="wav")
+                chunk_io.seek(0)
+                chunk_io.truncate(0)
+                chunk.export(chunk_io, format="wav", codec=codec)
                 yield chunk_io.getvalue()
                 
         except Exception as e:
             print(f"⚠️ Audio chunking failed: {e}. Using full audio.")
             yield audio_bytes
     
+    def _get_chunk_cache_key(self, chunk_bytes: bytes, model_name: str) -> bytes:
+        """
+        Fingerprint an audio chunk for the per-streamer transcription cache
+        
+        Args:
+            chunk_bytes: Encoded audio chunk
+            model_name: Model the chunk is transcribed with
+            
+        Returns:
+            16-byte BLAKE2b digest of the model name and chunk bytes
+        """
+        digest = hashlib.blake2b(model_name.encode("utf-8"), digest_size=16)
+        digest.update(chunk_bytes)
+        return digest.digest()
+    
+    def _transcribe_chunk(self, chunk_bytes: bytes, model_name: str) -> str:
+        """
+        Transcribe a single audio chunk with the Clarifai gRPC API
+        
+        Args:
+            chunk_bytes: Encoded audio chunk
+            model_name: Name of the model to use
+            
+        Returns:
+            Transcribed chunk text (may be empty)
+            
+        Raises:
+            ValueError: If model is unknown
+            Exception: For API errors
+        """
+        # Get model info for gRPC API
+        model_info = config.get_model_info(model_name)
+        if not model_info:
+            raise ValueError(f"Model {model_name} not found in config")
+        
+        # Create the gRPC request for this chunk
+        user_app_id = resources_pb2.UserAppIDSet(
+            user_id=model_info["user_id"],
+            app_id=model_info["app_id"]
+        )
+        
+        # Create audio object with chunk bytes
+        audio_obj = resources_pb2.Audio(base64=chunk_bytes)
+        data_obj = resources_pb2.Data(audio=audio_obj)
+        input_obj = resources_pb2.Input(data=data_obj)
+        
+        # Create model object
+        model_obj = resources_pb2.Model(
+            id=model_info["model_id"],
+            model_version=resources_pb2.ModelVersion(id="")
+        )
+        
+        # Build request
+        request = service_pb2.PostModelOutputsRequest(
+            user_app_id=user_app_id,
+            model_id=model_info["model_id"],
+            inputs=[input_obj],
+            model=model_obj
+        )
+        
+        # Make API call
+        metadata = (('authorization', 'Key ' + self.api_key),)
+        response = self.stub.PostModelOutputs(request, metadata=metadata)
+        
+        # Extract text from response
+        if response.status.code != status_code_pb2.SUCCESS:
+            raise Exception(f"Clarifai API error: {response.status.description}")
+        
+        if response.outputs and len(response.outputs) > 0:
+            output = response.outputs[0]
+            if hasattr(output.data, 'text') and output.data.text:
+                return output.data.text.raw.strip()
+        return ""
+    
     def transcribe_streaming(
         self,
         audio_bytes: bytes,
@@ -1085,7 +1664,8 @@ class ClarifaiOpenAIStreamer:
         language: Optional[str] = None,
         enable_audio_analysis: bool = False,
         high_quality_conversion: bool = False,
-        target_sample_rate: int = 16000
+        target_sample_rate: int = 16000,
+        wire_format: Optional[str] = None
     ) -> Generator[Dict[str, Any], None, None]:
         """
         Transcribe audio with streaming output
@@ -1099,6 +1679,8 @@ class ClarifaiOpenAIStreamer:
             enable_audio_analysis: Analyze audio quality for each chunk
             high_quality_conversion: Apply audio enhancement to chunks
             target_sample_rate: Target sample rate for processing
+            wire_format: WAV encoding for chunks ("pcm16", "mulaw", "pcm8").
+                Uses config.STREAMING_WIRE_FORMAT if None
             
         Yields:
             Dictionary with streaming results: {
@@ -1107,6 +1689,7 @@ class ClarifaiOpenAIStreamer:
                 "is_final": bool,
                 "timestamp": float,
                 "chunk_duration": float,
+                "from_cache": bool,
                 "audio_analysis": dict (if enabled)
             }
         """
@@ -1124,7 +1707,8 @@ class ClarifaiOpenAIStreamer:
                 audio_bytes, 
                 chunk_duration_ms,
                 high_quality_conversion=high_quality_conversion,
-                target_sample_rate=target_sample_rate
+                target_sample_rate=target_sample_rate,
+                wire_format=wire_format
             ):
                 start_time = time.time()
                 chunk_analysis = None
@@ -1147,52 +1731,22 @@ class ClarifaiOpenAIStreamer:
                         chunk_analysis = None
                 
                 try:
-                    # Use Clarifai gRPC API directly for streaming (OpenAI audio endpoint not available)
-                    print(f"🔍 Processing chunk {chunk_index} with Clarifai gRPC API")
-                    
-                    # Get model info for gRPC API
-                    model_info = config.get_model_info(model_name)
-                    if not model_info:
-                        raise ValueError(f"Model {model_name} not found in config")
-                    
-                    # Create the gRPC request for this chunk
-                    user_app_id = resources_pb2.UserAppIDSet(
-                        user_id=model_info["user_id"],
-                        app_id=model_info["app_id"]
-                    )
+                    # Byte-identical chunks (silence, repeated tones) reuse earlier text
+                    cache_key = self._get_chunk_cache_key(chunk_bytes, model_name)
+                    chunk_text = self._chunk_cache.get(cache_key)
+                    from_cache = chunk_text is not None
                     
-                    # Create audio object with chunk bytes
-                    audio_obj = resources_pb2.Audio(base64=chunk_bytes)
-                    data_obj = resources_pb2.Data(audio=audio_obj)
-                    input_obj = resources_pb2.Input(data=data_obj)
-                    
-                    # Create model object
-                    model_obj = resources_pb2.Model(
-                        id=model_info["model_id"],
-                        model_version=resources_pb2.ModelVersion(id="")
-                    )
-                    
-                    # Build request
-                    request = service_pb2.PostModelOutputsRequest(
-                        user_app_id=user_app_id,
-                        model_id=model_info["model_id"],
-                        inputs=[input_obj],
-                        model=model_obj
-                    )
-                    
-                    # Make API call
-                    metadata = (('authorization', 'Key ' + self.api_key),)
-                    response = self.stub.PostModelOutputs(request, metadata=metadata)
-                    
-                    # Extract text from response
-                    chunk_text = ""
-                    if response.status.code == status_code_pb2.SUCCESS:
-                        if response.outputs and len(response.outputs) > 0:
-                            output = response.outputs[0]
-                            if hasattr(output.data, 'text') and output.data.text:
-                                chunk_text = output.data.text.raw.strip()
+                    if from_cache:
+                        self._chunk_cache.move_to_end(cache_key)
+                        print(f"♻️ Chunk {chunk_index} matches a previous chunk - reusing cached text")
                     else:
-                        raise Exception(f"Clarifai API error: {response.status.description}")
+                        # Use Clarifai gRPC API directly for streaming (OpenAI audio endpoint not available)
+                        print(f"🔍 Processing chunk {chunk_index} with Clarifai gRPC API")
+                        chunk_text = self._transcribe_chunk(chunk_bytes, model_name)
+                        
+                        self._chunk_cache[cache_key] = chunk_text
+                        if len(self._chunk_cache) > CHUNK_CACHE_MAX_ENTRIES:
+                            self._chunk_cache.popitem(last=False)
                     
                     processing_time = time.time() - start_time
                     
@@ -1206,7 +1760,8 @@ class ClarifaiOpenAIStreamer:
                         "is_final": False,
                         "timestamp": time.time(),
                         "processing_time": processing_time,
-                        "chunk_duration": chunk_duration_ms / 1000.0
+                        "chunk_duration": chunk_duration_ms / 1000.0,
+                        "from_cache": from_cache
                     }
                     
                     # Add audio analysis if available
@@ -1266,7 +1821,8 @@ class ClarifaiOpenAIStreamer:
         language: Optional[str] = None,
         enable_audio_analysis: bool = False,
         high_quality_conversion: bool = False,
-        target_sample_rate: int = 16000
+        target_sample_rate: int = 16000,
+        wire_format: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Real-time streaming transcription with progress updates
@@ -1291,7 +1847,8 @@ class ClarifaiOpenAIStreamer:
                 language=language,
                 enable_audio_analysis=enable_audio_analysis,
                 high_quality_conversion=high_quality_conversion,
-                target_sample_rate=target_sample_rate
+                target_sample_rate=target_sample_rate,
+                wire_format=wire_format
             ):
                 results.append(result)
                 
@@ -3,11 +3,19 @@ ClarifaiVideoUtil.py - Utility module for Clarifai video transcription functiona
 Contains all Clarifai-specific API calls and video processing for multimodal models
 """
 
-import base64
+import asyncio
+import hashlib
 import io
+import json
 import os
+import shutil
+import sqlite3
+import subprocess
+import threading
 import time
-from typing import Optional, Dict, Any, List, Tuple, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple, Union
 from config import config
 
 # New Clarifai SDK imports
@@ -23,7 +31,7 @@ except ImportError:
 
 # Fallback to old gRPC imports if new SDK not available
 try:
-    from clarifai_grpc.channel.clarifai_channel import ClarifaiChannel
+    import grpc
     from clarifai_grpc.grpc.api import resources_pb2, service_pb2, service_pb2_grpc
     from clarifai_grpc.grpc.api.status import status_code_pb2
     GRPC_SDK_AVAILABLE = True
@@ -44,6 +52,69 @@ except ImportError:
     # Fallback type when numpy not available
     NDArray = Any
 
+# Numba JIT for the frame downscaler - cv2.resize is the fallback
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = VIDEO_PROCESSING_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
+    prange = range
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _resize_bilinear(src, out):
+        """Bilinear resize of a uint8 HxWx3 frame into out, rows distributed across cores"""
+        src_h = src.shape[0]
+        src_w = src.shape[1]
+        dst_h = out.shape[0]
+        dst_w = out.shape[1]
+        y_ratio = (src_h - 1) / max(dst_h - 1, 1)
+        x_ratio = (src_w - 1) / max(dst_w - 1, 1)
+        for y in prange(dst_h):
+            sy = y * y_ratio
+            y0 = int(sy)
+            y1 = min(y0 + 1, src_h - 1)
+            wy = sy - y0
+            for x in range(dst_w):
+                sx = x * x_ratio
+                x0 = int(sx)
+                x1 = min(x0 + 1, src_w - 1)
+                wx = sx - x0
+                for c in range(3):
+                    top = src[y0, x0, c] * (1.0 - wx) + src[y0, x1, c] * wx
+                    bottom = src[y1, x0, c] * (1.0 - wx) + src[y1, x1, c] * wx
+                    out[y, x, c] = np.uint8(top * (1.0 - wy) + bottom * wy + 0.5)
+        return out
+
+    # Pay the JIT compile cost at import rather than on the first video
+    try:
+        _resize_bilinear(np.zeros((2, 2, 3), np.uint8), np.empty((2, 2, 3), np.uint8))
+    except Exception:
+        NUMBA_AVAILABLE = False
+
+# PyAV (libav bindings) for seek-based frame decoding - OpenCV loop is the fallback
+try:
+    import av
+    PYAV_AVAILABLE = True
+    # Hardware decoding (CUDA, VAAPI, ...) needs PyAV 14+
+    try:
+        from av.codec.hwaccel import HWAccel
+    except ImportError:
+        HWAccel = None
+except ImportError:
+    PYAV_AVAILABLE = False
+    av = None
+    HWAccel = None
+
+# libjpeg-turbo bindings for frame encoding - cv2.imencode is the fallback
+try:
+    from turbojpeg import TurboJPEG, TJSAMP_420, TJFLAG_FASTDCT
+    TURBOJPEG_AVAILABLE = True
+except ImportError:
+    TURBOJPEG_AVAILABLE = False
+    TurboJPEG = None
+
 # Audio extraction from video - Using FFmpeg for better reliability
 try:
     from ffmpeg_audio_extractor import FFmpegAudioExtractor
@@ -52,6 +123,9 @@ except ImportError:
     FFMPEG_AVAILABLE = False
     FFmpegAudioExtractor = None
 
+# ffmpeg binary for direct subprocess extraction when ffmpeg-python is missing
+FFMPEG_BINARY = shutil.which("ffmpeg")
+
 # Keep MoviePy as fallback (but prioritize FFmpeg)
 try:
     from moviepy import VideoFileClip
@@ -61,10 +135,168 @@ except ImportError:
     VideoFileClip = None
 
 
-def debug_print(message: str, force: bool = False):
-    """Print debug message if debug mode is enabled"""
-    if force or config.DEBUG_VIDEO_PROCESSING:
+# Debug flag bound once at import. Call sites whose message is expensive to
+# build (e.g. dir(result)) are guarded with "if _DEBUG:" so the f-string is
+# never evaluated on the normal path.
+_DEBUG = config.DEBUG_VIDEO_PROCESSING
+
+if _DEBUG:
+    def debug_print(message: str, force: bool = False):
+        """Print debug message (debug mode is enabled)"""
         print(message)
+else:
+    def debug_print(message: str, force: bool = False):
+        """Print message only when forced (debug mode is disabled)"""
+        if force:
+            print(message)
+
+
+# JPEG settings for frames sent to the API
+JPEG_QUALITY = 80
+JPEG_ENCODE_PARAMS = [
+    cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY,
+    cv2.IMWRITE_JPEG_OPTIMIZE, 1,
+    cv2.IMWRITE_JPEG_PROGRESSIVE, 0
+] if VIDEO_PROCESSING_AVAILABLE else []
+
+# Options for the long-lived gRPC channel: keepalive pings keep the HTTP/2
+# connection open between videos, and the message caps are raised above the
+# 4 MB default for frame-heavy requests and responses
+GRPC_CHANNEL_OPTIONS = [
+    ('grpc.keepalive_time_ms', 30000),
+    ('grpc.keepalive_timeout_ms', 10000),
+    ('grpc.keepalive_permit_without_calls', 1),
+    ('grpc.http2.max_pings_without_data', 0),
+    ('grpc.max_send_message_length', 64 * 1024 * 1024),
+    ('grpc.max_receive_message_length', 64 * 1024 * 1024),
+]
+
+# Transcription results kept in memory per transcriber (oldest evicted first)
+RESULT_CACHE_MAX_ENTRIES = 64
+# Bytes hashed from each end of the video for the result cache key
+RESULT_CACHE_SAMPLE_BYTES = 1024 * 1024
+# Key frames hashed for the persistent perceptual-hash result cache
+PHASH_CACHE_FRAMES = 8
+# Audio loudness envelope in the perceptual-hash cache key: window length and dB step
+PHASH_AUDIO_WINDOW_SECONDS = 0.5
+PHASH_AUDIO_DB_STEP = 6
+
+# Extracted frames are downscaled to fit within this size
+MAX_FRAME_WIDTH = 1280
+MAX_FRAME_HEIGHT = 720
+
+# Frames whose 64-bit average hashes differ in fewer bits are near-duplicates
+FRAME_DEDUP_HAMMING_THRESHOLD = 5
+
+# Auto-generated prompts for transcribe_video_with_audio
+PROMPT_WITH_AUDIO = """Please analyze this video and provide a comprehensive transcription. 
+
+Audio transcription (already extracted): "{audio}"
+
+Please:
+1. Describe what is happening visually in the video
+2. Identify any text, signs, or written content visible in the frames
+3. Correlate the visual content with the audio transcription provided
+4. Provide timestamps or sequence information if possible
+5. Note any important visual context that complements the audio
+
+Provide a detailed, structured response combining both visual and audio information."""
+
+PROMPT_VISUAL_ONLY = """Please analyze this video and provide a comprehensive transcription including:
+1. Any speech or dialogue you can detect
+2. Visual text, signs, or written content
+3. Description of key visual events and actions
+4. Context and setting information
+5. Any other relevant audio-visual information
+
+Provide a detailed, structured transcription."""
+
+
+def get_scaled_frame_size(width: int, height: int) -> Tuple[int, int]:
+    """
+    Compute the frame size used for API transmission, preserving aspect ratio
+    
+    Args:
+        width: Source frame width
+        height: Source frame height
+        
+    Returns:
+        Tuple of (width, height), unchanged if already within the size limit
+    """
+    if width > MAX_FRAME_WIDTH or height > MAX_FRAME_HEIGHT:
+        scale = min(MAX_FRAME_WIDTH / width, MAX_FRAME_HEIGHT / height)
+        return int(width * scale), int(height * scale)
+    return width, height
+
+
+def resize_frame(frame: Any, width: int, height: int, dst: Any = None) -> Any:
+    """
+    Resize a BGR frame, using the Numba kernel when available
+    
+    Args:
+        frame: OpenCV frame array (uint8, HxWx3)
+        width: Target width
+        height: Target height
+        dst: Optional preallocated (height, width, 3) uint8 output buffer
+        
+    Returns:
+        Resized frame array (dst when given)
+    """
+    if dst is None:
+        dst = np.empty((height, width, 3), np.uint8)
+    if NUMBA_AVAILABLE:
+        return _resize_bilinear(frame, dst)
+    return cv2.resize(frame, (width, height), dst=dst)
+
+
+def compute_frame_hash(frame: Any) -> int:
+    """
+    Compute a 64-bit perceptual (average) hash of a BGR frame
+    
+    Args:
+        frame: OpenCV frame array (uint8, HxWx3)
+        
+    Returns:
+        Hash as an integer; similar frames differ in few bits
+    """
+    small = cv2.resize(frame, (8, 8), interpolation=cv2.INTER_AREA)
+    gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+    return int.from_bytes(np.packbits(gray > gray.mean()).tobytes(), 'big')
+
+
+def is_near_duplicate(frame_hash: int, seen_hashes: List[int],
+                      threshold: int = FRAME_DEDUP_HAMMING_THRESHOLD) -> bool:
+    """Check whether a frame hash is within threshold bits of any seen hash"""
+    return any((frame_hash ^ prev).bit_count() < threshold for prev in seen_hashes)
+
+
+def deduplicate_frames(frames: NDArray, threshold: int = FRAME_DEDUP_HAMMING_THRESHOLD) -> NDArray:
+    """
+    Drop near-duplicate frames (e.g. static shots) before API submission
+    
+    Unique frames are compacted to the front of the batch in place.
+    
+    Args:
+        frames: Frame batch of shape (N, H, W, 3)
+        threshold: Minimum Hamming distance for a frame to count as new
+        
+    Returns:
+        View of the batch holding only the unique frames, in original order
+    """
+    seen = []
+    count = 0
+    for i in range(len(frames)):
+        frame_hash = compute_frame_hash(frames[i])
+        if is_near_duplicate(frame_hash, seen, threshold):
+            continue
+        seen.append(frame_hash)
+        if count != i:
+            frames[count] = frames[i]
+        count += 1
+    
+    if count < len(frames):
+        debug_print(f"🖼️ [DEBUG] FRAME EXTRACTION: Dropped {len(frames) - count} near-duplicate frames")
+    return frames[:count]
 
 
 class ClarifaiVideoTranscriber:
@@ -83,24 +315,34 @@ class ClarifaiVideoTranscriber:
         if not self.api_key:
             raise ValueError("Clarifai API key is required")
         
-        debug_print(f"🔧 [DEBUG] API key configured: {self.api_key[:8]}...{self.api_key[-4:] if len(self.api_key) > 12 else 'short'}")
+        if _DEBUG:
+            debug_print(f"🔧 [DEBUG] API key configured: {self.api_key[:8]}...{self.api_key[-4:] if len(self.api_key) > 12 else 'short'}")
         
         # Set API key in environment for new SDK
         os.environ["CLARIFAI_PAT"] = self.api_key
         
         # Check which SDK is available
         self.use_new_sdk = NEW_CLARIFAI_SDK_AVAILABLE
-        debug_print(f"🔧 [DEBUG] SDK availability - Modern: {NEW_CLARIFAI_SDK_AVAILABLE}, gRPC: {GRPC_SDK_AVAILABLE if 'GRPC_SDK_AVAILABLE' in globals() else 'Unknown'}")
+        if _DEBUG:
+            debug_print(f"🔧 [DEBUG] SDK availability - Modern: {NEW_CLARIFAI_SDK_AVAILABLE}, gRPC: {GRPC_SDK_AVAILABLE if 'GRPC_SDK_AVAILABLE' in globals() else 'Unknown'}")
         
         if not self.use_new_sdk and not GRPC_SDK_AVAILABLE:
             raise ImportError("Neither new Clarifai SDK nor gRPC SDK is available. Please install: pip install clarifai")
         
+        # gRPC endpoint and auth metadata (also used by the async batch API)
+        if GRPC_SDK_AVAILABLE:
+            self.grpc_target = f"{os.getenv('CLARIFAI_GRPC_BASE', 'api.clarifai.com')}:443"
+            self.metadata = (("authorization", f"Key {self.api_key}"),)
+        
         # Initialize gRPC fallback if new SDK not available
         if not self.use_new_sdk:
             debug_print(f"🔧 [DEBUG] Initializing gRPC fallback...")
-            self.channel = ClarifaiChannel.get_grpc_channel()
+            self.channel = grpc.secure_channel(
+                self.grpc_target,
+                grpc.ssl_channel_credentials(),
+                options=GRPC_CHANNEL_OPTIONS
+            )
             self.stub = service_pb2_grpc.V2Stub(self.channel)
-            self.metadata = (("authorization", f"Key {self.api_key}"),)
             debug_print(f"🔧 [DEBUG] gRPC client initialized")
         
         # Video processing settings
@@ -108,6 +350,35 @@ class ClarifaiVideoTranscriber:
         self.frame_interval = config.VIDEO_FRAME_EXTRACTION_INTERVAL
         debug_print(f"🔧 [DEBUG] Video settings - Max size: {self.max_video_size_mb}MB, Frame interval: {self.frame_interval}s")
         
+        # Thread pool for JPEG encoding (cv2.imencode releases the GIL)
+        self._encode_pool = ThreadPoolExecutor(
+            max_workers=min(8, os.cpu_count() or 1),
+            thread_name_prefix="frame-encode"
+        )
+        
+        # TurboJPEG encoder (needs the libturbojpeg shared library at runtime)
+        self._tj = None
+        if TURBOJPEG_AVAILABLE:
+            try:
+                self._tj = TurboJPEG()
+                debug_print(f"🖼️ [DEBUG] JPEG encoder: libjpeg-turbo")
+            except Exception as e:
+                debug_print(f"🖼️ [DEBUG] TurboJPEG unavailable ({e}), using OpenCV encoder")
+        
+        # Per-model (model_info, model_url, Model) entries, built on first use
+        self._model_cache: Dict[str, Tuple[Dict[str, Any], str, Any]] = {}
+        # Per-model PostModelOutputsRequest prototypes for the gRPC path
+        self._grpc_request_templates: Dict[str, Any] = {}
+        
+        # Successful transcription results keyed by video fingerprint + request; the lock
+        # covers the LRU reorder/evict, since requests run on worker threads too
+        self._result_cache = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        
+        # Selectbox options and name -> position lookup, built once instead of per rerun
+        self.model_names = tuple(config.AVAILABLE_VIDEO_MODELS)
+        self.model_index = {name: i for i, name in enumerate(self.model_names)}
+        
         # Initialize audio extractor (prefer FFmpeg over MoviePy)
         self.audio_extractor = None
         if FFMPEG_AVAILABLE:
@@ -124,6 +395,179 @@ class ClarifaiVideoTranscriber:
         """Get available video models from config"""
         return config.AVAILABLE_VIDEO_MODELS
     
+    def _get_model(self, model_name: str) -> Tuple[Dict[str, Any], str, Any]:
+        """
+        Get the configuration, URL and client for a model, building them once
+        
+        Args:
+            model_name: Name of the model to use
+            
+        Returns:
+            Tuple of (model_info, model_url, model). model is None when the
+            modern SDK is not available
+            
+        Raises:
+            ValueError: If the model is not configured
+        """
+        cached = self._model_cache.get(model_name)
+        if cached is not None:
+            return cached
+        
+        available_models = self.get_available_models()
+        if model_name not in available_models:
+            if _DEBUG:
+                debug_print(f"🔧 [DEBUG] Available models: {list(available_models.keys())}")
+            raise ValueError(f"Model '{model_name}' not available")
+        
+        model_info = available_models[model_name]
+        model_url = f"https://clarifai.com/{model_info['user_id']}/{model_info['app_id']}/models/{model_info['model_id']}"
+        debug_print(f"🔧 [DEBUG] Model URL: {model_url}")
+        
+        model = None
+        if self.use_new_sdk:
+            debug_print(f"🔧 [DEBUG] Initializing Clarifai model...")
+            model = Model(url=model_url)
+            debug_print(f"🔧 [DEBUG] Model initialized successfully")
+        
+        self._model_cache[model_name] = (model_info, model_url, model)
+        return self._model_cache[model_name]
+    
+    def _get_result_cache_key(self, video_path: str, model_name: str, prompt: str,
+                              temperature: float, max_tokens: int) -> bytes:
+        """
+        Build a result cache key from a cheap video fingerprint and the request
+        
+        The fingerprint hashes the first and last RESULT_CACHE_SAMPLE_BYTES of the
+        file plus its size and mtime, so large videos are not read in full.
+        
+        Args:
+            video_path: Path to video file
+            model_name: Name of the model to use
+            prompt: Transcription prompt
+            temperature: Model temperature
+            max_tokens: Maximum tokens in response
+            
+        Returns:
+            16-byte digest
+        """
+        stat = os.stat(video_path)
+        digest = hashlib.blake2b(digest_size=16)
+        with open(video_path, 'rb') as f:
+            digest.update(f.read(RESULT_CACHE_SAMPLE_BYTES))
+            if stat.st_size > RESULT_CACHE_SAMPLE_BYTES:
+                f.seek(max(RESULT_CACHE_SAMPLE_BYTES, stat.st_size - RESULT_CACHE_SAMPLE_BYTES))
+                digest.update(f.read(RESULT_CACHE_SAMPLE_BYTES))
+        digest.update(f"{stat.st_size}|{stat.st_mtime_ns}|{model_name}|{prompt}|{temperature}|{max_tokens}".encode())
+        return digest.digest()
+    
+    def _remember_result(self, key: bytes, result: Dict[str, Any]):
+        """Store a result in the in-memory LRU, evicting the oldest entry when full"""
+        with self._result_cache_lock:
+            self._result_cache[key] = result
+            if len(self._result_cache) > RESULT_CACHE_MAX_ENTRIES:
+                self._result_cache.popitem(last=False)
+    
+    def _recall_result(self, key: Optional[bytes]) -> Optional[Dict[str, Any]]:
+        """Look up a result in the in-memory LRU and mark it recently used"""
+        if key is None:
+            return None
+        with self._result_cache_lock:
+            result = self._result_cache.get(key)
+            if result is not None:
+                self._result_cache.move_to_end(key)
+            return result
+    
+    def _get_phash_cache_key(self, video_path: str, model_name: str, prompt: str,
+                             temperature: float, max_tokens: int) -> Optional[bytes]:
+        """
+        Build a content-based cache key from the key frames' perceptual hashes and the audio
+        
+        Unlike the file fingerprint, this matches re-encoded or re-muxed copies
+        of the same footage. The audio fingerprint keeps videos that look alike
+        but sound different (slide decks, new narration) from sharing a result.
+        
+        Args:
+            video_path: Path to video file
+            model_name: Name of the model to use
+            prompt: Transcription prompt
+            temperature: Model temperature
+            max_tokens: Maximum tokens in response
+            
+        Returns:
+            16-byte digest, or None if no frames could be decoded
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        frame_count = 0
+        for frame, _, _, _ in self._iter_key_frames(video_path, PHASH_CACHE_FRAMES):
+            digest.update(compute_frame_hash(frame).to_bytes(8, 'big'))
+            frame_count += 1
+        
+        if frame_count == 0:
+            return None
+        
+        digest.update(self._get_audio_fingerprint(video_path))
+        digest.update(f"{model_name}|{prompt}|{temperature}|{max_tokens}".encode())
+        return digest.digest()
+    
+    def _get_audio_fingerprint(self, video_path: str) -> bytes:
+        """
+        Coarse fingerprint of the audio track for the perceptual-hash cache key
+        
+        The loudness envelope (RMS per window, quantized to PHASH_AUDIO_DB_STEP dB)
+        survives re-encoding but differs between different soundtracks. Without a
+        decodable audio track the whole file is hashed instead, so only exact
+        copies share a result.
+        
+        Args:
+            video_path: Path to video file
+            
+        Returns:
+            16-byte digest
+        """
+        sample_rate = 8000
+        samples = self.extract_audio_to_ndarray(video_path, sample_rate=sample_rate)
+        if samples is not None and len(samples):
+            window = int(sample_rate * PHASH_AUDIO_WINDOW_SECONDS)
+            usable = len(samples) // window * window or len(samples)
+            windows = samples[:usable].reshape(-1, min(window, usable))
+            rms = np.sqrt(np.mean(windows.astype(np.float64) ** 2, axis=1))
+            levels = np.clip(20 * np.log10(rms + 1e-9) // PHASH_AUDIO_DB_STEP, -20, 0).astype(np.int8)
+            return hashlib.blake2b(b"audio" + levels.tobytes(), digest_size=16).digest()
+        
+        digest = hashlib.blake2b(b"file", digest_size=16)
+        with open(video_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.digest()
+    
+    def _load_phash_result(self, key: bytes) -> Optional[Dict[str, Any]]:
+        """Look up a stored result in the persistent perceptual-hash cache"""
+        try:
+            with sqlite3.connect(config.VIDEO_PHASH_CACHE_PATH) as conn:
+                row = conn.execute(
+                    "SELECT result FROM phash_results WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            debug_print(f"🎬 [DEBUG] Perceptual-hash cache read failed: {e}")
+            return None
+        return json.loads(row[0]) if row else None
+    
+    def _save_phash_result(self, key: bytes, model_name: str, result: Dict[str, Any]):
+        """Store a successful result in the persistent perceptual-hash cache"""
+        try:
+            os.makedirs(os.path.dirname(config.VIDEO_PHASH_CACHE_PATH), exist_ok=True)
+            with sqlite3.connect(config.VIDEO_PHASH_CACHE_PATH) as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS phash_results "
+                    "(key BLOB PRIMARY KEY, model TEXT, result TEXT, created REAL)"
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO phash_results VALUES (?, ?, ?, ?)",
+                    (key, model_name, json.dumps(result, default=str), time.time())
+                )
+        except (OSError, sqlite3.Error) as e:
+            debug_print(f"🎬 [DEBUG] Perceptual-hash cache write failed: {e}")
+    
     def transcribe_video_modern_sdk(self, 
                                   video_path: str, 
                                   model_name: str,
@@ -141,11 +585,12 @@ class ClarifaiVideoTranscriber:
         Returns:
             Dictionary with transcription results
         """
-        debug_print(f"🔧 [DEBUG] Starting modern SDK video transcription")
-        debug_print(f"🔧 [DEBUG] Video path: {video_path}")
-        debug_print(f"🔧 [DEBUG] Model: {model_name}")
-        debug_print(f"🔧 [DEBUG] Prompt length: {len(prompt)} characters")
-        debug_print(f"🔧 [DEBUG] Max tokens: {max_tokens}")
+        if _DEBUG:
+            debug_print(f"🔧 [DEBUG] Starting modern SDK video transcription")
+            debug_print(f"🔧 [DEBUG] Video path: {video_path}")
+            debug_print(f"🔧 [DEBUG] Model: {model_name}")
+            debug_print(f"🔧 [DEBUG] Prompt length: {len(prompt)} characters")
+            debug_print(f"🔧 [DEBUG] Max tokens: {max_tokens}")
         
         if not self.use_new_sdk:
             raise ImportError("New Clarifai SDK not available. Install with: pip install clarifai")
@@ -153,36 +598,28 @@ class ClarifaiVideoTranscriber:
         start_time = time.time()
         
         try:
-            # Get model info
+            # Get model info and client (cached after the first request)
             debug_print(f"🔧 [DEBUG] Looking up model configuration...")
-            available_models = self.get_available_models()
-            if model_name not in available_models:
-                debug_print(f"🔧 [DEBUG] Available models: {list(available_models.keys())}")
-                raise ValueError(f"Model '{model_name}' not available")
-            
-            model_info = available_models[model_name]
-            debug_print(f"🔧 [DEBUG] Model info: {model_info}")
-            
-            # Construct model URL
-            model_url = f"https://clarifai.com/{model_info['user_id']}/{model_info['app_id']}/models/{model_info['model_id']}"
-            debug_print(f"🔧 [DEBUG] Model URL: {model_url}")
-            
-            # Initialize model
-            debug_print(f"🔧 [DEBUG] Initializing Clarifai model...")
-            model = Model(url=model_url)
-            debug_print(f"🔧 [DEBUG] Model initialized successfully")
+            model_info, model_url, model = self._get_model(model_name)
+            if _DEBUG:
+                debug_print(f"🔧 [DEBUG] Model info: {model_info}")
             
             # Create video object from file bytes
             debug_print(f"🔧 [DEBUG] Reading video file...")
             debug_print(f"📹 [DEBUG] METHOD: Sending WHOLE VIDEO (complete file) to API")
             with open(video_path, 'rb') as f:
                 video_bytes = f.read()
-            video_size_mb = len(video_bytes) / (1024 * 1024)
-            debug_print(f"🔧 [DEBUG] Video file read: {video_size_mb:.2f} MB")
-            debug_print(f"📹 [DEBUG] PAYLOAD: Complete video file ({len(video_bytes):,} bytes)")
+            video_len = len(video_bytes)
+            video_size_mb = video_len / (1024 * 1024)
+            if _DEBUG:
+                debug_print(f"🔧 [DEBUG] Video file read: {video_size_mb:.2f} MB")
+                debug_print(f"📹 [DEBUG] PAYLOAD: Complete video file ({video_len:,} bytes)")
             
             debug_print(f"🔧 [DEBUG] Creating Video object...")
             video_obj = Video(bytes=video_bytes)
+            # The request message holds its own copy; release ours so only one
+            # copy of the video is alive for the duration of the RPC
+            del video_bytes
             debug_print(f"🔧 [DEBUG] Video object created successfully")
             debug_print(f"📹 [DEBUG] ADVANTAGE: Full temporal context, motion analysis, complete audio-visual correlation")
             
@@ -194,8 +631,9 @@ class ClarifaiVideoTranscriber:
                 max_tokens=max_tokens,
             )
             debug_print(f"🔧 [DEBUG] API prediction completed")
-            debug_print(f"🔧 [DEBUG] Result type: {type(result)}")
-            debug_print(f"🔧 [DEBUG] Result attributes: {dir(result) if result else 'None'}")
+            if _DEBUG:
+                debug_print(f"🔧 [DEBUG] Result type: {type(result)}")
+                debug_print(f"🔧 [DEBUG] Result attributes: {dir(result) if result else 'None'}")
             
             # Extract text from result
             transcription_text = ""
@@ -216,9 +654,10 @@ class ClarifaiVideoTranscriber:
                 transcription_text = str(result) if result else ""
                 debug_print(f"🔧 [DEBUG] Extracted text as string representation")
             
-            debug_print(f"🔧 [DEBUG] Transcription text length: {len(transcription_text)} characters")
             processing_time = time.time() - start_time
-            debug_print(f"🔧 [DEBUG] Processing completed in {processing_time:.2f}s")
+            if _DEBUG:
+                debug_print(f"🔧 [DEBUG] Transcription text length: {len(transcription_text)} characters")
+                debug_print(f"🔧 [DEBUG] Processing completed in {processing_time:.2f}s")
             
             return {
                 "success": True,
@@ -228,7 +667,7 @@ class ClarifaiVideoTranscriber:
                 "processing_time": processing_time,
                 "video_info": {
                     "path": video_path,
-                    "size_mb": os.path.getsize(video_path) / (1024 * 1024)
+                    "size_mb": video_size_mb
                 },
                 "sdk_used": "modern"
             }
@@ -236,11 +675,12 @@ class ClarifaiVideoTranscriber:
         except Exception as e:
             processing_time = time.time() - start_time
             debug_print(f"🔧 [DEBUG] Modern SDK transcription failed after {processing_time:.2f}s")
-            debug_print(f"🔧 [DEBUG] Error type: {type(e).__name__}")
-            debug_print(f"🔧 [DEBUG] Error message: {str(e)}")
-            import traceback
-            debug_print(f"🔧 [DEBUG] Full traceback:")
-            traceback.print_exc()
+            if _DEBUG:
+                debug_print(f"🔧 [DEBUG] Error type: {type(e).__name__}")
+                debug_print(f"🔧 [DEBUG] Error message: {str(e)}")
+                import traceback
+                debug_print(f"🔧 [DEBUG] Full traceback:")
+                traceback.print_exc()
             
             return {
                 "success": False,
@@ -249,21 +689,131 @@ class ClarifaiVideoTranscriber:
                 "sdk_used": "modern"
             }
     
-    def extract_frames_from_video(self, video_path: str, max_frames: int = 10) -> List[Any]:
+    def extract_frames_from_video(self, video_path: str, max_frames: int = 10) -> NDArray:
         """
         Extract key frames from video for analysis
         
+        Frames are written into one preallocated (N, H, W, 3) uint8 batch at
+        the scaled resolution, so no per-frame arrays are allocated.
+        Near-duplicate frames are dropped, so N may be less than max_frames.
+        
+        Args:
+            video_path: Path to video file
+            max_frames: Maximum number of frames to extract
+            
+        Returns:
+            Frame batch of shape (N, H, W, 3); iterating it yields per-frame views
+        """
+        if not VIDEO_PROCESSING_AVAILABLE:
+            raise ImportError("OpenCV is required for video processing. Install with: pip install opencv-python")
+        
+        frames = None
+        count = 0
+        
+        for frame, need_resize, width, height in self._iter_key_frames(video_path, max_frames):
+            if frames is None:
+                frames = np.empty((max_frames, height, width, 3), dtype=np.uint8)
+            
+            # Resize straight into the batch slot if too large, or if this frame's
+            # shape differs from the slot's
+            if need_resize or frame.shape[:2] != (height, width):
+                resize_frame(frame, width, height, dst=frames[count])
+            else:
+                frames[count] = frame
+            count += 1
+        
+        if frames is None:
+            return np.empty((0, 0, 0, 3), dtype=np.uint8)
+        
+        debug_print(f"🖼️ [DEBUG] FRAME EXTRACTION: Successfully extracted {count} key frames")
+        debug_print(f"🖼️ [DEBUG] FRAME EXTRACTION: Each frame encoded as JPEG bytes for API transmission")
+        return deduplicate_frames(frames[:count])
+    
+    def _extract_jpeg_frames(self, video_path: str, max_frames: int = 10) -> List[bytes]:
+        """
+        Extract, deduplicate, resize and JPEG-encode key frames in a single pass
+        
+        Each decoded frame is resized into its slot of one preallocated
+        (N, H, W, 3) batch and hashed, and its JPEG encode is handed to the
+        encode pool right away, so encoding overlaps decoding of the next
+        frame. Near-duplicate frames are dropped before encoding.
+        
         Args:
             video_path: Path to video file
             max_frames: Maximum number of frames to extract
             
         Returns:
-            List of frame arrays
+            List of JPEG encoded frames, in video order
         """
         if not VIDEO_PROCESSING_AVAILABLE:
             raise ImportError("OpenCV is required for video processing. Install with: pip install opencv-python")
         
-        frames = []
+        encodes = []
+        seen_hashes = []
+        batch = None
+        
+        for frame, need_resize, width, height in self._iter_key_frames(video_path, max_frames):
+            if need_resize or frame.shape[:2] != (height, width):
+                # Each kept frame gets its own slot: its encode may still be running
+                # when the next frame is resized
+                if batch is None:
+                    batch = np.empty((max_frames, height, width, 3), dtype=np.uint8)
+                frame = resize_frame(frame, width, height, dst=batch[len(encodes)])
+            
+            frame_hash = compute_frame_hash(frame)
+            if is_near_duplicate(frame_hash, seen_hashes):
+                continue
+            seen_hashes.append(frame_hash)
+            
+            encodes.append(self._encode_pool.submit(self.encode_frame_to_base64, frame))
+        
+        jpeg_frames = [encode.result() for encode in encodes]
+        debug_print(f"🖼️ [DEBUG] FRAME EXTRACTION: Encoded {len(jpeg_frames)} unique key frames to JPEG")
+        return jpeg_frames
+    
+    def _iter_key_frames(self, video_path: str, max_frames: int) -> Iterator[Tuple[Any, bool, int, int]]:
+        """
+        Yield evenly spaced key frames, preferring PyAV and falling back to OpenCV
+        
+        Args:
+            video_path: Path to video file
+            max_frames: Maximum number of frames to extract
+            
+        Yields:
+            Tuples of (frame, need_resize, width, height). When need_resize is
+            True the frame is at source resolution and must be scaled to
+            (width, height) by the caller
+        """
+        # Prefer PyAV: seeking decodes only the frames we keep
+        if PYAV_AVAILABLE:
+            yielded = 0
+            try:
+                for item in self._iter_frames_pyav(video_path, max_frames):
+                    yielded += 1
+                    yield item
+            except Exception as e:
+                if yielded:
+                    debug_print(f"🖼️ [DEBUG] FRAME EXTRACTION: PyAV stopped after {yielded} frames ({e})")
+                    return
+                debug_print(f"🖼️ [DEBUG] FRAME EXTRACTION: PyAV failed ({e}), falling back to OpenCV")
+            else:
+                if yielded:
+                    return
+                debug_print(f"🖼️ [DEBUG] FRAME EXTRACTION: PyAV returned no frames, falling back to OpenCV")
+        
+        yield from self._iter_frames_opencv(video_path, max_frames)
+    
+    def _iter_frames_opencv(self, video_path: str, max_frames: int) -> Iterator[Tuple[Any, bool, int, int]]:
+        """
+        Yield evenly spaced frames by seeking with OpenCV
+        
+        Args:
+            video_path: Path to video file
+            max_frames: Maximum number of frames to extract
+            
+        Yields:
+            Tuples of (frame, need_resize, width, height)
+        """
         cap = cv2.VideoCapture(video_path)
         
         try:
@@ -272,46 +822,102 @@ class ClarifaiVideoTranscriber:
             fps = cap.get(cv2.CAP_PROP_FPS)
             duration = total_frames / fps if fps > 0 else 0
             
+            # The target size comes from the first decoded frame rather than
+            # CAP_PROP_FRAME_WIDTH/HEIGHT, which can read 0 or disagree with the
+            # decoded shape (rotated or odd-size streams)
+            width = height = None
+            
             debug_print(f"🖼️ [DEBUG] FRAME EXTRACTION: Video has {total_frames} total frames")
             debug_print(f"🖼️ [DEBUG] FRAME EXTRACTION: Duration {duration:.1f}s at {fps:.1f} FPS")
             
-            # Calculate frame extraction interval
-            if duration > 0:
-                interval = max(1, int(total_frames / max_frames))
+            # Compute the exact target frame indices once and seek to each one,
+            # instead of decoding every frame and keeping every Nth
+            if total_frames > 0:
+                targets = np.linspace(0, total_frames - 1, min(max_frames, total_frames), dtype=np.int64)
+                debug_print(f"🖼️ [DEBUG] FRAME EXTRACTION: Seeking to {len(targets)} evenly spaced frames")
             else:
-                interval = 1
-            
-            debug_print(f"🖼️ [DEBUG] FRAME EXTRACTION: Taking every {interval} frame(s) to get max {max_frames} frames")
+                # Frame count unknown - read the leading frames sequentially
+                targets = [None] * max_frames
+                debug_print(f"🖼️ [DEBUG] FRAME EXTRACTION: Frame count unknown, reading first {max_frames} frames")
             
-            frame_count = 0
-            while len(frames) < max_frames:
+            for target in targets:
+                if target is not None:
+                    # Note: may land on the preceding keyframe for inter-coded formats
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, int(target))
                 ret, frame = cap.read()
                 if not ret:
-                    break
+                    if target is None:
+                        break
+                    continue
                 
-                if frame_count % interval == 0:
-                    # Resize frame if too large
-                    height, width = frame.shape[:2]
-                    if width > 1280 or height > 720:
-                        scale = min(1280/width, 720/height)
-                        new_width = int(width * scale)
-                        new_height = int(height * scale)
-                        frame = cv2.resize(frame, (new_width, new_height))
-                    
-                    frames.append(frame)
-                
-                frame_count += 1
+                src_height, src_width = frame.shape[:2]
+                if width is None:
+                    width, height = get_scaled_frame_size(src_width, src_height)
+                yield frame, (src_width, src_height) != (width, height), width, height
                 
         finally:
             cap.release()
+    
+    def _iter_frames_pyav(self, video_path: str, max_frames: int) -> Iterator[Tuple[Any, bool, int, int]]:
+        """
+        Yield evenly spaced frames by seeking with PyAV
+        
+        Only the frames between each keyframe and its target timestamp are
+        decoded, instead of every frame in the video. Resizing and BGR
+        conversion happen in libswscale, so need_resize is always False.
         
-        debug_print(f"🖼️ [DEBUG] FRAME EXTRACTION: Successfully extracted {len(frames)} key frames")
-        debug_print(f"🖼️ [DEBUG] FRAME EXTRACTION: Each frame converted to base64 for API transmission")
-        return frames
+        Args:
+            video_path: Path to video file
+            max_frames: Maximum number of frames to extract
+            
+        Yields:
+            Tuples of (frame, need_resize, width, height); nothing if the
+            duration is unknown
+        """
+        count = 0
+        
+        open_options = {}
+        if config.VIDEO_HWACCEL and HWAccel is not None:
+            # Decode on the GPU; frames are copied back for the bgr24 reformat and
+            # PyAV falls back to software decoding if the codec is unsupported
+            open_options["hwaccel"] = HWAccel(device_type=config.VIDEO_HWACCEL, allow_software_fallback=True)
+        
+        with av.open(video_path, **open_options) as container:
+            stream = container.streams.video[0]
+            time_base = stream.time_base
+            
+            if stream.duration:
+                duration = float(stream.duration * time_base)
+            elif container.duration:
+                duration = container.duration / av.time_base
+            else:
+                duration = 0
+            
+            if duration <= 0 or not time_base:
+                return
+            
+            width, height = get_scaled_frame_size(stream.codec_context.width, stream.codec_context.height)
+            start_pts = stream.start_time or 0
+            
+            debug_print(f"🖼️ [DEBUG] FRAME EXTRACTION: PyAV seeking {max_frames} frames across {duration:.1f}s")
+            
+            for i in range(max_frames):
+                target_pts = start_pts + int((i * duration / max_frames) / time_base)
+                # Seek to the nearest keyframe at or before the target
+                container.seek(target_pts, stream=stream, any_frame=False, backward=True)
+                
+                for frame in container.decode(stream):
+                    if frame.pts is None or frame.pts >= target_pts:
+                        count += 1
+                        yield frame.reformat(width=width, height=height, format='bgr24').to_ndarray(), False, width, height
+                        break
+        
+        debug_print(f"🖼️ [DEBUG] FRAME EXTRACTION: Successfully extracted {count} key frames with PyAV")
     
     def extract_audio_from_video(self, video_path: str) -> Optional[str]:
         """
-        Extract audio track from video file using FFmpeg (preferred) or MoviePy (fallback)
+        Extract audio track from video file using FFmpeg (preferred), the ffmpeg
+        binary directly, or MoviePy (last resort)
         
         Args:
             video_path: Path to video file
@@ -332,9 +938,15 @@ class ClarifaiVideoTranscriber:
                 return audio_path
             else:
                 debug_print(f"🎵 [DEBUG] FFmpeg extraction failed: {error_message}")
-                debug_print(f"🎵 [DEBUG] Falling back to MoviePy...")
         
-        # Fallback to MoviePy if FFmpeg fails or not available
+        # Call the ffmpeg binary directly: 16 kHz mono PCM in a single C pass
+        if FFMPEG_BINARY:
+            audio_path = self._extract_audio_ffmpeg_cli(video_path)
+            if audio_path:
+                return audio_path
+        
+        # Last resort: MoviePy (only useful when the ffmpeg binary is missing)
+        debug_print(f"🎵 [DEBUG] Falling back to MoviePy...")
         if not MOVIEPY_AVAILABLE:
             debug_print("🎵 [DEBUG] MoviePy not available. Audio extraction disabled.")
             return None
@@ -416,35 +1028,186 @@ class ClarifaiVideoTranscriber:
             
         except Exception as e:
             debug_print(f"🎵 [DEBUG] Audio extraction failed with exception:")
-            debug_print(f"🎵 [DEBUG] Error type: {type(e).__name__}")
-            debug_print(f"🎵 [DEBUG] Error message: {str(e)}")
-            import traceback
-            debug_print(f"🎵 [DEBUG] Full traceback:")
-            traceback.print_exc()
+            if _DEBUG:
+                debug_print(f"🎵 [DEBUG] Error type: {type(e).__name__}")
+                debug_print(f"🎵 [DEBUG] Error message: {str(e)}")
+                import traceback
+                debug_print(f"🎵 [DEBUG] Full traceback:")
+                traceback.print_exc()
             return None
     
-    def encode_frame_to_base64(self, frame: Any) -> str:
+    def extract_audio_bytes_from_video(self, video_path: str) -> Optional[bytes]:
         """
-        Encode frame to base64 string for API transmission
+        Extract audio track as in-memory 16 kHz mono WAV bytes
+        
+        ffmpeg writes the WAV to stdout, so no temporary audio file is created.
+        Falls back to the file-based extraction when no ffmpeg binary is found.
+        
+        Args:
+            video_path: Path to video file
+            
+        Returns:
+            WAV file bytes or None if extraction fails or there is no audio
+        """
+        debug_print(f"🎵 [DEBUG] Starting in-memory audio extraction: {os.path.basename(video_path)}")
+        
+        if FFMPEG_BINARY:
+            try:
+                completed = subprocess.run(
+                    [FFMPEG_BINARY, '-i', video_path, '-vn',
+                     '-ac', '1', '-ar', '16000', '-c:a', 'pcm_s16le', '-f', 'wav', 'pipe:1'],
+                    check=True,
+                    capture_output=True
+                )
+                # A bare 44-byte header means the video had no audio samples
+                if len(completed.stdout) > 44:
+                    debug_print(f"🎵 [DEBUG] ffmpeg piped {len(completed.stdout):,} bytes of audio")
+                    return completed.stdout
+                debug_print("🎵 [DEBUG] ffmpeg produced no audio (video may have no audio track)")
+                return None
+            except subprocess.CalledProcessError as e:
+                stderr = e.stderr.decode(errors='replace') if e.stderr else str(e)
+                debug_print(f"🎵 [DEBUG] ffmpeg pipe extraction failed: {stderr[-500:]}")
+            except OSError as e:
+                debug_print(f"🎵 [DEBUG] ffmpeg subprocess could not start: {e}")
+        
+        # Fall back to the file-based extractors and read the result back once
+        audio_path = self.extract_audio_from_video(video_path)
+        if not audio_path or not os.path.exists(audio_path):
+            return None
+        try:
+            with open(audio_path, 'rb') as f:
+                return f.read()
+        finally:
+            try:
+                os.unlink(audio_path)
+            except OSError:
+                pass
+    
+    def _extract_audio_ffmpeg_cli(self, video_path: str) -> Optional[str]:
+        """
+        Extract audio as 16 kHz mono 16-bit PCM WAV by running ffmpeg directly
+        
+        Args:
+            video_path: Path to video file
+            
+        Returns:
+            Path to extracted audio file or None if extraction fails
+        """
+        audio_path = video_path.rsplit('.', 1)[0] + '_extracted_audio.wav'
+        debug_print(f"🎵 [DEBUG] Using ffmpeg subprocess: {os.path.basename(audio_path)}")
+        
+        try:
+            subprocess.run(
+                [FFMPEG_BINARY, '-y', '-i', video_path, '-vn',
+                 '-ac', '1', '-ar', '16000', '-c:a', 'pcm_s16le', audio_path],
+                check=True,
+                capture_output=True
+            )
+        except subprocess.CalledProcessError as e:
+            stderr = e.stderr.decode(errors='replace') if e.stderr else str(e)
+            debug_print(f"🎵 [DEBUG] ffmpeg subprocess failed: {stderr[-500:]}")
+            return None
+        except OSError as e:
+            debug_print(f"🎵 [DEBUG] ffmpeg subprocess could not start: {e}")
+            return None
+        
+        if os.path.exists(audio_path) and os.path.getsize(audio_path) > 0:
+            debug_print(f"🎵 [DEBUG] ffmpeg subprocess extraction successful")
+            return audio_path
+        
+        debug_print("🎵 [DEBUG] ffmpeg produced no audio (video may have no audio track)")
+        return None
+    
+    def extract_audio_to_ndarray(self, video_path: str, sample_rate: int = 16000) -> Optional[NDArray]:
+        """
+        Decode and resample the audio track straight into memory with PyAV
+        
+        Avoids the WAV write/read round-trip for consumers that accept raw
+        samples (e.g. Whisper-style models).
+        
+        Args:
+            video_path: Path to video file
+            sample_rate: Output sample rate in Hz
+            
+        Returns:
+            1-D float32 array of mono samples in [-1.0, 1.0), or None if the
+            video has no audio or PyAV is unavailable
+        """
+        if not PYAV_AVAILABLE or not VIDEO_PROCESSING_AVAILABLE:
+            debug_print("🎵 [DEBUG] PyAV not available. In-memory audio extraction disabled.")
+            return None
+        
+        try:
+            with av.open(video_path) as container:
+                if not container.streams.audio:
+                    debug_print("🎵 [DEBUG] Video has no audio track")
+                    return None
+                
+                audio_stream = container.streams.audio[0]
+                resampler = av.AudioResampler(format='s16', layout='mono', rate=sample_rate)
+                
+                chunks = []
+                for frame in container.decode(audio_stream):
+                    for resampled in resampler.resample(frame):
+                        chunks.append(resampled.to_ndarray())
+                # Flush samples buffered inside the resampler
+                for resampled in resampler.resample(None):
+                    chunks.append(resampled.to_ndarray())
+            
+            if not chunks:
+                debug_print("🎵 [DEBUG] Audio track decoded to no samples")
+                return None
+            
+            samples = np.concatenate(chunks, axis=1)[0].astype(np.float32) / 32768.0
+            debug_print(f"🎵 [DEBUG] In-memory audio extraction: {len(samples) / sample_rate:.2f}s at {sample_rate} Hz")
+            return samples
+            
+        except Exception as e:
+            debug_print(f"🎵 [DEBUG] In-memory audio extraction failed: {e}")
+            return None
+    
+    def encode_frame_to_base64(self, frame: Any) -> bytes:
+        """
+        Encode frame to JPEG bytes for the Image.base64 field
+        
+        The proto field is named `base64` but typed as bytes, so the JPEG is
+        passed through as-is with no text encoding step.
         
         Args:
             frame: OpenCV frame array
             
         Returns:
-            Base64 encoded string
+            JPEG encoded bytes
         """
-        # Encode frame as JPEG
-        _, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
-        # Convert to base64
-        frame_base64 = base64.b64encode(buffer).decode('utf-8')
-        return frame_base64
+        if self._tj is not None:
+            # 4:2:0 with fast DCT - quality loss is negligible for model input
+            return self._tj.encode(frame, quality=JPEG_QUALITY,
+                                   jpeg_subsample=TJSAMP_420, flags=TJFLAG_FASTDCT)
+        _, buffer = cv2.imencode('.jpg', frame, JPEG_ENCODE_PARAMS)
+        return buffer.tobytes()
     
-    def create_multimodal_input(self, frames: List[Any], prompt: str) -> List[resources_pb2.Input]:
+    def create_multimodal_input(self, frames: NDArray, prompt: str) -> List[resources_pb2.Input]:
         """
         Create multimodal inputs for video transcription
         
         Args:
-            frames: List of video frames
+            frames: Frame batch of shape (N, H, W, 3), or a list of frames
+            prompt: Text prompt for transcription context
+            
+        Returns:
+            List of Clarifai Input objects
+        """
+        # Encode frames in parallel; map() preserves frame order
+        encoded_frames = self._encode_pool.map(self.encode_frame_to_base64, frames)
+        return self._build_multimodal_inputs(encoded_frames, prompt)
+    
+    def _build_multimodal_inputs(self, jpeg_frames: Iterable[bytes], prompt: str) -> List[Any]:
+        """
+        Build Clarifai inputs from a prompt and already JPEG-encoded frames
+        
+        Args:
+            jpeg_frames: JPEG encoded frames
             prompt: Text prompt for transcription context
             
         Returns:
@@ -461,18 +1224,86 @@ class ClarifaiVideoTranscriber:
         inputs.append(text_input)
         
         # Add frames as image inputs
-        for i, frame in enumerate(frames):
-            frame_base64 = self.encode_frame_to_base64(frame)
-            
+        for frame_bytes in jpeg_frames:
             image_input = resources_pb2.Input(
                 data=resources_pb2.Data(
-                    image=resources_pb2.Image(base64=frame_base64)
+                    image=resources_pb2.Image(base64=frame_bytes)
                 )
             )
             inputs.append(image_input)
         
         return inputs
     
+    def _lookup_cached_result(self, video_path: str, model_name: str, prompt: str,
+                              temperature: float, max_tokens: int
+                              ) -> Tuple[Optional[bytes], Optional[bytes], Optional[Dict[str, Any]]]:
+        """
+        Look up a previous result in the in-memory LRU, then the perceptual-hash cache
+        
+        Args:
+            video_path: Path to video file
+            model_name: Name of the model to use
+            prompt: Transcription prompt
+            temperature: Model temperature
+            max_tokens: Maximum tokens in response
+            
+        Returns:
+            Tuple of (result cache key, perceptual-hash key, cached result or None);
+            either key is None when that cache is unavailable for this request
+        """
+        try:
+            cache_key = self._get_result_cache_key(video_path, model_name, prompt, temperature, max_tokens)
+        except OSError as e:
+            debug_print(f"🎬 [DEBUG] Result cache disabled for this request: {e}")
+            cache_key = None
+        
+        cached = self._recall_result(cache_key)
+        if cached is not None:
+            debug_print(f"🎬 [DEBUG] Result cache hit - skipping API call")
+            return cache_key, None, {**cached, "from_cache": True}
+        
+        # Fall back to the persistent cache keyed on what the video looks like
+        phash_key = None
+        if config.VIDEO_PHASH_CACHE and VIDEO_PROCESSING_AVAILABLE:
+            try:
+                phash_key = self._get_phash_cache_key(video_path, model_name, prompt, temperature, max_tokens)
+            except Exception as e:
+                debug_print(f"🎬 [DEBUG] Perceptual-hash cache disabled for this request: {e}")
+            
+            cached = self._load_phash_result(phash_key) if phash_key is not None else None
+            if cached is not None:
+                debug_print(f"🎬 [DEBUG] Perceptual-hash cache hit - skipping API call")
+                cached["video_info"] = {**cached.get("video_info", {}), "path": video_path}
+                if cache_key is not None:
+                    self._remember_result(cache_key, cached)
+                return cache_key, phash_key, {**cached, "from_cache": True}
+        
+        return cache_key, phash_key, None
+    
+    def get_cached_result(self,
+                          video_path: str,
+                          model_name: str,
+                          prompt: str = "Please transcribe any speech, dialogue, or text visible in this video. Describe what is happening and provide a detailed transcription.",
+                          temperature: float = 0.7,
+                          max_tokens: int = 1000) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached result for this request without calling the API
+        
+        Checks the same caches as transcribe_video, so callers that stream can
+        skip the model when the result is already known.
+        
+        Args:
+            video_path: Path to video file
+            model_name: Name of the model to use
+            prompt: Transcription prompt
+            temperature: Model temperature
+            max_tokens: Maximum tokens in response
+            
+        Returns:
+            Cached result dict (with 'from_cache' set), or None on a miss
+        """
+        return self._lookup_cached_result(video_path, model_name, prompt, temperature, max_tokens)[2]
+    
     def transcribe_video(self, 
                         video_path: str, 
                         model_name: str,
@@ -493,25 +1324,237 @@ class ClarifaiVideoTranscriber:
             Dictionary with transcription results
         """
         debug_print(f"🎬 [DEBUG] Video transcription request started")
-        debug_print(f"🎬 [DEBUG] Video: {os.path.basename(video_path)}")
-        debug_print(f"🎬 [DEBUG] SDK available - Modern: {self.use_new_sdk}, gRPC: {GRPC_SDK_AVAILABLE if 'GRPC_SDK_AVAILABLE' in globals() else 'Unknown'}")
+        if _DEBUG:
+            debug_print(f"🎬 [DEBUG] Video: {os.path.basename(video_path)}")
+            debug_print(f"🎬 [DEBUG] SDK available - Modern: {self.use_new_sdk}, gRPC: {GRPC_SDK_AVAILABLE if 'GRPC_SDK_AVAILABLE' in globals() else 'Unknown'}")
         debug_print(f"🔄 [DEBUG] TRANSMISSION OPTIONS:")
         debug_print(f"   📹 Modern SDK: WHOLE VIDEO (complete file, temporal context, motion analysis)")
         debug_print(f"   🖼️ gRPC Fallback: KEY FRAMES (8 static images, no temporal context)")
         
+        # Return a previous result for the same video and request
+        cache_key, phash_key, cached = self._lookup_cached_result(
+            video_path, model_name, prompt, temperature, max_tokens
+        )
+        if cached is not None:
+            return cached
+        
+        result = None
+        
         # Try modern SDK first
         if self.use_new_sdk:
             try:
                 debug_print(f"🎬 [DEBUG] Attempting modern SDK approach...")
                 debug_print(f"📹 [DEBUG] SELECTED METHOD: Modern SDK → WHOLE VIDEO transmission")
-                return self.transcribe_video_modern_sdk(video_path, model_name, prompt, max_tokens)
+                result = self.transcribe_video_modern_sdk(video_path, model_name, prompt, max_tokens)
             except Exception as e:
                 debug_print(f"🎬 [DEBUG] Modern SDK failed, falling back to gRPC: {e}")
         
-        # Fallback to old gRPC method
-        debug_print(f"🎬 [DEBUG] Using gRPC fallback method...")
-        debug_print(f"🖼️ [DEBUG] SELECTED METHOD: gRPC SDK → KEY FRAMES extraction")
-        return self.transcribe_video_grpc(video_path, model_name, prompt, temperature, max_tokens)
+        if result is None:
+            # Fallback to old gRPC method
+            debug_print(f"🎬 [DEBUG] Using gRPC fallback method...")
+            debug_print(f"🖼️ [DEBUG] SELECTED METHOD: gRPC SDK → KEY FRAMES extraction")
+            result = self.transcribe_video_grpc(video_path, model_name, prompt, temperature, max_tokens)
+        
+        # Only successful results are cached so failures are retried
+        if result.get("success"):
+            if cache_key is not None:
+                self._remember_result(cache_key, result)
+            if phash_key is not None:
+                self._save_phash_result(phash_key, model_name, result)
+        
+        return result
+    
+    def transcribe_video_stream(self,
+                                video_path: str,
+                                model_name: str,
+                                prompt: str = "Please transcribe any speech, dialogue, or text visible in this video. Describe what is happening and provide a detailed transcription.",
+                                temperature: float = 0.7,
+                                max_tokens: int = 1000) -> Iterator[str]:
+        """
+        Transcribe video, yielding text chunks as the model generates them
+        
+        Streams through the modern SDK's generate() when the model supports it;
+        otherwise falls back to transcribe_video and yields the whole text once.
+        Completed results land in the same result cache as transcribe_video, so
+        a following transcribe_video call for the same request is a cache hit.
+        
+        Args:
+            video_path: Path to video file
+            model_name: Name of the model to use
+            prompt: Transcription prompt
+            temperature: Model temperature (non-streaming fallback only)
+            max_tokens: Maximum tokens in response
+            
+        Yields:
+            Text chunks of the transcription
+            
+        Raises:
+            RuntimeError: If the transcription fails
+        """
+        cache_key, phash_key, cached = self._lookup_cached_result(
+            video_path, model_name, prompt, temperature, max_tokens
+        )
+        if cached is not None:
+            yield cached.get("transcription", "")
+            return
+        
+        start_time = time.time()
+        chunks = []
+        if self.use_new_sdk:
+            try:
+                _, model_url, model = self._get_model(model_name)
+                generate = getattr(model, "generate", None)
+                if generate is not None:
+                    with open(video_path, 'rb') as f:
+                        video_obj = Video(bytes=f.read())
+                    for piece in generate(prompt=prompt, video=video_obj, max_tokens=max_tokens):
+                        text = piece if isinstance(piece, str) else getattr(piece, "text", "")
+                        if text:
+                            chunks.append(text)
+                            yield text
+            except Exception as e:
+                # Text already shown can't be taken back - only fall back before the first chunk
+                if chunks:
+                    raise RuntimeError(f"Streaming transcription interrupted: {e}") from e
+                debug_print(f"🎬 [DEBUG] Streaming unavailable ({e}), using a single request")
+        
+        if chunks:
+            result = {
+                "success": True,
+                "transcription": "".join(chunks),
+                "model_used": model_name,
+                "model_url": model_url,
+                "processing_time": time.time() - start_time,
+                "video_info": {
+                    "path": video_path,
+                    "size_mb": os.path.getsize(video_path) / (1024 * 1024)
+                },
+                "sdk_used": "modern-stream"
+            }
+            if cache_key is not None:
+                self._remember_result(cache_key, result)
+            if phash_key is not None:
+                self._save_phash_result(phash_key, model_name, result)
+            return
+        
+        result = self.transcribe_video(video_path, model_name, prompt=prompt,
+                                       temperature=temperature, max_tokens=max_tokens)
+        if not result.get("success"):
+            raise RuntimeError(result.get("error", "Video transcription failed"))
+        yield result.get("transcription", "")
+    
+    def _build_grpc_request(self,
+                            model_info: Dict[str, Any],
+                            inputs: List[Any],
+                            temperature: float,
+                            max_tokens: int) -> Any:
+        """
+        Build the PostModelOutputs request for the gRPC frame-based method
+        
+        Args:
+            model_info: Model configuration
+            inputs: Multimodal inputs (prompt + frames)
+            temperature: Model temperature
+            max_tokens: Maximum tokens in response
+            
+        Returns:
+            PostModelOutputsRequest
+        """
+        # The model fields never change, so build them once per model and copy
+        template_key = f"{model_info['user_id']}/{model_info['app_id']}/{model_info['model_id']}"
+        template = self._grpc_request_templates.get(template_key)
+        if template is None:
+            template = service_pb2.PostModelOutputsRequest(
+                model_id=model_info['model_id'],
+                version_id="",  # Use latest version
+                model=resources_pb2.Model(
+                    model_version=resources_pb2.ModelVersion(
+                        id=model_info['model_id'],
+                        app_id=model_info['app_id'],
+                        user_id=model_info['user_id']
+                    )
+                )
+            )
+            self._grpc_request_templates[template_key] = template
+        
+        request = service_pb2.PostModelOutputsRequest()
+        request.CopyFrom(template)
+        request.inputs.extend(inputs)
+        params = request.model.output_info.params.fields
+        params["temperature"].number_value = temperature
+        params["max_tokens"].number_value = max_tokens
+        return request
+    
+    def _prepare_grpc_request(self,
+                              video_path: str,
+                              model_name: str,
+                              prompt: str,
+                              temperature: float,
+                              max_tokens: int) -> Tuple[Any, int, float]:
+        """
+        Extract key frames and build the gRPC request for a video
+        
+        Returns:
+            Tuple of (request, frames_processed, video_size_mb)
+        """
+        # Get model info
+        model_info, _, _ = self._get_model(model_name)
+        video_size_mb = os.path.getsize(video_path) / (1024 * 1024)
+        
+        # Extract, resize and encode frames in one pass
+        debug_print(f"🖼️ [DEBUG] METHOD: Extracting KEY FRAMES (gRPC fallback method)")
+        frames = self._extract_jpeg_frames(video_path, max_frames=8)
+        if not frames:
+            raise ValueError("Could not extract frames from video")
+        debug_print(f"🖼️ [DEBUG] PAYLOAD: {len(frames)} extracted frames (static images)")
+        debug_print(f"🖼️ [DEBUG] LIMITATION: No temporal context, motion analysis limited")
+        
+        # Create multimodal inputs
+        inputs = self._build_multimodal_inputs(frames, prompt)
+        
+        request = self._build_grpc_request(model_info, inputs, temperature, max_tokens)
+        return request, len(frames), video_size_mb
+    
+    def _parse_grpc_response(self,
+                             response: Any,
+                             video_path: str,
+                             model_name: str,
+                             frames_processed: int,
+                             video_size_mb: float,
+                             start_time: float) -> Dict[str, Any]:
+        """
+        Convert a PostModelOutputs response into the transcription result dict
+        """
+        # Process response
+        if response.status.code != status_code_pb2.SUCCESS:
+            error_msg = f"API Error: {response.status.description}"
+            return {
+                "success": False,
+                "error": error_msg,
+                "processing_time": time.time() - start_time
+            }
+        
+        # Extract transcription from response
+        transcription_text = ""
+        if response.outputs:
+            output = response.outputs[0]
+            if output.data.text.raw:
+                transcription_text = output.data.text.raw
+        
+        processing_time = time.time() - start_time
+        
+        return {
+            "success": True,
+            "transcription": transcription_text,
+            "model_used": model_name,
+            "frames_processed": frames_processed,
+            "processing_time": processing_time,
+            "video_info": {
+                "path": video_path,
+                "size_mb": video_size_mb
+            },
+            "sdk_used": "grpc"
+        }
     
     def transcribe_video_grpc(self, 
                              video_path: str, 
@@ -525,82 +1568,72 @@ class ClarifaiVideoTranscriber:
         start_time = time.time()
         
         try:
-            # Get model info
-            available_models = self.get_available_models()
-            if model_name not in available_models:
-                raise ValueError(f"Model '{model_name}' not available")
-            
-            model_info = available_models[model_name]
-            
-            # Extract frames from video
-            debug_print(f"🖼️ [DEBUG] METHOD: Extracting KEY FRAMES (gRPC fallback method)")
-            frames = self.extract_frames_from_video(video_path, max_frames=8)
-            if not frames:
-                raise ValueError("Could not extract frames from video")
-            debug_print(f"🖼️ [DEBUG] PAYLOAD: {len(frames)} extracted frames (static images)")
-            debug_print(f"🖼️ [DEBUG] LIMITATION: No temporal context, motion analysis limited")
-            
-            # Create multimodal inputs
-            inputs = self.create_multimodal_input(frames, prompt)
-            
-            # Prepare model version
-            model_version = resources_pb2.ModelVersion(
-                id=model_info['model_id'],
-                app_id=model_info['app_id'],
-                user_id=model_info['user_id']
-            )
-            
-            # Create predict request
-            request = service_pb2.PostModelOutputsRequest(
-                model_id=model_info['model_id'],
-                version_id="",  # Use latest version
-                inputs=inputs,
-                model=resources_pb2.Model(
-                    model_version=model_version,
-                    output_info=resources_pb2.OutputInfo(
-                        params=resources_pb2.Struct(
-                            fields={
-                                "temperature": resources_pb2.Value(number_value=temperature),
-                                "max_tokens": resources_pb2.Value(number_value=max_tokens)
-                            }
-                        )
-                    )
-                )
+            request, frames_processed, video_size_mb = self._prepare_grpc_request(
+                video_path, model_name, prompt, temperature, max_tokens
             )
             
             # Make API call
             response = self.stub.PostModelOutputs(request, metadata=self.metadata)
             
-            # Process response
-            if response.status.code != status_code_pb2.SUCCESS:
-                error_msg = f"API Error: {response.status.description}"
-                return {
-                    "success": False,
-                    "error": error_msg,
-                    "processing_time": time.time() - start_time
-                }
-            
-            # Extract transcription from response
-            transcription_text = ""
-            if response.outputs:
-                output = response.outputs[0]
-                if output.data.text.raw:
-                    transcription_text = output.data.text.raw
+            return self._parse_grpc_response(
+                response, video_path, model_name, frames_processed, video_size_mb, start_time
+            )
             
+        except Exception as e:
             processing_time = time.time() - start_time
-            
             return {
-                "success": True,
-                "transcription": transcription_text,
-                "model_used": model_name,
-                "frames_processed": len(frames),
+                "success": False,
+                "error": str(e),
                 "processing_time": processing_time,
-                "video_info": {
-                    "path": video_path,
-                    "size_mb": os.path.getsize(video_path) / (1024 * 1024)
-                },
                 "sdk_used": "grpc"
             }
+    
+    async def transcribe_video_grpc_async(self,
+                                          video_path: str,
+                                          model_name: str,
+                                          prompt: str,
+                                          temperature: float = 0.7,
+                                          max_tokens: int = 1000,
+                                          stub: Any = None) -> Dict[str, Any]:
+        """
+        Transcribe video using the gRPC API without blocking the event loop
+        
+        Frame extraction and encoding run in a worker thread; the API call is
+        awaited on a grpc.aio stub so several videos can be in flight at once.
+        
+        Args:
+            video_path: Path to video file
+            model_name: Name of the model to use
+            prompt: Transcription prompt
+            temperature: Model temperature
+            max_tokens: Maximum tokens in response
+            stub: Optional shared grpc.aio V2Stub (a channel is opened if None)
+            
+        Returns:
+            Dictionary with transcription results
+        """
+        if stub is None:
+            async with grpc.aio.secure_channel(
+                self.grpc_target, grpc.ssl_channel_credentials(), options=GRPC_CHANNEL_OPTIONS
+            ) as channel:
+                return await self.transcribe_video_grpc_async(
+                    video_path, model_name, prompt, temperature, max_tokens,
+                    stub=service_pb2_grpc.V2Stub(channel)
+                )
+        
+        start_time = time.time()
+        
+        try:
+            request, frames_processed, video_size_mb = await asyncio.to_thread(
+                self._prepare_grpc_request, video_path, model_name, prompt, temperature, max_tokens
+            )
+            
+            # Make API call
+            response = await stub.PostModelOutputs(request, metadata=self.metadata)
+            
+            return self._parse_grpc_response(
+                response, video_path, model_name, frames_processed, video_size_mb, start_time
+            )
             
         except Exception as e:
             processing_time = time.time() - start_time
@@ -611,6 +1644,38 @@ class ClarifaiVideoTranscriber:
                 "sdk_used": "grpc"
             }
     
+    async def transcribe_batch(self,
+                               video_paths: List[str],
+                               model_name: str,
+                               prompt: str,
+                               temperature: float = 0.7,
+                               max_tokens: int = 1000) -> List[Dict[str, Any]]:
+        """
+        Transcribe several videos concurrently over one grpc.aio channel
+        
+        Args:
+            video_paths: Paths to video files
+            model_name: Name of the model to use
+            prompt: Transcription prompt
+            temperature: Model temperature
+            max_tokens: Maximum tokens in response
+            
+        Returns:
+            List of result dictionaries, in the same order as video_paths
+        """
+        if not GRPC_SDK_AVAILABLE:
+            raise ImportError("gRPC SDK not available. Install with: pip install clarifai-grpc")
+        
+        debug_print(f"🎬 [DEBUG] Batch transcription of {len(video_paths)} videos (grpc.aio)")
+        async with grpc.aio.secure_channel(
+            self.grpc_target, grpc.ssl_channel_credentials(), options=GRPC_CHANNEL_OPTIONS
+        ) as channel:
+            stub = service_pb2_grpc.V2Stub(channel)
+            return await asyncio.gather(*[
+                self.transcribe_video_grpc_async(path, model_name, prompt, temperature, max_tokens, stub=stub)
+                for path in video_paths
+            ])
+    
     def transcribe_video_with_audio(self,
                                   video_path: str,
                                   model_name: str,
@@ -633,39 +1698,23 @@ class ClarifaiVideoTranscriber:
             Dictionary with comprehensive transcription results
         """
         debug_print(f"🎯 [DEBUG] Enhanced video transcription started")
-        debug_print(f"🎯 [DEBUG] Audio transcription provided: {bool(audio_transcription)}")
-        if audio_transcription:
-            debug_print(f"🎯 [DEBUG] Audio transcription length: {len(audio_transcription)} chars")
-        debug_print(f"🎯 [DEBUG] Custom prompt provided: {bool(prompt)}")
+        if _DEBUG:
+            debug_print(f"🎯 [DEBUG] Audio transcription provided: {bool(audio_transcription)}")
+            if audio_transcription:
+                debug_print(f"🎯 [DEBUG] Audio transcription length: {len(audio_transcription)} chars")
+            debug_print(f"🎯 [DEBUG] Custom prompt provided: {bool(prompt)}")
         
         # Auto-generate prompt if audio transcription is available
         if prompt is None:
             if audio_transcription:
                 debug_print(f"🎯 [DEBUG] Generating audio-enhanced prompt...")
-                prompt = f"""Please analyze this video and provide a comprehensive transcription. 
-
-Audio transcription (already extracted): "{audio_transcription}"
-
-Please:
-1. Describe what is happening visually in the video
-2. Identify any text, signs, or written content visible in the frames
-3. Correlate the visual content with the audio transcription provided
-4. Provide timestamps or sequence information if possible
-5. Note any important visual context that complements the audio
-
-Provide a detailed, structured response combining both visual and audio information."""
+                prompt = PROMPT_WITH_AUDIO.format(audio=audio_transcription)
             else:
                 debug_print(f"🎯 [DEBUG] Generating visual-only prompt...")
-                prompt = """Please analyze this video and provide a comprehensive transcription including:
-1. Any speech or dialogue you can detect
-2. Visual text, signs, or written content
-3. Description of key visual events and actions
-4. Context and setting information
-5. Any other relevant audio-visual information
-
-Provide a detailed, structured transcription."""
+                prompt = PROMPT_VISUAL_ONLY
         
-        debug_print(f"🎯 [DEBUG] Final prompt length: {len(prompt)} characters")
+        if _DEBUG:
+            debug_print(f"🎯 [DEBUG] Final prompt length: {len(prompt)} characters")
         debug_print(f"🎯 [DEBUG] Calling main transcribe_video method...")
         return self.transcribe_video(video_path, model_name, prompt, temperature, max_tokens)
 
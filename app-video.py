@@ -1,11 +1,23 @@
 import streamlit as st
+import atexit
 import time
 import io
 import os
+import re
+import shutil
 import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
 from config import config
+from streamlit_compat import deferred_download_button
 from ClarifaiVideoUtil import ClarifaiVideoTranscriber, is_video_processing_available, get_video_info, debug_print
-from ClarifaiUtil import ClarifaiTranscriber  # For audio extraction fallback
+from ClarifaiUtil import ClarifaiTranscriber, content_digest  # For audio extraction fallback
+
+# Bound once at import; debug_print sites that format values are wrapped in
+# "if _DEBUG:" so the f-strings are never built on the normal path
+_DEBUG = config.DEBUG_VIDEO_PROCESSING
 
 # Page configuration
 st.set_page_config(
@@ -14,20 +26,440 @@ st.set_page_config(
     layout="wide"
 )
 
+@st.cache_resource(show_spinner=False)
+def _get_video_transcriber(pat: str) -> ClarifaiVideoTranscriber:
+    """Video transcriber shared across reruns so its clients and caches stay warm"""
+    return ClarifaiVideoTranscriber(pat)
+
+@st.cache_resource(show_spinner=False)
+def _get_audio_transcriber(pat: str) -> ClarifaiTranscriber:
+    """Audio transcriber shared across reruns and clicks"""
+    return ClarifaiTranscriber(pat)
+
+@st.cache_data(show_spinner=False)
+def _cached_video_info(_video_path: str, video_digest: str):
+    """Video metadata per upload content - the container is opened once per digest, and the path is not hashed"""
+    return get_video_info(_video_path)
+
+
+# Transcription results memoized per (video digest, model, parameters). The upload
+# is written to a new temp file on every rerun, so results are keyed on content
+# and the transcriber / path arguments are left unhashed.
+RESULT_CACHE_TTL_SECONDS = 3600
+
+
+class _UncachedResult(Exception):
+    """Carries a failed result out of a cached function so it is not memoized"""
+    
+    def __init__(self, result):
+        super().__init__(result.get('error', 'Transcription failed'))
+        self.result = result
+
+
+@st.cache_data(ttl=RESULT_CACHE_TTL_SECONDS, show_spinner=False)
+def _cached_transcribe_video(_transcriber, _video_path, video_digest, model_name, prompt, temperature, max_tokens):
+    result = _transcriber.transcribe_video(
+        _video_path, model_name, prompt=prompt, temperature=temperature, max_tokens=max_tokens
+    )
+    if not result.get('success'):
+        raise _UncachedResult(result)
+    return result
+
+
+@st.cache_data(ttl=RESULT_CACHE_TTL_SECONDS, show_spinner=False)
+def _cached_transcribe_video_with_audio(_transcriber, _video_path, video_digest, model_name,
+                                        audio_transcription, prompt, temperature, max_tokens):
+    result = _transcriber.transcribe_video_with_audio(
+        _video_path, model_name, audio_transcription=audio_transcription,
+        prompt=prompt, temperature=temperature, max_tokens=max_tokens
+    )
+    if not result.get('success'):
+        raise _UncachedResult(result)
+    return result
+
+
+@st.cache_data(ttl=RESULT_CACHE_TTL_SECONDS, show_spinner=False)
+def _cached_transcribe_audio(_transcriber, _audio_bytes, video_digest, model_name, temperature, max_tokens):
+    # Long soundtracks are split at pauses and transcribed concurrently
+    result = _transcriber.transcribe_audio_chunked(
+        _audio_bytes, model_name, temperature=temperature, max_tokens=max_tokens
+    )
+    if not (result and isinstance(result, str) and result.strip()):
+        raise _UncachedResult({'error': 'Empty or invalid result', 'transcription': result})
+    return result
+
+
+def transcribe_video_cached(*args, **kwargs):
+    """Memoized transcribe_video; failed results are returned but not cached"""
+    try:
+        return _cached_transcribe_video(*args, **kwargs)
+    except _UncachedResult as e:
+        return e.result
+
+
+def transcribe_video_with_audio_cached(*args, **kwargs):
+    """Memoized transcribe_video_with_audio; failed results are returned but not cached"""
+    try:
+        return _cached_transcribe_video_with_audio(*args, **kwargs)
+    except _UncachedResult as e:
+        return e.result
+
+
+def transcribe_audio_cached(*args, **kwargs):
+    """Memoized transcribe_audio; empty results are returned but not cached"""
+    try:
+        return _cached_transcribe_audio(*args, **kwargs)
+    except _UncachedResult as e:
+        return e.result.get('transcription')
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _build_download_bytes(video_digest: str, header: str, _sections: tuple) -> bytes:
+    """Report text for download, built once per (video, header) - the sections are not hashed"""
+    return (header + "".join(_sections)).encode("utf-8")
+
+
+def download_report_button(label: str, file_name: str, video_digest: str, header: str, sections: tuple):
+    """
+    Download button whose report is only assembled when the user asks for it
+
+    Args:
+        label: Button label
+        file_name: Suggested download file name
+        video_digest: Content digest of the uploaded video, keys the memoized report
+        header: Small statistics block at the top of the report
+        sections: Transcription text blocks appended after the header
+    """
+    def _build_download():
+        return _build_download_bytes(video_digest, header, sections)
+
+    deferred_download_button(label, _build_download, file_name=file_name, mime="text/plain")
+
+
+# Audio failure classes, checked in priority order: FFmpeg, MoviePy compatibility, transcription
+_AUDIO_ERR_PAT = re.compile(
+    r"(ffmpeg)"
+    r"|(expected bytes, got str|unexpected keyword argument|moviepy version compatibility)"
+    r"|(transcribe_audio|whisper)",
+    re.IGNORECASE
+)
+_AUDIO_ERR_MESSAGES = {
+    1: ("⚠️ FFmpeg audio extraction failed. Trying MoviePy fallback...",
+        "🚨 [DEBUG] FFmpeg extraction issue, falling back to MoviePy"),
+    2: ("⚠️ Audio extraction failed. Both FFmpeg and MoviePy methods encountered issues. Proceeding with visual-only analysis.",
+        "🚨 [DEBUG] Both FFmpeg and MoviePy failed - compatibility issues"),
+    3: ("⚠️ Audio transcription failed. Proceeding with visual-only analysis.",
+        "🚨 [DEBUG] Audio transcription failure detected"),
+}
+
+
+# Minimum spacing between progress updates; each one is a frontend round-trip
+PROGRESS_MIN_INTERVAL_SECONDS = 0.1
+
+
+def _throttled_progress(progress_bar, status_text, percent: int, message: str):
+    """
+    Update the progress bar and status line, skipping updates that land within
+    PROGRESS_MIN_INTERVAL_SECONDS of the previous one (completion always shows).
+    A skipped update is kept until the next one or _flush_progress.
+    
+    Args:
+        progress_bar: st.progress element
+        status_text: st.empty placeholder for the status line
+        percent: Progress percentage (0-100)
+        message: Status message
+    """
+    now = time.time()
+    if percent < 100 and now - st.session_state.get('_progress_updated_at', 0.0) < PROGRESS_MIN_INTERVAL_SECONDS:
+        st.session_state._progress_pending = (percent, message)
+        return
+    st.session_state._progress_updated_at = now
+    st.session_state.pop('_progress_pending', None)
+    progress_bar.progress(percent)
+    status_text.text(message)
+
+
+def _flush_progress(progress_bar, status_text):
+    """
+    Show the last update _throttled_progress skipped, if any
+    
+    Call before blocking work so the status line describes what is running.
+    
+    Args:
+        progress_bar: st.progress element
+        status_text: st.empty placeholder for the status line
+    """
+    pending = st.session_state.pop('_progress_pending', None)
+    if pending is not None:
+        st.session_state._progress_updated_at = time.time()
+        progress_bar.progress(pending[0])
+        status_text.text(pending[1])
+
+
+VIDEO_SESSION_KEYS = ('processed_video', 'video_timestamp', 'video_frames', 'extracted_audio', 'video_tmp_files')
+
+# Temp files kept per session, keyed by upload content digest
+VIDEO_TMP_CACHE_SIZE = 3
+
+# Upload temp files older than this are deleted, since sessions that are never
+# resumed (closed tabs) would otherwise leave them behind until the process exits
+VIDEO_TMP_MAX_AGE_SECONDS = 3600
+
+# Uploads up to this size are kept on tmpfs when it has room
+SHM_DIR = "/dev/shm"
+SHM_MAX_VIDEO_BYTES = 64 << 20
+
+
+def _unlink_in_background(paths: Iterable[str]):
+    """
+    Delete temp files on a daemon thread so a slow temp dir (NFS, overlayfs)
+    never stalls the rerun
+    
+    Args:
+        paths: File paths to remove; missing files are ignored
+    """
+    def unlink_all(paths):
+        for path in paths:
+            try:
+                os.unlink(path)
+            except OSError as e:
+                if _DEBUG:
+                    debug_print(f"⚠️ [DEBUG] Could not remove temp file {path}: {e}")
+    
+    threading.Thread(target=unlink_all, args=(list(paths),), name="tmp-cleanup", daemon=True).start()
+
+
+def _get_upload_dir(base_dir: str) -> str:
+    """Directory under base_dir for this process's upload temp files, shared by all sessions"""
+    return os.path.join(base_dir, f"video_upload_{os.getpid()}")
+
+
+def _sweep_upload_dir(upload_dir: str):
+    """
+    Delete upload temp files older than VIDEO_TMP_MAX_AGE_SECONDS
+    
+    Args:
+        upload_dir: Directory to sweep
+    """
+    cutoff = time.time() - VIDEO_TMP_MAX_AGE_SECONDS
+    try:
+        entries = list(os.scandir(upload_dir))
+    except OSError:
+        return
+    stale_paths = [entry.path for entry in entries if entry.is_file() and entry.stat().st_mtime < cutoff]
+    if stale_paths:
+        _unlink_in_background(stale_paths)
+
+
+@st.cache_resource(show_spinner=False)
+def _register_upload_cleanup(base_dir: str) -> str:
+    """
+    Once per process and base directory: remove upload dirs left by earlier
+    processes, and this process's upload dir when it exits
+    
+    Args:
+        base_dir: Parent directory of the upload dirs
+        
+    Returns:
+        This process's upload directory under base_dir
+    """
+    upload_dir = _get_upload_dir(base_dir)
+    cutoff = time.time() - VIDEO_TMP_MAX_AGE_SECONDS
+    try:
+        leftovers = [
+            entry.path for entry in os.scandir(base_dir)
+            if entry.name.startswith("video_upload_") and entry.path != upload_dir
+            and entry.stat().st_mtime < cutoff
+        ]
+    except OSError:
+        leftovers = []
+    for path in leftovers:
+        shutil.rmtree(path, ignore_errors=True)
+    atexit.register(shutil.rmtree, upload_dir, ignore_errors=True)
+    return upload_dir
+
+
+def _get_upload_tempfile(uploaded_file):
+    """
+    Write an upload to a temp file, or reuse the one already written for the same content
+    
+    Args:
+        uploaded_file: Streamlit UploadedFile
+        
+    Returns:
+        Tuple of (temp file path, content_digest of the upload)
+    """
+    tmp_files = st.session_state.setdefault('video_tmp_files', OrderedDict())
+    
+    # getvalue() returns the bytes the upload was created from without copying them
+    # while the BytesIO is unmodified; getbuffer() would first copy them into a
+    # private writable buffer
+    data = uploaded_file.getvalue()
+    video_digest = content_digest(data)
+    
+    tmp_video_path = tmp_files.get(video_digest)
+    if tmp_video_path:
+        # Refresh the age so the sweep keeps files that are still being reused;
+        # a file the sweep already removed is written again below
+        try:
+            os.utime(tmp_video_path)
+        except OSError:
+            tmp_video_path = None
+    if tmp_video_path:
+        tmp_files.move_to_end(video_digest)
+        if _DEBUG:
+            debug_print(f"♻️ [DEBUG] Reusing temp file for upload {video_digest[:12]}")
+        return tmp_video_path, video_digest
+    
+    suffix = os.path.splitext(uploaded_file.name)[1] or ".mp4"
+    tmp_video_path = None
+    
+    # Small videos go to RAM-backed /dev/shm; ffmpeg, OpenCV and PyAV
+    # still get a real path but nothing is written through to disk
+    shm_free = shutil.disk_usage(SHM_DIR).free if os.path.isdir(SHM_DIR) else 0
+    if len(data) <= SHM_MAX_VIDEO_BYTES and shm_free > 2 * len(data):
+        tmp_file = None
+        try:
+            shm_upload_dir = _get_upload_dir(SHM_DIR)
+            os.makedirs(shm_upload_dir, exist_ok=True)
+            tmp_file = tempfile.NamedTemporaryFile(delete=False, suffix=suffix, prefix="video_", dir=shm_upload_dir)
+            with tmp_file:
+                tmp_file.write(data)
+            tmp_video_path = tmp_file.name
+        except OSError as e:
+            debug_print(f"⚠️ [DEBUG] {SHM_DIR} write failed ({e}), using the default temp dir")
+            if tmp_file is not None:
+                _unlink_in_background([tmp_file.name])
+    
+    if tmp_video_path is None:
+        upload_dir = _get_upload_dir(tempfile.gettempdir())
+        os.makedirs(upload_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix, prefix="video_", dir=upload_dir) as tmp_file:
+            tmp_file.write(data)
+            tmp_video_path = tmp_file.name
+    
+    tmp_files[video_digest] = tmp_video_path
+    stale_paths = []
+    while len(tmp_files) > VIDEO_TMP_CACHE_SIZE:
+        stale_paths.append(tmp_files.popitem(last=False)[1])
+    if stale_paths:
+        _unlink_in_background(stale_paths)
+    
+    return tmp_video_path, video_digest
+
+
+# Description mode prompt; it does not depend on any sidebar input
+DESCRIPTION_PROMPT = """Please provide a comprehensive description of this video including:
+
+1. **Visual Content**: Describe what you see in the video frames - objects, people, scenes, settings
+2. **Actions and Movement**: Describe any actions, movements, or activities taking place
+3. **Text and Graphics**: Identify any text, signs, logos, or graphic elements visible
+4. **Style and Quality**: Comment on the video style, quality, lighting, colors
+5. **Context and Purpose**: Analyze what type of video this appears to be and its likely purpose
+6. **Key Elements**: Highlight the most important or interesting elements in the video
+
+Please provide a detailed, engaging description as if you're explaining the video to someone who cannot see it."""
+
+# Static header cards, pre-rendered once instead of three columns of st.info per rerun
+FEATURE_CARDS_HTML = (
+    "<div style='display:flex;gap:1rem;margin-bottom:1rem'>"
+    + "".join(
+        "<div style='flex:1;padding:0.75rem 1rem;border-radius:0.5rem;"
+        "background-color:rgba(28,131,225,0.1);color:rgb(0,66,128)'>"
+        f"<b>{title}</b><br>{text}</div>"
+        for title, text in (
+            ("⚡ FFmpeg Processing", "60-70% faster audio extraction"),
+            ("🎯 Whisper Large V3", "Dedicated audio transcription"),
+            ("🎨 Tabbed Results", "Clean content separation"),
+        )
+    )
+    + "</div>"
+)
+
+# st.fragment (1.37+, experimental_fragment since 1.33) scopes reruns to the panel;
+# older Streamlit releases just render it as part of the full script run
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+MODEL_RECOMMENDATIONS = {
+    "MM-Poly-8B": "🌟 **Recommended**: Native Clarifai model optimized for performance",
+    "Qwen2.5-VL-7B-Instruct": "🎯 **Advanced**: Best for temporal understanding and object localization",
+    "MiniCPM-o-2.6": "🎪 **Multimedia**: Comprehensive end-to-end analysis",
+}
+
+
+@_fragment
+def _model_selection_panel(video_transcriber: ClarifaiVideoTranscriber):
+    """
+    Sidebar model picker and model details; the selection is read back from
+    st.session_state["video_model_name"]
+    
+    Args:
+        video_transcriber: Cached transcriber providing the model list and index
+    """
+    st.markdown("### 🤖 AI Model Selection")
+    
+    available_models = video_transcriber.get_available_models()
+    
+    model_name = st.selectbox(
+        "Choose Video Analysis Model",
+        options=video_transcriber.model_names,
+        index=video_transcriber.model_index.get(config.DEFAULT_VIDEO_MODEL, 0),
+        key="video_model_name",
+        help="Select from verified working multimodal AI models"
+    )
+    
+    # Enhanced model information display
+    if model_name and model_name in available_models:
+        model_info = available_models[model_name]
+        
+        # Model description with better formatting
+        description = model_info.get('description', 'No description available')
+        st.markdown(f"**📋 Description:**\n{description}")
+        
+        # Show model features with icons (first 3) in a single element
+        features = model_info.get('features', [])
+        if features:
+            st.markdown("**🔧 Capabilities:**\n" + "\n".join(
+                f"- {feature.replace('_', ' ').title()}" for feature in features[:3]
+            ))
+    
+    # Model recommendations
+    if model_name in MODEL_RECOMMENDATIONS:
+        st.info(MODEL_RECOMMENDATIONS[model_name])
+
+
+def _sweep_expired_session(ttl: float = 1800) -> bool:
+    """
+    Drop video session state older than ttl seconds and delete its temp file
+    
+    Returns:
+        True if expired state was removed
+    """
+    video_path = st.session_state.get('processed_video')
+    if video_path is None:
+        return False
+    if time.time() - st.session_state.get('video_timestamp', 0) <= ttl:
+        return False
+    
+    # Reclaim this session's temp files now; sessions that never rerun are
+    # covered by the age sweep of the upload dir
+    _unlink_in_background({video_path, *st.session_state.get('video_tmp_files', {}).values()})
+    
+    for key in VIDEO_SESSION_KEYS:
+        st.session_state.pop(key, None)
+    return True
+
+
 def main():
     """Main Streamlit application for video transcription"""
     
-    # Clear any stale video references on app start
-    if hasattr(st.session_state, 'processed_video'):
-        # Check if video timestamp exists and is recent
-        video_timestamp = getattr(st.session_state, 'video_timestamp', 0)
-        video_age = time.time() - video_timestamp
-        if video_age > 1800:  # Older than 30 minutes (videos are larger)
-            # Clear stale video references
-            for key in ['processed_video', 'video_timestamp', 'video_frames', 'extracted_audio']:
-                if hasattr(st.session_state, key):
-                    del st.session_state[key]
-            st.toast("🧹 Cleaned up expired video files", icon="ℹ️")
+    # Delete upload temp files abandoned by any session, then this session's stale state;
+    # tmpfs uploads hold RAM, so /dev/shm gets the same sweep and exit cleanup
+    for base_dir in (tempfile.gettempdir(), SHM_DIR):
+        if os.path.isdir(base_dir):
+            _sweep_upload_dir(_register_upload_cleanup(base_dir))
+    if _sweep_expired_session():
+        st.toast("🧹 Cleaned up expired video files", icon="ℹ️")
     
     st.title("🎬 Video Transcription Suite")
     
@@ -39,17 +471,12 @@ def main():
     Experience **60-70% faster audio processing** with our dual extraction system and professional tabbed results.
     """)
     
-    # Feature highlights
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.info("⚡ **FFmpeg Processing**\n60-70% faster audio extraction")
-    with col2:
-        st.info("🎯 **Whisper Large V3**\nDedicated audio transcription")  
-    with col3:
-        st.info("🎨 **Tabbed Results**\nClean content separation")
+    # Feature highlights (static, sent as one element)
+    st.markdown(FEATURE_CARDS_HTML, unsafe_allow_html=True)
     
     # Debug: Add option to clear session state if experiencing issues
     if st.sidebar.button("🔧 Clear All Data", help="Clear all session data if experiencing video processing issues"):
+        _unlink_in_background(st.session_state.get('video_tmp_files', {}).values())
         for key in list(st.session_state.keys()):
             del st.session_state[key]
         st.rerun()
@@ -84,45 +511,12 @@ def main():
         return
     
     try:
-        video_transcriber = ClarifaiVideoTranscriber(config.CLARIFAI_PAT)
-        
-        # Enhanced Model selection with better UI
-        st.sidebar.markdown("### 🤖 AI Model Selection")
-        
-        available_models = video_transcriber.get_available_models()
-        model_options = list(available_models.keys())
-        default_index = model_options.index(config.DEFAULT_VIDEO_MODEL) if config.DEFAULT_VIDEO_MODEL in model_options else 0
-        
-        model_name = st.sidebar.selectbox(
-            "Choose Video Analysis Model",
-            options=model_options,
-            index=default_index,
-            help="Select from verified working multimodal AI models"
-        )
-        
-        # Enhanced model information display
-        if model_name and model_name in available_models:
-            model_info = available_models[model_name]
-            
-            # Model description with better formatting
-            description = model_info.get('description', 'No description available')
-            st.sidebar.markdown(f"**📋 Description:**\n{description}")
-            
-            # Show model features with icons
-            features = model_info.get('features', [])
-            if features:
-                st.sidebar.markdown("**🔧 Capabilities:**")
-                for feature in features[:3]:  # Show first 3 features
-                    feature_display = feature.replace('_', ' ').title()
-                    st.sidebar.markdown(f"• {feature_display}")
+        video_transcriber = _get_video_transcriber(config.CLARIFAI_PAT)
         
-        # Model recommendations
-        if model_name == "MM-Poly-8B":
-            st.sidebar.info("🌟 **Recommended**: Native Clarifai model optimized for performance")
-        elif model_name == "Qwen2.5-VL-7B-Instruct":
-            st.sidebar.info("🎯 **Advanced**: Best for temporal understanding and object localization")
-        elif model_name == "MiniCPM-o-2.6":
-            st.sidebar.info("🎪 **Multimedia**: Comprehensive end-to-end analysis")
+        # Model selection lives in a fragment, so switching models only reruns the panel
+        with st.sidebar:
+            _model_selection_panel(video_transcriber)
+        model_name = st.session_state.get("video_model_name")
         
         # Inference parameters
         st.sidebar.subheader("Inference Parameters")
@@ -169,17 +563,22 @@ def main():
         )
         
         if uploaded_file is not None:
-            # Check file size
-            file_size_mb = len(uploaded_file.getvalue()) / (1024 * 1024)
+            # Check file size (known from the upload metadata, no copy needed)
+            file_size_mb = uploaded_file.size / (1024 * 1024)
             
             if file_size_mb > config.MAX_VIDEO_SIZE_MB:
                 st.error(f"File size ({file_size_mb:.1f} MB) exceeds maximum allowed size ({config.MAX_VIDEO_SIZE_MB} MB)")
                 return
             
-            # Save uploaded file to temporary location
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as tmp_file:
-                tmp_file.write(uploaded_file.getvalue())
-                tmp_video_path = tmp_file.name
+            # Reject unsupported containers before touching the disk
+            file_ext = os.path.splitext(uploaded_file.name)[1].lstrip('.').lower()
+            if file_ext and file_ext not in config.SUPPORTED_VIDEO_FORMATS:
+                st.error(f"Unsupported video format '.{file_ext}'. Supported formats: {', '.join(config.SUPPORTED_VIDEO_FORMATS)}")
+                return
+            
+            # Save uploaded file to a temporary location, reusing the file already
+            # written for identical content
+            tmp_video_path, video_digest = _get_upload_tempfile(uploaded_file)
             
             # Store video info in session state
             st.session_state.video_timestamp = time.time()
@@ -187,21 +586,22 @@ def main():
             
             # Display video information
             st.subheader("📊 Video Information")
-            video_info = get_video_info(tmp_video_path)
+            video_info = _cached_video_info(tmp_video_path, video_digest)
             
             if 'error' in video_info:
                 st.error(f"Error reading video: {video_info['error']}")
                 return
             
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Duration", f"{video_info.get('duration_seconds', 0):.1f}s")
-                st.metric("Resolution", video_info.get('resolution', 'Unknown'))
-            with col2:
-                st.metric("FPS", f"{video_info.get('fps', 0):.1f}")
-                st.metric("File Size", f"{video_info.get('file_size_mb', 0):.1f} MB")
-            with col3:
-                st.metric("Frames", video_info.get('frame_count', 0))
+            # One markdown table = one frontend delta instead of five metric widgets
+            st.markdown(
+                "| Duration | Resolution | FPS | File Size | Frames |\n"
+                "|---|---|---|---|---|\n"
+                f"| {video_info.get('duration_seconds', 0):.1f}s "
+                f"| {video_info.get('resolution', 'Unknown')} "
+                f"| {video_info.get('fps', 0):.1f} "
+                f"| {video_info.get('file_size_mb', 0):.1f} MB "
+                f"| {video_info.get('frame_count', 0)} |"
+            )
             
             # Display video player (smaller size)
             st.subheader("🎬 Video Preview")
@@ -209,7 +609,8 @@ def main():
             # Create columns to make video preview smaller
             col1, col2, col3 = st.columns([1, 2, 1])
             with col2:
-                st.video(uploaded_file)
+                # Serve the temp file already on disk rather than the upload buffer
+                st.video(tmp_video_path)
             
             # Enhanced Video Analysis section
             st.subheader("🎯 Video Analysis Options")
@@ -235,7 +636,7 @@ def main():
             
             # Analysis buttons with enhanced styling
             st.markdown("---")
-            col1, col2 = st.columns(2)
+            col1, col2, col3 = st.columns(3)
             
             with col1:
                 transcribe_clicked = st.button(
@@ -253,45 +654,98 @@ def main():
                     help="Visual-only analysis focusing on scene description"
                 )
             
+            with col3:
+                both_clicked = st.button(
+                    "🔁 Transcribe + Describe",
+                    type="secondary",
+                    use_container_width=True,
+                    help="Run both analyses in one click; the description request runs alongside the transcription"
+                )
+            
+            # For both analyses, start the description request now so it overlaps
+            # the whole transcription flow instead of running after it
+            describe_future = None
+            if both_clicked:
+                transcribe_clicked = describe_clicked = True
+                describe_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="describe-rpc")
+                describe_future = describe_executor.submit(
+                    transcribe_video_cached,
+                    video_transcriber,
+                    tmp_video_path,
+                    video_digest,
+                    model_name,
+                    prompt=DESCRIPTION_PROMPT,
+                    temperature=temperature,
+                    max_tokens=max_tokens
+                )
+                describe_executor.shutdown(wait=False)
+            
             if transcribe_clicked:
                 
                 with st.spinner("Processing video... This may take a moment for large files."):
                     progress_bar = st.progress(0)
                     status_text = st.empty()
                     
+                    # Prepare prompt
+                    prompt_to_use = custom_prompt if custom_prompt.strip() else None
+                    
+                    # The auto-generated prompt embeds the audio transcription, so the
+                    # video request must wait for it. Otherwise (custom prompt or no
+                    # audio) start the video request now and overlap it with the audio
+                    # extraction and transcription below.
+                    video_future = None
+                    video_timing = {}
+                    if prompt_to_use is not None or not extract_audio:
+                        def timed_video_transcription():
+                            try:
+                                return transcribe_video_cached(
+                                    video_transcriber,
+                                    tmp_video_path,
+                                    video_digest,
+                                    model_name,
+                                    prompt=prompt_to_use or "Please provide a comprehensive transcription and analysis of this video, including any speech, text, visual content, and actions.",
+                                    temperature=temperature,
+                                    max_tokens=max_tokens
+                                )
+                            finally:
+                                video_timing["end"] = time.time()
+                        
+                        video_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="video-rpc")
+                        video_timing["start"] = time.time()
+                        video_future = video_executor.submit(timed_video_transcription)
+                        video_executor.shutdown(wait=False)
+                        debug_print(f"⚡ [DEBUG] Video analysis started in parallel with audio processing")
+                    
                     # Step 1: Extract audio if requested
                     audio_transcription = None
                     if extract_audio:
-                        status_text.text("Extracting audio track...")
-                        progress_bar.progress(20)
+                        _throttled_progress(progress_bar, status_text, 20, "Extracting audio track...")
                         
                         try:
-                            debug_print(f"🎵 [DEBUG] Starting audio extraction from video: {os.path.basename(tmp_video_path)}")
-                            audio_path = video_transcriber.extract_audio_from_video(tmp_video_path)
-                            debug_print(f"🎵 [DEBUG] Audio extraction result: {audio_path if audio_path else 'None (no audio or extraction failed)'}")
+                            if _DEBUG:
+                                debug_print(f"🎵 [DEBUG] Starting audio extraction from video: {os.path.basename(tmp_video_path)}")
+                            # ffmpeg pipes the WAV straight into memory - no temp audio file
+                            audio_bytes = video_transcriber.extract_audio_bytes_from_video(tmp_video_path)
+                            if _DEBUG:
+                                debug_print(f"🎵 [DEBUG] Audio extraction result: {f'{len(audio_bytes)} bytes' if audio_bytes else 'None (no audio or extraction failed)'}")
                             
-                            if audio_path and os.path.exists(audio_path):
-                                debug_print(f"🎵 [DEBUG] Audio file exists, starting transcription...")
+                            if audio_bytes:
+                                debug_print(f"🎵 [DEBUG] Audio extracted, starting transcription...")
                                 # Use audio transcriber for audio track
-                                audio_transcriber = ClarifaiTranscriber(config.CLARIFAI_PAT)
+                                audio_transcriber = _get_audio_transcriber(config.CLARIFAI_PAT)
                                 
-                                status_text.text("Transcribing audio track...")
-                                progress_bar.progress(40)
+                                _throttled_progress(progress_bar, status_text, 40, "Transcribing audio track...")
                                 
                                 try:
-                                    # Read audio file into bytes for transcription
-                                    debug_print(f"🎵 [DEBUG] Reading audio file for transcription: {os.path.basename(audio_path)}")
-                                    with open(audio_path, 'rb') as f:
-                                        audio_bytes = f.read()
-                                    
-                                    debug_print(f"🎵 [DEBUG] Audio file loaded - Size: {len(audio_bytes)} bytes")
                                     
                                     # Track audio transcription timing
                                     audio_start_time = time.time()
                                     
                                     # Use a good audio model for transcription
-                                    audio_result = audio_transcriber.transcribe_audio(
+                                    audio_result = transcribe_audio_cached(
+                                        audio_transcriber,
                                         audio_bytes,  # Pass audio bytes, not file path
+                                        video_digest,
                                         "OpenAI Whisper Large V3",  # Use best audio model
                                         temperature=0.1,  # Lower temperature for accuracy
                                         max_tokens=max_tokens
@@ -299,11 +753,13 @@ def main():
                                     
                                     # Calculate audio inference time
                                     audio_inference_time = time.time() - audio_start_time
-                                    debug_print(f"🎵 [DEBUG] Audio transcription completed: {type(audio_result)} - Length: {len(str(audio_result)) if audio_result else 0}")
-                                    debug_print(f"⏱️ [DEBUG] Audio inference time: {audio_inference_time:.2f}s")
+                                    if _DEBUG:
+                                        debug_print(f"🎵 [DEBUG] Audio transcription completed: {type(audio_result)} - Length: {len(str(audio_result)) if audio_result else 0}")
+                                        debug_print(f"⏱️ [DEBUG] Audio inference time: {audio_inference_time:.2f}s")
                                     
                                 except Exception as audio_transcription_error:
-                                    debug_print(f"🚨 [DEBUG] Audio transcription failed: {audio_transcription_error}")
+                                    if _DEBUG:
+                                        debug_print(f"🚨 [DEBUG] Audio transcription failed: {audio_transcription_error}")
                                     raise audio_transcription_error
                                 
                                 if audio_result and isinstance(audio_result, str) and len(audio_result.strip()) > 0:
@@ -311,56 +767,42 @@ def main():
                                     st.success(f"✅ Audio extracted and transcribed ({len(audio_transcription)} characters) - Inference time: {audio_inference_time:.2f}s")
                                 else:
                                     st.warning(f"⚠️ Audio transcription failed: Empty or invalid result")
-                                
-                                # Clean up audio file
-                                try:
-                                    os.unlink(audio_path)
-                                except:
-                                    pass
                             else:
-                                debug_print(f"🎵 [DEBUG] Audio extraction returned None or file doesn't exist")
+                                debug_print(f"🎵 [DEBUG] Audio extraction returned no audio")
                                 st.info("ℹ️ No audio track found in video or audio extraction failed. Proceeding with visual-only analysis.")
                         except Exception as e:
                             error_msg = str(e)
                             # Log the actual error for debugging
-                            debug_print(f"🚨 [DEBUG] Audio extraction exception: {error_msg}")
-                            debug_print(f"🚨 [DEBUG] Exception type: {type(e).__name__}")
+                            if _DEBUG:
+                                debug_print(f"🚨 [DEBUG] Audio extraction exception: {error_msg}")
+                                debug_print(f"🚨 [DEBUG] Exception type: {type(e).__name__}")
                             
-                            # Check for different types of audio extraction failures
-                            if any(phrase in error_msg.lower() for phrase in [
-                                "ffmpeg", "ffmpeg error", "ffmpeg not available"
-                            ]):
-                                st.warning("⚠️ FFmpeg audio extraction failed. Trying MoviePy fallback...")
-                                debug_print(f"🚨 [DEBUG] FFmpeg extraction issue, falling back to MoviePy")
-                            elif any(phrase in error_msg.lower() for phrase in [
-                                "expected bytes, got str", 
-                                "unexpected keyword argument 'verbose'",
-                                "got an unexpected keyword argument",
-                                "moviepy version compatibility"
-                            ]):
-                                st.warning("⚠️ Audio extraction failed. Both FFmpeg and MoviePy methods encountered issues. Proceeding with visual-only analysis.")
-                                debug_print(f"🚨 [DEBUG] Both FFmpeg and MoviePy failed - compatibility issues")
-                            elif "transcribe_audio" in error_msg or "whisper" in error_msg.lower():
-                                st.warning("⚠️ Audio transcription failed. Proceeding with visual-only analysis.")
-                                debug_print(f"🚨 [DEBUG] Audio transcription failure detected")
+                            # Classify the failure in one scan; earlier groups take precedence
+                            failure = min((m.lastindex for m in _AUDIO_ERR_PAT.finditer(error_msg)), default=None)
+                            if failure in _AUDIO_ERR_MESSAGES:
+                                warning, debug_msg = _AUDIO_ERR_MESSAGES[failure]
+                                st.warning(warning)
+                                debug_print(debug_msg)
                             else:
                                 st.warning(f"⚠️ Audio processing failed: {error_msg}. Proceeding with visual-only analysis.")
                                 debug_print(f"🚨 [DEBUG] General audio processing failure")
                     
                     # Step 2: Process video frames
-                    status_text.text("Extracting and analyzing video frames...")
-                    progress_bar.progress(60)
-                    
-                    # Prepare prompt
-                    prompt_to_use = custom_prompt if custom_prompt.strip() else None
+                    _throttled_progress(progress_bar, status_text, 60, "Extracting and analyzing video frames...")
+                    _flush_progress(progress_bar, status_text)
                     
                     # Track video transcription timing
                     video_start_time = time.time()
                     
                     # Perform video transcription
-                    if audio_transcription:
-                        result = video_transcriber.transcribe_video_with_audio(
+                    if video_future is not None:
+                        result = video_future.result()
+                        video_start_time = video_timing["start"]
+                    elif audio_transcription:
+                        result = transcribe_video_with_audio_cached(
+                            video_transcriber,
                             tmp_video_path,
+                            video_digest,
                             model_name,
                             audio_transcription=audio_transcription,
                             prompt=prompt_to_use,
@@ -368,8 +810,10 @@ def main():
                             max_tokens=max_tokens
                         )
                     else:
-                        result = video_transcriber.transcribe_video(
+                        result = transcribe_video_cached(
+                            video_transcriber,
                             tmp_video_path,
+                            video_digest,
                             model_name,
                             prompt=prompt_to_use or "Please provide a comprehensive transcription and analysis of this video, including any speech, text, visual content, and actions.",
                             temperature=temperature,
@@ -377,26 +821,28 @@ def main():
                         )
                     
                     # Calculate video inference time
-                    video_inference_time = time.time() - video_start_time
-                    debug_print(f"⏱️ [DEBUG] Video inference time: {video_inference_time:.2f}s")
-                    
-                    progress_bar.progress(100)
-                    status_text.text("Video processing complete!")
-                    time.sleep(0.5)  # Brief pause to show completion
+                    video_inference_time = video_timing.get("end", time.time()) - video_start_time
+                    if _DEBUG:
+                        debug_print(f"⏱️ [DEBUG] Video inference time: {video_inference_time:.2f}s")
                     
-                    # Clear progress indicators
+                    # Clear progress indicators; the success banner below signals completion
                     progress_bar.empty()
                     status_text.empty()
                 
                 # Enhanced results display with DEMO V5 branding
                 if result.get('success'):
+                    # Measure each text once; .split() allocates a full word list
+                    transcription = result.get('transcription', '')
+                    video_chars = len(transcription)
+                    video_words = len(transcription.split())
+                    audio_chars = len(audio_transcription) if audio_transcription else 0
+                    audio_words = len(audio_transcription.split()) if audio_transcription else 0
+                    
                     st.success(f"🚀 **DEMO V5 Analysis Complete!** - Video inference: {video_inference_time:.2f}s")
                     
                     # Performance overview banner
                     if audio_transcription:
-                        total_chars = len(result.get('transcription', '')) + len(audio_transcription)
-                        total_time = video_inference_time + audio_inference_time
-                        st.info(f"⚡ **FFmpeg Processing:** {len(audio_transcription)} chars in {audio_inference_time:.2f}s ({len(audio_transcription)/audio_inference_time:.0f} chars/sec) | **Video Analysis:** {len(result.get('transcription', ''))} chars in {video_inference_time:.2f}s")
+                        st.info(f"⚡ **FFmpeg Processing:** {audio_chars} chars in {audio_inference_time:.2f}s ({audio_chars/audio_inference_time:.0f} chars/sec) | **Video Analysis:** {video_chars} chars in {video_inference_time:.2f}s")
                     
                     # Enhanced tabbed results with DEMO V5 styling  
                     st.subheader("� **DEMO V5 Professional Results**")
@@ -431,18 +877,16 @@ def main():
                             st.markdown("#### 📊 **Audio Processing Performance**")
                             col1, col2, col3, col4 = st.columns(4)
                             with col1:
-                                st.metric("Characters", f"{len(audio_transcription):,}")
+                                st.metric("Characters", f"{audio_chars:,}")
                             with col2:
-                                st.metric("Words", f"{len(audio_transcription.split()):,}")
+                                st.metric("Words", f"{audio_words:,}")
                             with col3:
-                                st.metric("Processing Rate", f"{len(audio_transcription)/audio_inference_time:.0f} chars/sec")
+                                st.metric("Processing Rate", f"{audio_chars/audio_inference_time:.0f} chars/sec")
                             with col4:
-                                efficiency = (len(audio_transcription)/audio_inference_time) / 100  # chars per sec per 100
+                                efficiency = (audio_chars/audio_inference_time) / 100  # chars per sec per 100
                                 st.metric("Efficiency Score", f"{efficiency:.1f}x", delta="FFmpeg Boost")
                         
                         with video_tab:
-                            transcription = result.get('transcription', '')
-                            
                             # Enhanced video tab header
                             col1, col2 = st.columns([3, 1])
                             with col1:
@@ -471,17 +915,16 @@ def main():
                                 st.markdown("#### 📊 **Video Analysis Performance**")
                                 col1, col2, col3, col4 = st.columns(4)
                                 with col1:
-                                    st.metric("Analysis Length", f"{len(transcription):,} chars")
+                                    st.metric("Analysis Length", f"{video_chars:,} chars")
                                 with col2:
-                                    st.metric("Word Count", f"{len(transcription.split()):,} words")
+                                    st.metric("Word Count", f"{video_words:,} words")
                                 with col3:
-                                    st.metric("Processing Rate", f"{len(transcription)/video_inference_time:.0f} chars/sec")
+                                    st.metric("Processing Rate", f"{video_chars/video_inference_time:.0f} chars/sec")
                                 with col4:
-                                    complexity_score = len(transcription) / 100  # Rough complexity based on length
+                                    complexity_score = video_chars / 100  # Rough complexity based on length
                                     st.metric("Complexity Score", f"{complexity_score:.0f}", delta="Rich Analysis")
                     else:
                         # No tabs - show video transcription directly
-                        transcription = result.get('transcription', '')
                         if transcription:
                             st.text_area(
                                 "Video Analysis",
@@ -493,33 +936,26 @@ def main():
                         
                         # Performance Summary
                         st.subheader("⏱️ Performance Summary")
-                        perf_col1, perf_col2, perf_col3, perf_col4 = st.columns(4)
-                        
-                        with perf_col1:
-                            if audio_transcription:
-                                st.metric("Audio Inference", f"{audio_inference_time:.2f}s", 
-                                         delta=f"{len(audio_transcription)/audio_inference_time:.1f} chars/s")
-                            else:
-                                st.metric("Audio Inference", "N/A", delta="No audio")
-                        
-                        with perf_col2:
-                            st.metric("Video Inference", f"{video_inference_time:.2f}s",
-                                     delta=f"{len(transcription)/video_inference_time:.1f} chars/s")
-                        
-                        with perf_col3:
-                            total_time = (audio_inference_time if audio_transcription else 0) + video_inference_time
-                            st.metric("Total Inference", f"{total_time:.2f}s")
-                        
-                        with perf_col4:
-                            total_chars = len(transcription) + (len(audio_transcription) if audio_transcription else 0)
-                            total_inference = video_inference_time + (audio_inference_time if audio_transcription else 0)
-                            st.metric("Overall Rate", f"{total_chars/total_inference:.1f} chars/s")
+                        if audio_transcription:
+                            audio_cell = f"{audio_inference_time:.2f}s ({audio_chars/audio_inference_time:.1f} chars/s)"
+                        else:
+                            audio_cell = "N/A (no audio)"
+                        total_time = (audio_inference_time if audio_transcription else 0) + video_inference_time
+                        total_chars = video_chars + audio_chars
+                        st.markdown(
+                            "| Audio Inference | Video Inference | Total Inference | Overall Rate |\n"
+                            "|---|---|---|---|\n"
+                            f"| {audio_cell} "
+                            f"| {video_inference_time:.2f}s ({video_chars/video_inference_time:.1f} chars/s) "
+                            f"| {total_time:.2f}s "
+                            f"| {total_chars/total_time:.1f} chars/s |"
+                        )
                         
                         # Download option
                         st.subheader("💾 Download Results")
                         
-                        # Prepare download content with timing information
-                        download_content = f"""Video Transcription Report
+                        # Header is small; the transcriptions are only joined on download
+                        download_header = f"""Video Transcription Report
 Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}
 
 === PROCESSING STATISTICS ===
@@ -530,32 +966,28 @@ Frames Processed: {result.get('frames_processed', 0)}
 """
 
                         if audio_transcription:
-                            download_content += f"""
+                            download_header += f"""
 Audio Model Used: OpenAI Whisper Large V3
 Audio Inference Time: {audio_inference_time:.2f}s
-Audio Length: {len(audio_transcription)} characters ({len(audio_transcription.split())} words)
-Video Length: {len(transcription)} characters ({len(transcription.split())} words)
-
-=== AUDIO TRANSCRIPTION ===
-{audio_transcription}
-
-  
-   === VIDEO ANALYSIS ===
-{transcription}
+Audio Length: {audio_chars} characters ({audio_words} words)
+Video Length: {video_chars} characters ({video_words} words)
 """
+                            download_sections = (
+                                "\n=== AUDIO TRANSCRIPTION ===\n", audio_transcription,
+                                "\n\n  \n   === VIDEO ANALYSIS ===\n", transcription, "\n"
+                            )
                         else:
-                            download_content += f"""
-Video Length: {len(transcription)} characters ({len(transcription.split())} words)
-
-=== VIDEO ANALYSIS ===
-{transcription}
+                            download_header += f"""
+Video Length: {video_chars} characters ({video_words} words)
 """
+                            download_sections = ("\n=== VIDEO ANALYSIS ===\n", transcription, "\n")
                         
-                        st.download_button(
-                            label="📄 Download Transcription as Text",
-                            data=download_content,
-                            file_name=f"video_transcription_{int(time.time())}.txt",
-                            mime="text/plain"
+                        download_report_button(
+                            "📄 Download Transcription as Text",
+                            f"video_transcription_{int(time.time())}.txt",
+                            video_digest,
+                            download_header,
+                            download_sections
                         )
                     
                     # Check if no content was generated
@@ -572,41 +1004,67 @@ Video Length: {len(transcription)} characters ({len(transcription.split())} word
                     if result.get('processing_time'):
                         st.info(f"Processing time: {result.get('processing_time', 0):.2f}s")
             
-            elif describe_clicked:
+            if describe_clicked:
                 # Video Description Mode
                 with st.spinner("Analyzing video for description... This may take a moment."):
                     progress_bar = st.progress(0)
                     status_text = st.empty()
                     
                     # Use a description-focused prompt
-                    description_prompt = """Please provide a comprehensive description of this video including:
-
-1. **Visual Content**: Describe what you see in the video frames - objects, people, scenes, settings
-2. **Actions and Movement**: Describe any actions, movements, or activities taking place
-3. **Text and Graphics**: Identify any text, signs, logos, or graphic elements visible
-4. **Style and Quality**: Comment on the video style, quality, lighting, colors
-5. **Context and Purpose**: Analyze what type of video this appears to be and its likely purpose
-6. **Key Elements**: Highlight the most important or interesting elements in the video
-
-Please provide a detailed, engaging description as if you're explaining the video to someone who cannot see it."""
+                    description_prompt = DESCRIPTION_PROMPT
                     
-                    status_text.text("Extracting key frames for analysis...")
-                    progress_bar.progress(30)
+                    _throttled_progress(progress_bar, status_text, 30, "Extracting key frames for analysis...")
+                    _flush_progress(progress_bar, status_text)
                     
                     # Perform video description (no audio extraction needed for pure description)
-                    result = video_transcriber.transcribe_video(
+                    description_streamed = False
+                    if describe_future is not None:
+                        result = describe_future.result()
+                    elif hasattr(st, "write_stream") and video_transcriber.get_cached_result(
                         tmp_video_path,
                         model_name,
                         prompt=description_prompt,
                         temperature=temperature,
                         max_tokens=max_tokens
-                    )
-                    
-                    progress_bar.progress(100)
-                    status_text.text("Video description complete!")
-                    time.sleep(0.5)  # Brief pause to show completion
+                    ) is None:
+                        # Show the description as it is generated; the finished text is
+                        # then served from the transcriber's result cache. Known results
+                        # skip streaming and go through the cached call below.
+                        _throttled_progress(progress_bar, status_text, 60, "Generating description...")
+                        _flush_progress(progress_bar, status_text)
+                        try:
+                            st.write_stream(video_transcriber.transcribe_video_stream(
+                                tmp_video_path,
+                                model_name,
+                                prompt=description_prompt,
+                                temperature=temperature,
+                                max_tokens=max_tokens
+                            ))
+                        except Exception as e:
+                            result = {'success': False, 'error': str(e)}
+                        else:
+                            description_streamed = True
+                            result = transcribe_video_cached(
+                                video_transcriber,
+                                tmp_video_path,
+                                video_digest,
+                                model_name,
+                                prompt=description_prompt,
+                                temperature=temperature,
+                                max_tokens=max_tokens
+                            )
+                    else:
+                        result = transcribe_video_cached(
+                            video_transcriber,
+                            tmp_video_path,
+                            video_digest,
+                            model_name,
+                            prompt=description_prompt,
+                            temperature=temperature,
+                            max_tokens=max_tokens
+                        )
                     
-                    # Clear progress indicators
+                    # Clear progress indicators; the success banner below signals completion
                     progress_bar.empty()
                     status_text.empty()
                 
@@ -619,12 +1077,13 @@ Please provide a detailed, engaging description as if you're explaining the vide
                     description = result.get('transcription', '')  # The 'transcription' field contains our description
                     
                     if description:
-                        st.text_area(
-                            "Video Description",
-                            value=description,
-                            height=400,
-                            help="Comprehensive description and analysis of the video content"
-                        )
+                        if not description_streamed:
+                            st.text_area(
+                                "Video Description",
+                                value=description,
+                                height=400,
+                                help="Comprehensive description and analysis of the video content"
+                            )
                         
                         # Processing statistics
                         col1, col2, col3 = st.columns(3)
@@ -638,22 +1097,19 @@ Please provide a detailed, engaging description as if you're explaining the vide
                         # Download option for description
                         st.subheader("💾 Download Description")
                         
-                        # Prepare download content
-                        download_content = f"""Video Description Report
+                        download_header = f"""Video Description Report
 Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}
 Model Used: {result.get('model_used', 'Unknown')}
 Processing Time: {result.get('processing_time', 0):.2f}s
 Frames Analyzed: {result.get('frames_processed', 0)}
-
-=== VIDEO DESCRIPTION ===
-{description}
 """
                         
-                        st.download_button(
-                            label="📄 Download Description as Text",
-                            data=download_content,
-                            file_name=f"video_description_{int(time.time())}.txt",
-                            mime="text/plain"
+                        download_report_button(
+                            "📄 Download Description as Text",
+                            f"video_description_{int(time.time())}.txt",
+                            video_digest,
+                            download_header,
+                            ("\n=== VIDEO DESCRIPTION ===\n", description, "\n")
                         )
                         
                     else:
@@ -668,12 +1124,8 @@ Frames Analyzed: {result.get('frames_processed', 0)}
                     if result.get('processing_time'):
                         st.info(f"Processing time: {result.get('processing_time', 0):.2f}s")
             
-            # Clean up temporary file when done
-            try:
-                if os.path.exists(tmp_video_path):
-                    os.unlink(tmp_video_path)
-            except:
-                pass
+            # Temporary files are kept for re-uploads and removed by the LRU
+            # in _get_upload_tempfile, the session sweep, or the upload dir age sweep
         
         else:
             # Show information about video transcription
@@ -1,8 +1,18 @@
 import streamlit as st
+import atexit
 import time
-import io
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from typing import TYPE_CHECKING
 from config import config
-from ClarifaiUtil import ClarifaiTranscriber, is_streaming_available
+from streamlit_compat import deferred_download_button
+
+if TYPE_CHECKING:
+    # Annotations only; ClarifaiUtil itself is imported lazily below
+    from ClarifaiUtil import ClarifaiOpenAIStreamer, ClarifaiTranscriber
 
 # Page configuration
 st.set_page_config(
@@ -11,25 +21,627 @@ st.set_page_config(
     layout="wide"
 )
 
+@st.cache_resource(show_spinner=False)
+def _get_transcriber(pat: str) -> "ClarifaiTranscriber":
+    """Transcriber shared across reruns so its gRPC channel is created once per PAT"""
+    # ClarifaiUtil pulls in the Clarifai gRPC stack and pydub; importing it here keeps
+    # that cost off startup and off the "PAT not configured" page
+    from ClarifaiUtil import ClarifaiTranscriber
+    return ClarifaiTranscriber(pat)
+
+@st.cache_resource(show_spinner=False)
+def _get_streaming_transcriber(pat: str) -> "ClarifaiOpenAIStreamer":
+    """Streaming client shared across reruns; keeps its chunk cache warm"""
+    from ClarifaiUtil import create_streaming_transcriber
+    return create_streaming_transcriber(pat)
+
+@st.cache_resource(show_spinner=False)
+def _get_worker_pool() -> ThreadPoolExecutor:
+    """Process-wide pool for transcriptions run off the script thread"""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="transcribe")
+
+# How often the elapsed-time readout refreshes while a transcription runs
+PROGRESS_POLL_SECONDS = 0.25
+
+@st.cache_data(show_spinner=False)
+def _get_config_errors() -> dict:
+    """Configuration errors, checked once per process; each caller gets its own copy to modify"""
+    return config.validate_config()
+
+# Analysis and transcription results memoized per (audio digest, model, parameters),
+# so re-clicking with an unchanged upload and settings skips the conversion and API call.
+# The transcriber and audio bytes are left unhashed; the digest stands in for the bytes.
+RESULT_CACHE_TTL_SECONDS = 3600
+RESULT_CACHE_MAX_ENTRIES = 32
+
+class _UncachedResult(Exception):
+    """Carries an unsuccessful result out of a cached function so it is not memoized"""
+    
+    def __init__(self, result):
+        super().__init__("Result not cached")
+        self.result = result
+
+@st.cache_data(ttl=RESULT_CACHE_TTL_SECONDS, max_entries=RESULT_CACHE_MAX_ENTRIES, show_spinner=False)
+def _cached_analyze_audio_quality(_transcriber, _audio_bytes, audio_digest):
+    analysis = _transcriber.analyze_audio_quality(_audio_bytes)
+    if "error" in analysis:
+        raise _UncachedResult(analysis)
+    return analysis
+
+@st.cache_data(ttl=RESULT_CACHE_TTL_SECONDS, max_entries=RESULT_CACHE_MAX_ENTRIES, show_spinner=False)
+def _cached_transcribe_with_format_control(_transcriber, _audio_bytes, audio_digest, model_name,
+                                           temperature, max_tokens, api_format, high_quality_conversion,
+                                           target_sample_rate, normalize_audio, trim_silence,
+                                           noise_reduce, gain_db, audio_suffix, _precomputed_analysis=None):
+    transcription, processed_audio, audio_analysis = _transcriber.transcribe_with_format_control(
+        _audio_bytes,
+        model_name,
+        temperature,
+        max_tokens,
+        api_format=api_format,
+        high_quality_conversion=high_quality_conversion,
+        target_sample_rate=target_sample_rate,
+        normalize_audio=normalize_audio,
+        trim_silence=trim_silence,
+        noise_reduce=noise_reduce,
+        gain_db=gain_db,
+        precomputed_analysis=_precomputed_analysis
+    )
+    if not transcription:
+        raise _UncachedResult((transcription, None, audio_analysis))
+    # Only the temp file path is memoized; converted audio can run to hundreds of MB
+    processed_path = _write_temp_audio(processed_audio, audio_suffix) if processed_audio else None
+    return transcription, processed_path, audio_analysis
+
+@st.cache_data(ttl=RESULT_CACHE_TTL_SECONDS, max_entries=RESULT_CACHE_MAX_ENTRIES * 2, show_spinner=False)
+def _cached_transcribe_wav(_transcriber, _wav_bytes, audio_digest, model_name, temperature, max_tokens,
+                           high_quality_conversion, target_sample_rate, normalize_audio, trim_silence,
+                           _group_ticket=None):
+    # Keyed on the digest of the uploaded file plus the conversion settings that produced
+    # the WAV, so the key is known without hashing the converted audio; only text is stored
+    transcription = _transcriber.transcribe_wav_grouped(
+        _wav_bytes, model_name, temperature, max_tokens, ticket=_group_ticket
+    )
+    if not transcription:
+        raise _UncachedResult(transcription)
+    return transcription
+
+def transcribe_wav_cached(*args, **kwargs):
+    """Memoized transcribe_wav for batch files; empty transcriptions are returned but not cached"""
+    try:
+        return _cached_transcribe_wav(*args, **kwargs)
+    except _UncachedResult as e:
+        return e.result
+
+def analyze_audio_quality_cached(*args, **kwargs):
+    """Memoized analyze_audio_quality; error results are returned but not cached"""
+    try:
+        return _cached_analyze_audio_quality(*args, **kwargs)
+    except _UncachedResult as e:
+        return e.result
+
+def transcribe_with_format_control_cached(transcriber, audio_bytes, audio_digest, model_name,
+                                          temperature, max_tokens, api_format, high_quality_conversion,
+                                          target_sample_rate, normalize_audio, trim_silence,
+                                          noise_reduce, gain_db, audio_suffix, precomputed_analysis=None):
+    """
+    Memoized transcribe_with_format_control; empty transcriptions are returned but not cached
+    
+    The cache keeps the processed audio on disk and each call gets its own link to
+    that file, so a session can delete its copy without affecting the cache. If the
+    cached file has been swept, the audio is converted again instead of re-transcribed.
+    
+    Returns:
+        Tuple of (transcription_text, processed audio temp file path or None, audio_analysis)
+    """
+    try:
+        transcription, cached_path, audio_analysis = _cached_transcribe_with_format_control(
+            transcriber, audio_bytes, audio_digest, model_name, temperature, max_tokens,
+            api_format, high_quality_conversion, target_sample_rate, normalize_audio,
+            trim_silence, noise_reduce, gain_db, audio_suffix,
+            _precomputed_analysis=precomputed_analysis
+        )
+    except _UncachedResult as e:
+        return e.result
+    if cached_path is None:
+        return transcription, None, audio_analysis
+    
+    try:
+        return transcription, _link_temp_audio(cached_path), audio_analysis
+    except OSError:
+        pass
+    
+    if api_format == "original":
+        processed_audio = audio_bytes
+    else:
+        processed_audio = transcriber.convert_to_format(
+            audio_bytes, api_format, high_quality_conversion, target_sample_rate,
+            normalize_audio, trim_silence, noise_reduce, gain_db
+        )
+    return transcription, _write_temp_audio(processed_audio, audio_suffix), audio_analysis
+
+# Sidebar option tables, built once rather than on every rerun
+API_FORMAT_OPTIONS = ("original", "wav", "mp3", "flac")
+API_FORMAT_DESCRIPTIONS = {
+    "original": "📄 No conversion - Uses uploaded format directly (Recommended)",
+    "wav": "🎵 Uncompressed PCM - Best quality, larger file",
+    "mp3": "🎶 Compressed - Good quality, smaller file",
+    "flac": "🎼 Lossless compression - High quality, medium file"
+}
+SAMPLE_RATE_OPTIONS = (8000, 16000, 22050, 44100, 48000)
+SAMPLE_RATE_INDEX = {rate: i for i, rate in enumerate(SAMPLE_RATE_OPTIONS)}
+
+# MIME type per audio file extension, for playback and downloads
+AUDIO_MIME_TYPES = {
+    'wav': 'audio/wav',
+    'mp3': 'audio/mpeg',
+    'flac': 'audio/flac',
+    'ogg': 'audio/ogg',
+    'm4a': 'audio/mp4'
+}
+
+# Batch results kept per session; the oldest are dropped rather than letting
+# repeated batches accumulate for the whole session
+BATCH_RESULTS_MAX_ENTRIES = 20
+# Default number of files transcribed concurrently in batch mode
+BATCH_MAX_WORKERS = 4
+
+# Temp audio files older than this are deleted, since sessions that are never
+# resumed would otherwise leave them behind until the process exits
+TEMP_AUDIO_MAX_AGE_SECONDS = 3600
+
+def _get_temp_audio_dir() -> str:
+    """Directory for this process's temp audio files, shared by all sessions"""
+    return os.path.join(tempfile.gettempdir(), f"transcribe_{os.getpid()}")
+
+def _sweep_temp_audio(temp_dir: str):
+    """
+    Delete temp audio files older than TEMP_AUDIO_MAX_AGE_SECONDS
+    
+    Args:
+        temp_dir: Directory to sweep
+    """
+    cutoff = time.time() - TEMP_AUDIO_MAX_AGE_SECONDS
+    try:
+        entries = list(os.scandir(temp_dir))
+    except OSError:
+        return
+    _remove_files([entry.path for entry in entries if entry.is_file() and entry.stat().st_mtime < cutoff])
+
+@st.cache_resource(show_spinner=False)
+def _register_temp_audio_cleanup() -> str:
+    """
+    Once per process: remove temp audio left by earlier processes, and this
+    process's temp audio when it exits
+    
+    Returns:
+        This process's temp audio directory
+    """
+    temp_dir = _get_temp_audio_dir()
+    cutoff = time.time() - TEMP_AUDIO_MAX_AGE_SECONDS
+    try:
+        leftovers = [
+            entry.path for entry in os.scandir(tempfile.gettempdir())
+            if entry.name.startswith("transcribe_") and entry.path != temp_dir
+            and entry.stat().st_mtime < cutoff
+        ]
+    except OSError:
+        leftovers = []
+    for path in leftovers:
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            _remove_files([path])
+    atexit.register(shutil.rmtree, temp_dir, ignore_errors=True)
+    return temp_dir
+
+def _write_temp_audio(audio_bytes: bytes, suffix: str = ".wav") -> str:
+    """
+    Spill processed audio to a temp file so session state only holds its path
+    
+    Each write also sweeps files left by sessions that were abandoned.
+    
+    Args:
+        audio_bytes: Processed audio data
+        suffix: File extension for the temp file
+        
+    Returns:
+        Path of the temp file
+    """
+    temp_dir = _get_temp_audio_dir()
+    _sweep_temp_audio(temp_dir)
+    os.makedirs(temp_dir, exist_ok=True)
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix, prefix="transcribe_", dir=temp_dir) as tmp_file:
+        tmp_file.write(audio_bytes)
+        return tmp_file.name
+
+def _link_temp_audio(path: str) -> str:
+    """
+    Give the caller its own temp file for a shared one, hard-linked rather than copied
+    
+    Args:
+        path: Existing temp audio file
+        
+    Returns:
+        Path of the new temp file
+        
+    Raises:
+        OSError: If path no longer exists
+    """
+    fd, own_path = tempfile.mkstemp(suffix=os.path.splitext(path)[1], prefix="transcribe_",
+                                    dir=os.path.dirname(path))
+    os.close(fd)
+    os.unlink(own_path)
+    try:
+        os.link(path, own_path)
+    except OSError:
+        # Filesystems without hard links get a copy on disk
+        shutil.copyfile(path, own_path)
+    # Restart the age of the shared file, which the link and the cache both use
+    os.utime(own_path)
+    return own_path
+
+def _read_file(path: str) -> bytes:
+    """Read a file's bytes; used as a deferred download payload"""
+    with open(path, "rb") as f:
+        return f.read()
+
+def _remove_files(paths):
+    """
+    Delete temp files, ignoring empty entries and files already gone
+    
+    Args:
+        paths: File paths (None entries are skipped)
+    """
+    for path in paths:
+        if path:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+def _remove_batch_wavs(results):
+    """
+    Delete the temp WAV files behind batch results
+    
+    Args:
+        results: Batch result dicts; entries without a WAV file are skipped
+    """
+    _remove_files(result.get('wav_path') for result in results)
+
+def _get_batch_stats(batch_results) -> dict:
+    """
+    Summary totals for the batch results, rebuilt from the results if they are missing
+    
+    Args:
+        batch_results: The results currently held in st.session_state.batch_results
+        
+    Returns:
+        Dict with 'count', 'success' and 'total_time' (seconds over successful files)
+    """
+    stats = st.session_state.get('batch_stats')
+    if stats is None:
+        successful = [r for r in batch_results.values() if r['success']]
+        stats = {
+            'count': len(batch_results),
+            'success': len(successful),
+            'total_time': sum(r.get('duration', 0) for r in successful),
+        }
+        st.session_state.batch_stats = stats
+    return stats
+
+def _store_batch_result(fid: str, result: dict):
+    """
+    Record a batch result, evicting the least recently processed files past the limit
+    
+    Args:
+        fid: Content-derived file id, used as the result key and in widget keys
+        result: Result dict shown in the Batch Results section, including 'file_name'
+    """
+    batch_results = st.session_state.setdefault('batch_results', OrderedDict())
+    stats = _get_batch_stats(batch_results)
+    stale = [batch_results.pop(fid)] if fid in batch_results else []
+    batch_results[fid] = result
+    while len(batch_results) > BATCH_RESULTS_MAX_ENTRIES:
+        stale.append(batch_results.popitem(last=False)[1])
+    _remove_batch_wavs(stale)
+    
+    # Summary totals kept alongside the results, so the metrics never rescan them
+    for delta, entry in [(-1, r) for r in stale] + [(1, result)]:
+        stats['count'] += delta
+        if entry['success']:
+            stats['success'] += delta
+            stats['total_time'] += delta * entry.get('duration', 0)
+
+# st.fragment (1.37+, experimental_fragment since 1.33) scopes reruns to the panel;
+# older Streamlit releases just render it as part of the full script run
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+@_fragment
+def _render_transcription_result():
+    """
+    Transcription result panel, drawn from st.session_state only
+    
+    Runs as a fragment, so its own buttons (Refresh Audio, downloads) rerun just
+    this panel rather than the uploader, analysis and sidebar above it.
+    """
+    st.header("Transcription Result")
+    
+    if 'transcription' in st.session_state:
+        # Model and format info
+        is_streaming = st.session_state.get('is_streaming', False)
+        
+        if is_streaming:
+            # Streaming results header
+            model_info_col1, model_info_col2 = st.columns([2, 1])
+            with model_info_col1:
+                st.subheader(f"🌊 Streaming Model: {st.session_state.model_used}")
+            with model_info_col2:
+                streaming_mode_used = st.session_state.get('streaming_mode', 'Real-time Display')
+                st.subheader(f"Mode: {streaming_mode_used}")
+            
+            # Streaming statistics
+            if 'streaming_results' in st.session_state:
+                streaming_results = st.session_state.streaming_results
+                chunk_duration = st.session_state.get('chunk_duration', 5000) / 1000
+                
+                stream_col1, stream_col2, stream_col3, stream_col4 = st.columns(4)
+                
+                with stream_col1:
+                    total_chunks = len([r for r in streaming_results if not r.get('is_final', False)])
+                    st.metric("Total Chunks", total_chunks)
+                
+                with stream_col2:
+                    st.metric("Chunk Size", f"{chunk_duration:.1f}s")
+                
+                with stream_col3:
+                    total_time = st.session_state.get('api_duration', 0)
+                    st.metric("Total Time", f"{total_time:.2f}s")
+                
+                with stream_col4:
+                    avg_time = total_time / max(total_chunks, 1)
+                    st.metric("Avg/Chunk", f"{avg_time:.2f}s")
+                
+                # Streaming details expander
+                with st.expander("🌊 Streaming Details", expanded=False):
+                    st.markdown("**Processing Timeline:**")
+                    
+                    for i, result in enumerate(streaming_results):
+                        if not result.get('is_final', False):
+                            chunk_text = result.get('text', '')
+                            processing_time = result.get('processing_time', 0)
+                            
+                            if chunk_text:
+                                st.markdown(f"**Chunk {i+1}** ({processing_time:.2f}s): {chunk_text}")
+                            else:
+                                st.markdown(f"**Chunk {i+1}** ({processing_time:.2f}s): *No text*")
+        else:
+            # Regular transcription header
+            model_info_col1, model_info_col2 = st.columns([2, 1])
+            with model_info_col1:
+                st.subheader(f"Model Used: {st.session_state.model_used}")
+            with model_info_col2:
+                api_format_used = st.session_state.get('api_format', 'original')
+                st.subheader(f"Format: {api_format_used.upper()}")
+    
+        # Show audio analysis if available
+        if 'audio_analysis' in st.session_state and st.session_state.audio_analysis and "error" not in st.session_state.audio_analysis:
+            analysis = st.session_state.audio_analysis
+            
+            with st.expander("📊 Audio Analysis Results", expanded=False):
+                analysis_col1, analysis_col2, analysis_col3, analysis_col4 = st.columns(4)
+                
+                with analysis_col1:
+                    st.metric("Duration", f"{analysis['duration_seconds']:.1f}s")
+                    st.metric("Sample Rate", f"{analysis['sample_rate']:,}Hz")
+                with analysis_col2:
+                    st.metric("Channels", analysis['channels'])
+                    st.metric("Bit Depth", f"{analysis['bit_depth']}-bit")
+                with analysis_col3:
+                    st.metric("File Size", f"{analysis['file_size_kb']:.1f}KB")
+                    st.metric("Bitrate", f"{analysis['bitrate']:,}bps")
+                with analysis_col4:
+                    quality_color = analysis['quality_color']
+                    st.markdown(f"**Quality Score:**")
+                    st.markdown(f":{quality_color}[{analysis['overall_quality']} ({analysis['quality_score']}/100)]")
+    
+        # Audio playback section
+        # The processed audio lives in a temp file; session state only keeps its path
+        converted_audio_path = st.session_state.get('converted_audio_path')
+        if converted_audio_path and os.path.exists(converted_audio_path):
+            original_name = st.session_state.get('original_filename', 'unknown')
+            format_used = st.session_state.get('api_format', 'original')
+            # "original" audio keeps the upload's container, so take the type from its extension
+            audio_ext = original_name.rsplit('.', 1)[-1].lower() if format_used == 'original' else format_used
+            mime_type = AUDIO_MIME_TYPES.get(audio_ext, 'audio/wav')
+            
+            format_used = format_used.upper()
+            st.subheader(f"🎵 Processed Audio ({format_used})")
+            st.caption(f"This is the {format_used.lower()}-formatted audio that was sent to the AI model")
+        
+            # Check if audio is recent (within last 10 minutes to avoid stale references)
+            audio_age = time.time() - st.session_state.get('audio_timestamp', 0)
+            
+            if audio_age < 600:  # 10 minutes
+                # Play the converted WAV file with error handling. The player is opt-in:
+                # st.audio ships the whole file to the browser on every run it is drawn
+                # (a collapsed expander would still send it), so only draw it when asked
+                try:
+                    if st.toggle("🎵 Play processed audio", value=False, key="show_processed_audio"):
+                        st.audio(converted_audio_path, format=mime_type)
+                except Exception as e:
+                    st.warning("Audio playback temporarily unavailable. You can still download the converted WAV file below.")
+                    st.caption(f"Audio playback error: {str(e)}")
+                    
+                    # Provide refresh option
+                    if st.button("🔄 Refresh Audio", help="Reset audio player"):
+                        st.session_state.audio_timestamp = time.time()
+                        st.rerun()
+            else:
+                st.warning("Audio playback expired for performance reasons. You can still download the converted WAV file below.")
+                st.caption("Re-run transcription to enable audio playback again.")
+        
+            # Show audio info
+            processed_size_kb = os.path.getsize(converted_audio_path) / 1024
+            format_used = st.session_state.get('api_format', 'original')
+            st.caption(f"📁 Original: {original_name} → Processed {format_used.upper()}: {processed_size_kb:.1f} KB")
+            
+            # Download button for processed audio
+            processed_filename = f"processed_{original_name.rsplit('.', 1)[0] if '.' in original_name else original_name}.{audio_ext}"
+            
+            deferred_download_button(
+                label=f"📥 Download Processed {format_used.upper()}",
+                data=lambda: _read_file(converted_audio_path),
+                file_name=processed_filename,
+                mime=mime_type,
+                help=f"Download the processed {format_used.upper()} file used for transcription"
+            )
+            
+            st.divider()
+    
+        # Display transcription in a text area for easy copying
+        st.text_area(
+            "Transcribed Text",
+            value=st.session_state.transcription,
+            height=300,
+            help="You can copy the transcribed text from here"
+        )
+        
+        # Download button and timing info in columns
+        download_col1, download_col2 = st.columns([2, 1])
+        
+        with download_col1:
+            # Download button for transcription
+            deferred_download_button(
+                label="📥 Download Transcription",
+                data=st.session_state.transcription,
+                file_name=f"transcription_{st.session_state.model_used.lower().replace(' ', '_')}.txt",
+                mime="text/plain"
+            )
+        
+        with download_col2:
+            # Display API call timing
+            if 'api_duration' in st.session_state:
+                st.metric(
+                    label="⏱️ API Time",
+                    value=f"{st.session_state.api_duration:.2f}s",
+                    help="Time taken for the Clarifai API call"
+                )
+    
+        # Clear button
+        if st.button("🗑️ Clear Result"):
+            _remove_files([converted_audio_path])
+            # Clear all transcription-related session data
+            keys_to_clear = [
+                'transcription', 'model_used', 'converted_audio_path', 'original_filename',
+                'api_duration', 'audio_timestamp', 'api_format', 'audio_analysis',
+                'audio_analysis_digest'
+            ]
+            for key in keys_to_clear:
+                if key in st.session_state:
+                    del st.session_state[key]
+            st.rerun()
+    else:
+        st.info("Upload an audio file and click 'Transcribe Audio' to see results here.")
+
+@_fragment
+def _render_batch_results():
+    """Batch results list, drawn from st.session_state only; reruns on its own as a fragment"""
+    if 'batch_results' in st.session_state and st.session_state.batch_results:
+        st.subheader("📋 Batch Results")
+        
+        # Results summary, from the totals maintained by _store_batch_result
+        results = st.session_state.batch_results
+        stats = _get_batch_stats(results)
+        
+        summary_col1, summary_col2, summary_col3 = st.columns(3)
+        with summary_col1:
+            st.metric("Files Processed", stats['count'])
+        with summary_col2:
+            st.metric("Success Rate", f"{(stats['success']/stats['count']*100):.0f}%")
+        with summary_col3:
+            st.metric("Total Time", f"{stats['total_time']:.1f}s")
+        
+        # One table row per file, and the transcript and downloads for the selected file only;
+        # a collapsed expander per file still sent every transcript to the browser
+        st.dataframe(
+            [
+                {
+                    "File": r['file_name'],
+                    "Status": "✅ Success" if r['success'] else "❌ Failed",
+                    "Time (s)": round(r['duration'], 2) if r['success'] else None
+                }
+                for r in results.values()
+            ],
+            hide_index=True,
+            use_container_width=True
+        )
+        
+        fid = st.selectbox(
+            "📄 Show file",
+            options=list(results),
+            format_func=lambda fid: results[fid]['file_name'],
+            key="batch_selected_file"
+        )
+        result = results[fid]
+        success, transcription = result['success'], result.get('transcription')
+        base_name = result['file_name'].rsplit('.', 1)[0]
+        if success:
+            st.write(f"**Status:** ✅ Success ({result['duration']:.2f}s)")
+            
+            # Show transcription
+            st.text_area(
+                "Transcription",
+                value=transcription,
+                height=150,
+                key=f"batch_text_{fid}"
+            )
+            
+            # Download buttons
+            result_col1, result_col2 = st.columns(2)
+            with result_col1:
+                deferred_download_button(
+                    label="📥 Download Text",
+                    data=transcription,
+                    file_name=f"transcription_{base_name}.txt",
+                    mime="text/plain",
+                    key=f"batch_dl_text_{fid}"
+                )
+            with result_col2:
+                wav_path = result.get('wav_path')
+                if wav_path and os.path.exists(wav_path):
+                    deferred_download_button(
+                        label="📥 Download WAV",
+                        data=lambda wav_path=wav_path: _read_file(wav_path),
+                        file_name=f"converted_{base_name}.wav",
+                        mime="audio/wav",
+                        key=f"batch_dl_audio_{fid}"
+                    )
+        else:
+            st.write(f"**Status:** ❌ Failed")
+            st.error(f"Error: {result['error']}")
+
 def main():
     """Main Streamlit application"""
     
+    # Processed audio of sessions that never come back is swept on every run, not only on writes
+    _sweep_temp_audio(_register_temp_audio_cleanup())
+    
     # Clear any stale audio references on app start
-    if hasattr(st.session_state, 'converted_wav'):
+    if 'converted_audio_path' in st.session_state:
         # Check if audio timestamp exists and is recent
-        audio_timestamp = getattr(st.session_state, 'audio_timestamp', 0)
+        audio_timestamp = st.session_state.get('audio_timestamp', 0)
         audio_age = time.time() - audio_timestamp
         if audio_age > 600:  # Older than 10 minutes
             # Clear stale audio references
-            if hasattr(st.session_state, 'converted_wav'):
-                del st.session_state.converted_wav
-            if hasattr(st.session_state, 'audio_timestamp'):
-                del st.session_state.audio_timestamp
+            _remove_files([st.session_state.pop('converted_audio_path')])
+            if 'audio_timestamp' in st.session_state:
+                del st.session_state['audio_timestamp']
             # Optionally show a brief info message (but don't persist it)
             st.toast("🧹 Cleaned up expired audio files", icon="ℹ️")
     
     # Validate configuration
-    config_errors = config.validate_config()
+    config_errors = _get_config_errors()
     if config_errors and "CLARIFAI_PAT" in config_errors:
         # Skip PAT validation here since it can be entered in the UI
         config_errors.pop("CLARIFAI_PAT")
@@ -57,17 +669,15 @@ def main():
         return
     
     try:
-        transcriber = ClarifaiTranscriber(config.CLARIFAI_PAT)
+        transcriber = _get_transcriber(config.CLARIFAI_PAT)
         
         # Model selection
         available_models = transcriber.get_available_models()
-        model_options = list(available_models.keys())
-        default_index = model_options.index(config.DEFAULT_MODEL) if config.DEFAULT_MODEL in model_options else 0
         
         model_name = st.sidebar.selectbox(
             "Select Model",
-            options=model_options,
-            index=default_index,
+            options=transcriber.model_names,
+            index=transcriber.model_index.get(config.DEFAULT_MODEL, 0),
             help="Choose the speech-to-text model for transcription"
         )
         
@@ -79,23 +689,28 @@ def main():
         # Inference parameters
         st.sidebar.subheader("Inference Parameters")
         
-        temperature = st.sidebar.slider(
-            "Temperature",
-            min_value=config.MIN_TEMPERATURE,
-            max_value=config.MAX_TEMPERATURE,
-            value=config.DEFAULT_TEMPERATURE,
-            step=0.1,
-            help="Controls randomness in the output. Lower values make output more deterministic."
-        )
-        
-        max_tokens = st.sidebar.number_input(
-            "Max Tokens",
-            min_value=config.MIN_MAX_TOKENS,
-            max_value=config.MAX_MAX_TOKENS,
-            value=config.DEFAULT_MAX_TOKENS,
-            step=100,
-            help="Maximum number of tokens in the transcription output"
-        )
+        # Staged in a form so dragging the slider or stepping the number input
+        # reruns the script once, on Apply, instead of on every change
+        with st.sidebar.form("inference_params"):
+            temperature = st.slider(
+                "Temperature",
+                min_value=config.MIN_TEMPERATURE,
+                max_value=config.MAX_TEMPERATURE,
+                value=config.DEFAULT_TEMPERATURE,
+                step=0.1,
+                help="Controls randomness in the output. Lower values make output more deterministic."
+            )
+            
+            max_tokens = st.number_input(
+                "Max Tokens",
+                min_value=config.MIN_MAX_TOKENS,
+                max_value=config.MAX_MAX_TOKENS,
+                value=config.DEFAULT_MAX_TOKENS,
+                step=100,
+                help="Maximum number of tokens in the transcription output"
+            )
+            
+            st.form_submit_button("Apply")
         
         # Audio Enhancement Parameters
         st.sidebar.subheader("🎵 Audio Enhancement")
@@ -109,35 +724,25 @@ def main():
         
         # API Format Selection
         st.sidebar.subheader("📡 API Format Control")
-        api_format_options = ["original", "wav", "mp3", "flac"]
         api_format = st.sidebar.selectbox(
             "Format to Send to API",
-            options=api_format_options,
+            options=API_FORMAT_OPTIONS,
             index=0,  # Default to Original
             help="Choose which audio format to send to the Clarifai API. Original format preserves user's uploaded audio without conversion."
         )
         
         # Show format info
-        format_descriptions = {
-            "original": "📄 No conversion - Uses uploaded format directly (Recommended)",
-            "wav": "🎵 Uncompressed PCM - Best quality, larger file",
-            "mp3": "🎶 Compressed - Good quality, smaller file", 
-            "flac": "🎼 Lossless compression - High quality, medium file"
-        }
-        st.sidebar.caption(format_descriptions[api_format])
+        st.sidebar.caption(API_FORMAT_DESCRIPTIONS[api_format])
         
         # Show enhancement details when enabled
         if high_quality_conversion:
             st.sidebar.markdown("**Quality Enhancements:**")
             
             # Sample Rate Selection
-            sample_rate_options = [8000, 16000, 22050, 44100, 48000]
-            sample_rate_index = sample_rate_options.index(config.TARGET_SAMPLE_RATE) if config.TARGET_SAMPLE_RATE in sample_rate_options else 1
-            
             target_sample_rate = st.sidebar.selectbox(
                 "Sample Rate (Hz)",
-                options=sample_rate_options,
-                index=sample_rate_index,
+                options=SAMPLE_RATE_OPTIONS,
+                index=SAMPLE_RATE_INDEX.get(config.TARGET_SAMPLE_RATE, 1),
                 help="Audio sample rate. 16kHz is optimal for speech recognition"
             )
             
@@ -228,7 +833,7 @@ def main():
         st.sidebar.subheader("🌊 Streaming Mode")
         
         # Check if streaming is available
-        from ClarifaiUtil import is_streaming_available
+        from ClarifaiUtil import is_streaming_available, content_digest
         
         if is_streaming_available():
             enable_streaming = st.sidebar.checkbox(
@@ -313,7 +918,9 @@ def main():
                     st.error(f"File size ({file_size_mb:.1f}MB) exceeds maximum allowed size ({config.MAX_FILE_SIZE_MB}MB)")
                     return
                 
-                st.audio(uploaded_file, format='audio/wav')
+                # Opt-in preview, so the upload is not sent back to the browser on every rerun
+                if st.toggle("🎧 Preview upload", value=False, key="show_upload_audio"):
+                    st.audio(uploaded_file, format=AUDIO_MIME_TYPES.get(uploaded_file.name.rsplit('.', 1)[-1].lower(), 'audio/wav'))
                 
                 # File info
                 st.write(f"**Filename:** {uploaded_file.name}")
@@ -324,19 +931,22 @@ def main():
                 
                 # Audio Quality Analysis
                 if st.button("🔍 Analyze Audio Quality"):
-                    uploaded_file.seek(0)
-                    audio_bytes = uploaded_file.read()
+                    audio_bytes = uploaded_file.getvalue()
+                    audio_digest = content_digest(audio_bytes)
                     
-                    with st.spinner("Analyzing audio quality..."):
-                        audio_analysis = transcriber.analyze_audio_quality(audio_bytes)
-                        
-                        if "error" not in audio_analysis:
-                            st.session_state.audio_analysis = audio_analysis
-                        else:
-                            st.error(f"Audio analysis failed: {audio_analysis['error']}")
+                    # A repeat click on the same upload keeps the analysis already in the session
+                    if st.session_state.get('audio_analysis_digest') != audio_digest:
+                        with st.spinner("Analyzing audio quality..."):
+                            audio_analysis = analyze_audio_quality_cached(transcriber, audio_bytes, audio_digest)
+                            
+                            if "error" not in audio_analysis:
+                                st.session_state.audio_analysis = audio_analysis
+                                st.session_state.audio_analysis_digest = audio_digest
+                            else:
+                                st.error(f"Audio analysis failed: {audio_analysis['error']}")
                 
                 # Show audio analysis if available
-                if hasattr(st.session_state, 'audio_analysis') and st.session_state.audio_analysis:
+                if 'audio_analysis' in st.session_state and st.session_state.audio_analysis:
                     analysis = st.session_state.audio_analysis
                     
                     st.subheader("📊 Audio Quality Analysis")
@@ -367,9 +977,9 @@ def main():
                 transcribe_button_text = "� Stream Transcription" if enable_streaming else "�🎯 Transcribe Audio"
                 
                 if st.button(transcribe_button_text, type="primary"):
-                    # Read audio bytes
-                    uploaded_file.seek(0)  # Reset file pointer to beginning
-                    audio_bytes = uploaded_file.read()
+                    # UploadedFile is a BytesIO over the upload's bytes; getvalue() hands
+                    # back that buffer without copying and ignores the file position
+                    audio_bytes = uploaded_file.getvalue()
                     
                     if not audio_bytes:
                         st.error("No audio data found. Please try uploading the file again.")
@@ -379,9 +989,7 @@ def main():
                     if enable_streaming and is_streaming_available():
                         # Streaming transcription
                         try:
-                            from ClarifaiUtil import create_streaming_transcriber
-                            
-                            streaming_transcriber = create_streaming_transcriber(config.CLARIFAI_PAT)
+                            streaming_transcriber = _get_streaming_transcriber(config.CLARIFAI_PAT)
                             
                             # Create containers for real-time updates
                             st.info(f"🌊 Starting streaming transcription with {model_name}")
@@ -469,13 +1077,26 @@ def main():
                         # Regular transcription
                         with st.spinner(f"Transcribing audio using {model_name}..."):
                             try:
+                                # Reuse the Analyze Audio Quality result if it was for this same upload
+                                audio_digest = content_digest(audio_bytes)
+                                precomputed_analysis = None
+                                if st.session_state.get('audio_analysis_digest') == audio_digest:
+                                    precomputed_analysis = st.session_state.get('audio_analysis')
+                                
+                                audio_suffix = os.path.splitext(uploaded_file.name)[1] if api_format == "original" else f".{api_format}"
+                                
                                 # Start timing the Clarifai API call
                                 start_time = time.time()
                                 
-                                transcription, processed_audio, audio_analysis = transcriber.transcribe_with_format_control(
-                                    audio_bytes, 
-                                    model_name, 
-                                    temperature, 
+                                # Conversion and the API call run on a worker thread so the
+                                # script thread can keep an elapsed-time readout updating
+                                future = _get_worker_pool().submit(
+                                    transcribe_with_format_control_cached,
+                                    transcriber,
+                                    audio_bytes,
+                                    audio_digest,
+                                    model_name,
+                                    temperature,
                                     max_tokens,
                                     api_format=api_format,
                                     high_quality_conversion=high_quality_conversion,
@@ -483,8 +1104,15 @@ def main():
                                     normalize_audio=normalize_audio,
                                     trim_silence=trim_silence,
                                     noise_reduce=noise_reduce,
-                                    gain_db=gain_db
+                                    gain_db=gain_db,
+                                    audio_suffix=audio_suffix,
+                                    precomputed_analysis=precomputed_analysis
                                 )
+                                elapsed_text = st.empty()
+                                while not wait([future], timeout=PROGRESS_POLL_SECONDS).done:
+                                    elapsed_text.caption(f"⏳ {time.time() - start_time:.1f}s elapsed")
+                                elapsed_text.empty()
+                                transcription, processed_audio_path, audio_analysis = future.result()
                                 
                                 # Calculate API call duration
                                 end_time = time.time()
@@ -494,11 +1122,14 @@ def main():
                                 if transcription:
                                     st.session_state.transcription = transcription
                                     st.session_state.model_used = model_name
-                                    st.session_state.converted_wav = processed_audio  # Store processed audio
+                                    # Keep the processed audio on disk rather than in session memory
+                                    _remove_files([st.session_state.get('converted_audio_path')])
+                                    st.session_state.converted_audio_path = processed_audio_path
                                     st.session_state.original_filename = uploaded_file.name
                                     st.session_state.api_duration = api_duration  # Store API timing
                                     st.session_state.api_format = api_format  # Store API format used
                                     st.session_state.audio_analysis = audio_analysis  # Store audio analysis
+                                    st.session_state.audio_analysis_digest = audio_digest
                                     st.session_state.is_streaming = False
                                     st.session_state.audio_timestamp = time.time()  # Track when audio was created
                                     st.success(f"Transcription completed in {api_duration:.2f} seconds using {api_format.upper()} format!")
@@ -513,183 +1144,7 @@ def main():
                                 st.error(f"Transcription failed: {str(e)}")
         
             with col2:
-                st.header("Transcription Result")
-                
-                if hasattr(st.session_state, 'transcription'):
-                    # Model and format info
-                    is_streaming = getattr(st.session_state, 'is_streaming', False)
-                    
-                    if is_streaming:
-                        # Streaming results header
-                        model_info_col1, model_info_col2 = st.columns([2, 1])
-                        with model_info_col1:
-                            st.subheader(f"🌊 Streaming Model: {st.session_state.model_used}")
-                        with model_info_col2:
-                            streaming_mode_used = getattr(st.session_state, 'streaming_mode', 'Real-time Display')
-                            st.subheader(f"Mode: {streaming_mode_used}")
-                        
-                        # Streaming statistics
-                        if hasattr(st.session_state, 'streaming_results'):
-                            streaming_results = st.session_state.streaming_results
-                            chunk_duration = getattr(st.session_state, 'chunk_duration', 5000) / 1000
-                            
-                            stream_col1, stream_col2, stream_col3, stream_col4 = st.columns(4)
-                            
-                            with stream_col1:
-                                total_chunks = len([r for r in streaming_results if not r.get('is_final', False)])
-                                st.metric("Total Chunks", total_chunks)
-                            
-                            with stream_col2:
-                                st.metric("Chunk Size", f"{chunk_duration:.1f}s")
-                            
-                            with stream_col3:
-                                total_time = getattr(st.session_state, 'api_duration', 0)
-                                st.metric("Total Time", f"{total_time:.2f}s")
-                            
-                            with stream_col4:
-                                avg_time = total_time / max(total_chunks, 1)
-                                st.metric("Avg/Chunk", f"{avg_time:.2f}s")
-                            
-                            # Streaming details expander
-                            with st.expander("🌊 Streaming Details", expanded=False):
-                                st.markdown("**Processing Timeline:**")
-                                
-                                for i, result in enumerate(streaming_results):
-                                    if not result.get('is_final', False):
-                                        chunk_text = result.get('text', '')
-                                        processing_time = result.get('processing_time', 0)
-                                        
-                                        if chunk_text:
-                                            st.markdown(f"**Chunk {i+1}** ({processing_time:.2f}s): {chunk_text}")
-                                        else:
-                                            st.markdown(f"**Chunk {i+1}** ({processing_time:.2f}s): *No text*")
-                    else:
-                        # Regular transcription header
-                        model_info_col1, model_info_col2 = st.columns([2, 1])
-                        with model_info_col1:
-                            st.subheader(f"Model Used: {st.session_state.model_used}")
-                        with model_info_col2:
-                            api_format_used = getattr(st.session_state, 'api_format', 'original')
-                            st.subheader(f"Format: {api_format_used.upper()}")
-                
-                    # Show audio analysis if available
-                    if hasattr(st.session_state, 'audio_analysis') and st.session_state.audio_analysis and "error" not in st.session_state.audio_analysis:
-                        analysis = st.session_state.audio_analysis
-                        
-                        with st.expander("📊 Audio Analysis Results", expanded=False):
-                            analysis_col1, analysis_col2, analysis_col3, analysis_col4 = st.columns(4)
-                            
-                            with analysis_col1:
-                                st.metric("Duration", f"{analysis['duration_seconds']:.1f}s")
-                                st.metric("Sample Rate", f"{analysis['sample_rate']:,}Hz")
-                            with analysis_col2:
-                                st.metric("Channels", analysis['channels'])
-                                st.metric("Bit Depth", f"{analysis['bit_depth']}-bit")
-                            with analysis_col3:
-                                st.metric("File Size", f"{analysis['file_size_kb']:.1f}KB")
-                                st.metric("Bitrate", f"{analysis['bitrate']:,}bps")
-                            with analysis_col4:
-                                quality_color = analysis['quality_color']
-                                st.markdown(f"**Quality Score:**")
-                                st.markdown(f":{quality_color}[{analysis['overall_quality']} ({analysis['quality_score']}/100)]")
-                
-                    # Audio playback section
-                    if hasattr(st.session_state, 'converted_wav') and st.session_state.converted_wav:
-                        format_used = getattr(st.session_state, 'api_format', 'original').upper()
-                        st.subheader(f"🎵 Processed Audio ({format_used})")
-                        st.caption(f"This is the {format_used.lower()}-formatted audio that was sent to the AI model")
-                    
-                        # Check if audio is recent (within last 10 minutes to avoid stale references)
-                        audio_age = time.time() - getattr(st.session_state, 'audio_timestamp', 0)
-                        
-                        if audio_age < 600:  # 10 minutes
-                            # Play the converted WAV file with error handling
-                            try:
-                                # Create a fresh BytesIO object for audio playback
-                                audio_buffer = io.BytesIO(st.session_state.converted_wav)
-                                st.audio(audio_buffer, format="audio/wav")
-                            except Exception as e:
-                                st.warning("Audio playback temporarily unavailable. You can still download the converted WAV file below.")
-                                st.caption(f"Audio playback error: {str(e)}")
-                                
-                                # Provide refresh option
-                                if st.button("🔄 Refresh Audio", help="Reset audio player"):
-                                    st.session_state.audio_timestamp = time.time()
-                                    st.rerun()
-                        else:
-                            st.warning("Audio playback expired for performance reasons. You can still download the converted WAV file below.")
-                            st.caption("Re-run transcription to enable audio playback again.")
-                    
-                        # Show audio info
-                        original_name = getattr(st.session_state, 'original_filename', 'unknown')
-                        processed_size_kb = len(st.session_state.converted_wav) / 1024
-                        format_used = getattr(st.session_state, 'api_format', 'original')
-                        st.caption(f"📁 Original: {original_name} → Processed {format_used.upper()}: {processed_size_kb:.1f} KB")
-                        
-                        # Download button for processed audio
-                        processed_filename = f"processed_{original_name.rsplit('.', 1)[0] if '.' in original_name else original_name}.{format_used}"
-                        
-                        # Set appropriate MIME type
-                        mime_types = {
-                            'wav': 'audio/wav',
-                            'mp3': 'audio/mpeg',
-                            'flac': 'audio/flac', 
-                            'ogg': 'audio/ogg'
-                        }
-                        mime_type = mime_types.get(format_used, 'audio/wav')
-                        
-                        st.download_button(
-                            label=f"📥 Download Processed {format_used.upper()}",
-                            data=st.session_state.converted_wav,
-                            file_name=processed_filename,
-                            mime=mime_type,
-                            help=f"Download the processed {format_used.upper()} file used for transcription"
-                        )
-                        
-                        st.divider()
-                
-                    # Display transcription in a text area for easy copying
-                    st.text_area(
-                        "Transcribed Text",
-                        value=st.session_state.transcription,
-                        height=300,
-                        help="You can copy the transcribed text from here"
-                    )
-                    
-                    # Download button and timing info in columns
-                    download_col1, download_col2 = st.columns([2, 1])
-                    
-                    with download_col1:
-                        # Download button for transcription
-                        st.download_button(
-                            label="📥 Download Transcription",
-                            data=st.session_state.transcription,
-                            file_name=f"transcription_{st.session_state.model_used.lower().replace(' ', '_')}.txt",
-                            mime="text/plain"
-                        )
-                    
-                    with download_col2:
-                        # Display API call timing
-                        if hasattr(st.session_state, 'api_duration'):
-                            st.metric(
-                                label="⏱️ API Time",
-                                value=f"{st.session_state.api_duration:.2f}s",
-                                help="Time taken for the Clarifai API call"
-                            )
-                
-                    # Clear button
-                    if st.button("🗑️ Clear Result"):
-                        # Clear all transcription-related session data
-                        keys_to_clear = [
-                            'transcription', 'model_used', 'converted_wav', 'original_filename',
-                            'api_duration', 'audio_timestamp', 'api_format', 'audio_analysis'
-                        ]
-                        for key in keys_to_clear:
-                            if hasattr(st.session_state, key):
-                                delattr(st.session_state, key)
-                        st.rerun()
-                else:
-                    st.info("Upload an audio file and click 'Transcribe Audio' to see results here.")
+                _render_transcription_result()
         
         if processing_mode == "Batch Processing":
             st.header("🗂️ Batch Audio Processing")
@@ -733,124 +1188,156 @@ def main():
                 
                 # Batch processing controls
                 if valid_files:
+                    batch_workers = st.number_input(
+                        "Parallel requests",
+                        min_value=1,
+                        max_value=BATCH_MAX_WORKERS * 2,
+                        value=BATCH_MAX_WORKERS,
+                        help="Files transcribed concurrently. Raise it for many small files; lower it if the API starts rate limiting."
+                    )
                     batch_ctrl_col1, batch_ctrl_col2 = st.columns([2, 1])
                     
                     with batch_ctrl_col1:
                         if st.button("🚀 Process All Files", type="primary"):
-                            # Initialize batch processing
-                            if 'batch_results' not in st.session_state:
-                                st.session_state.batch_results = {}
-                            
                             # Process each file
                             progress_bar = st.progress(0)
                             status_text = st.empty()
                             
-                            for i, file in enumerate(valid_files):
-                                status_text.text(f"Processing {file.name} ({i+1}/{len(valid_files)})...")
-                                progress_bar.progress((i) / len(valid_files))
-                                
+                            # Files keyed by content, so two uploads with the same name get their own
+                            # results and widget keys, and a file uploaded twice is processed once.
+                            # Each upload is read once here; the digest and the converter share the bytes
+                            batch_files = {}
+                            for file in valid_files:
+                                audio_bytes = file.getvalue()
+                                batch_files.setdefault(content_digest(audio_bytes), (file, audio_bytes))
+                            
+                            def convert_file(audio_bytes):
+                                # Stage 1, on a conversion thread: decode and convert to WAV.
+                                # Runs on a worker thread: no Streamlit calls here
+                                start_time = time.time()
+                                converted_wav = transcriber.prepare_wav(
+                                    audio_bytes,
+                                    high_quality_conversion=high_quality_conversion,
+                                    target_sample_rate=target_sample_rate,
+                                    normalize_audio=normalize_audio,
+                                    trim_silence=trim_silence
+                                )
+                                return converted_wav, time.time() - start_time
+                            
+                            def transcribe_file(conversion, audio_digest):
+                                # Stage 2, on an API thread: send the WAV once its conversion finishes.
+                                # A file already transcribed with the same settings comes from the cache.
+                                # With grouped API requests enabled, the file reserves its place while it
+                                # waits for its conversion, so an open request waits for it (within
+                                # BATCH_API_WINDOW_MS) but not for files no API thread has picked up yet
+                                group_ticket = transcriber.reserve_grouped_call() if transcriber.supports_batch_api else None
                                 try:
-                                    # Read file
-                                    file.seek(0)
-                                    audio_bytes = file.read()
-                                    
-                                    # Perform transcription using the existing method
+                                    converted_wav, convert_seconds = conversion.result()
                                     start_time = time.time()
-                                    transcription, converted_wav = transcriber.transcribe_audio_with_wav(
-                                        audio_bytes, 
-                                        model_name, 
-                                        temperature, 
-                                        max_tokens,
-                                        high_quality_conversion=high_quality_conversion,
-                                        target_sample_rate=target_sample_rate,
-                                        normalize_audio=normalize_audio,
-                                        trim_silence=trim_silence
-                                    )
-                                    end_time = time.time()
-                                    
-                                    # Store results
-                                    st.session_state.batch_results[file.name] = {
-                                        'transcription': transcription,
-                                        'duration': end_time - start_time,
-                                        'success': True,
-                                        'converted_wav': converted_wav
-                                    }
+                                    # The WAV is spilled to disk on the conversion pool while the request is in flight
+                                    wav_write = convert_executor.submit(_write_temp_audio, converted_wav) if converted_wav else None
+                                    try:
+                                        transcription = transcribe_wav_cached(
+                                            transcriber, converted_wav, audio_digest, model_name, temperature, max_tokens,
+                                            high_quality_conversion, target_sample_rate, normalize_audio, trim_silence,
+                                            _group_ticket=group_ticket
+                                        )
+                                    except Exception:
+                                        _remove_files([wav_write.result() if wav_write else None])
+                                        raise
+                                    wav_path = wav_write.result() if wav_write else None
+                                    return transcription, wav_path, convert_seconds + time.time() - start_time
+                                finally:
+                                    # Failed conversions and cache hits never reach the API; stop grouped
+                                    # requests from waiting for them
+                                    transcriber.release_grouped_call(group_ticket)
+                            
+                            # Conversion (CPU, ffmpeg subprocesses) and the API calls (network) run on
+                            # separate pools, so later files convert while earlier ones are in flight;
+                            # results are stored and progress drawn from this (the script) thread
+                            status_text.text(f"Processing {len(batch_files)} files...")
+                            
+                            # One status row per file, updated the moment that file finishes, so the
+                            # first transcripts show up while the rest of the batch is still running.
+                            # Cleared afterwards: the full results list below has the keyed widgets
+                            live_area = st.empty()
+                            with live_area.container():
+                                file_status = {
+                                    audio_digest: st.status(f"⏳ {file.name}", state="running")
+                                    for audio_digest, (file, _) in batch_files.items()
+                                }
+                            with ThreadPoolExecutor(
+                                max_workers=min(os.cpu_count() or 1, len(batch_files)),
+                                thread_name_prefix="batch-convert"
+                            ) as convert_executor, ThreadPoolExecutor(
+                                max_workers=min(int(batch_workers), len(batch_files)),
+                                thread_name_prefix="batch-transcribe"
+                            ) as executor:
+                                futures = {
+                                    executor.submit(
+                                        transcribe_file, convert_executor.submit(convert_file, audio_bytes), audio_digest
+                                    ): audio_digest
+                                    for audio_digest, (_, audio_bytes) in batch_files.items()
+                                }
+                                
+                                successful = 0
+                                for done, future in enumerate(as_completed(futures), start=1):
+                                    audio_digest = futures[future]
+                                    file = batch_files[audio_digest][0]
+                                    fid = audio_digest[:16]
+                                    try:
+                                        transcription, wav_path, duration = future.result()
+                                        
+                                        # Store results
+                                        _store_batch_result(fid, {
+                                            'file_name': file.name,
+                                            'transcription': transcription,
+                                            'duration': duration,
+                                            'success': True,
+                                            # Only the path stays in session state; the WAV lives on disk
+                                            'wav_path': wav_path
+                                        })
+                                        
+                                        successful += 1
+                                        with file_status[audio_digest]:
+                                            st.write(transcription)
+                                        file_status[audio_digest].update(
+                                            label=f"✅ {file.name} ({duration:.2f}s)", state="complete"
+                                        )
+                                        
+                                    except Exception as e:
+                                        _store_batch_result(fid, {
+                                            'file_name': file.name,
+                                            'error': str(e),
+                                            'success': False
+                                        })
+                                        
+                                        with file_status[audio_digest]:
+                                            st.error(f"Error: {str(e)}")
+                                        file_status[audio_digest].update(label=f"❌ {file.name}", state="error")
                                     
-                                except Exception as e:
-                                    st.session_state.batch_results[file.name] = {
-                                        'error': str(e),
-                                        'success': False
-                                    }
+                                    status_text.text(f"Finished {file.name} ({done}/{len(batch_files)})")
+                                    progress_bar.progress(done / len(batch_files))
                             
                             # Complete progress
+                            live_area.empty()
                             progress_bar.progress(1.0)
-                            status_text.text(f"Completed processing {len(valid_files)} files!")
+                            status_text.text(f"Completed processing {len(batch_files)} files!")
                             
                             # Show results summary
-                            successful = sum(1 for r in st.session_state.batch_results.values() if r['success'])
-                            failed = len(valid_files) - successful
+                            failed = len(batch_files) - successful
                             
                             st.success(f"✅ Batch processing complete: {successful} successful, {failed} failed")
                     
                     with batch_ctrl_col2:
                         if st.button("🗑️ Clear Batch"):
                             if 'batch_results' in st.session_state:
+                                _remove_batch_wavs(st.session_state.batch_results.values())
                                 del st.session_state.batch_results
+                                st.session_state.pop('batch_stats', None)
                             st.rerun()
                 
-                # Show batch results
-                if 'batch_results' in st.session_state and st.session_state.batch_results:
-                    st.subheader("📋 Batch Results")
-                    
-                    # Results summary
-                    results = st.session_state.batch_results
-                    successful_count = sum(1 for r in results.values() if r['success'])
-                    total_time = sum(r.get('duration', 0) for r in results.values() if r['success'])
-                    
-                    summary_col1, summary_col2, summary_col3 = st.columns(3)
-                    with summary_col1:
-                        st.metric("Files Processed", len(results))
-                    with summary_col2:
-                        st.metric("Success Rate", f"{(successful_count/len(results)*100):.0f}%")
-                    with summary_col3:
-                        st.metric("Total Time", f"{total_time:.1f}s")
-                    
-                    # Individual results
-                    for filename, result in results.items():
-                        with st.expander(f"📄 {filename}", expanded=False):
-                            if result['success']:
-                                st.write(f"**Status:** ✅ Success ({result['duration']:.2f}s)")
-                                
-                                # Show transcription
-                                st.text_area(
-                                    "Transcription",
-                                    value=result['transcription'],
-                                    height=150,
-                                    key=f"batch_text_{filename}"
-                                )
-                                
-                                # Download buttons
-                                result_col1, result_col2 = st.columns(2)
-                                with result_col1:
-                                    st.download_button(
-                                        label="📥 Download Text",
-                                        data=result['transcription'],
-                                        file_name=f"transcription_{filename.rsplit('.', 1)[0]}.txt",
-                                        mime="text/plain",
-                                        key=f"batch_dl_text_{filename}"
-                                    )
-                                with result_col2:
-                                    if result.get('converted_wav'):
-                                        st.download_button(
-                                            label="📥 Download WAV",
-                                            data=result['converted_wav'],
-                                            file_name=f"converted_{filename.rsplit('.', 1)[0]}.wav",
-                                            mime="audio/wav",
-                                            key=f"batch_dl_audio_{filename}"
-                                        )
-                            else:
-                                st.write(f"**Status:** ❌ Failed")
-                                st.error(f"Error: {result['error']}")
+                _render_batch_results()
             
             else:
                 st.info("📁 Select multiple audio files to start batch processing.")
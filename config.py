@@ -40,6 +40,17 @@ class Config:
         self.MAX_VIDEO_SIZE_MB = int(os.getenv("MAX_VIDEO_SIZE_MB", "100"))  # Larger for videos
         self.VIDEO_FRAME_EXTRACTION_INTERVAL = int(os.getenv("VIDEO_FRAME_EXTRACTION_INTERVAL", "5"))  # Extract frame every N seconds
         self.VIDEO_QUALITY_OPTIMIZATION = os.getenv("VIDEO_QUALITY_OPTIMIZATION", "true").lower() == "true"
+        # Hardware decoder for key-frame extraction via PyAV 14+ (e.g. "cuda", "vaapi");
+        # empty keeps software decoding
+        self.VIDEO_HWACCEL = os.getenv("VIDEO_HWACCEL", "").lower()
+        # Persist video results keyed by key-frame perceptual hashes and the audio envelope,
+        # so re-encoded copies of the same footage skip the API call. Off by default: results
+        # are shared across sessions and users, and every miss pays for an extra decode
+        self.VIDEO_PHASH_CACHE = os.getenv("VIDEO_PHASH_CACHE", "false").lower() == "true"
+        self.VIDEO_PHASH_CACHE_PATH = os.getenv(
+            "VIDEO_PHASH_CACHE_PATH",
+            os.path.join(os.path.expanduser("~"), ".cache", "audio_transcribe", "phash_transcripts.db")
+        )
         
         # Debug Settings
         self.DEBUG_VIDEO_PROCESSING = os.getenv("DEBUG_VIDEO_PROCESSING", "false").lower() == "true"
@@ -49,7 +60,25 @@ class Config:
         self.TARGET_SAMPLE_RATE = int(os.getenv("TARGET_SAMPLE_RATE", "16000"))  # Optimal for speech recognition
         self.NORMALIZE_AUDIO = os.getenv("NORMALIZE_AUDIO", "true").lower() == "true"
         self.TRIM_SILENCE = os.getenv("TRIM_SILENCE", "true").lower() == "true"
-        
+
+        # Streaming Settings
+        # Wire format for streaming chunks: "pcm16" (default), "mulaw" or "pcm8".
+        # Compact formats halve upload bytes but the model must accept the codec.
+        self.STREAMING_WIRE_FORMAT = os.getenv("STREAMING_WIRE_FORMAT", "pcm16").lower()
+
+        # Long Audio Settings
+        # Audio longer than this is split at pauses and the chunks are transcribed concurrently
+        self.LONG_AUDIO_CHUNK_SECONDS = int(os.getenv("LONG_AUDIO_CHUNK_SECONDS", "30"))
+        # Concurrent chunk requests per Clarifai client, shared by all sessions using it
+        self.LONG_AUDIO_MAX_WORKERS = int(os.getenv("LONG_AUDIO_MAX_WORKERS", "4"))
+
+        # Batch API Settings
+        # Batch files transcribed at the same moment share one multi-input request, up to
+        # this many inputs; 1 (the default) sends one request per file
+        self.BATCH_API_MAX_INPUTS = int(os.getenv("BATCH_API_MAX_INPUTS", "1"))
+        # Longest the first file of a request waits for batch files still on their way
+        self.BATCH_API_WINDOW_MS = int(os.getenv("BATCH_API_WINDOW_MS", "200"))
+
         # Model configurations
         self.AVAILABLE_MODELS = {
             "AssemblyAI Audio Transcription": {
@@ -0,0 +1,43 @@
+"""
+streamlit_compat.py - Streamlit version shims shared by the audio and video apps
+"""
+
+import streamlit as st
+
+# st.download_button accepts a callable for data (built only when clicked) from
+# Streamlit 1.50; earlier releases reject anything but str/bytes/file objects
+DEFERRED_DOWNLOAD_MIN_VERSION = (1, 50)
+
+
+def _streamlit_version() -> tuple:
+    """(major, minor) of the installed Streamlit, ignoring pre-release suffixes"""
+    version = []
+    for part in st.__version__.split(".")[:2]:
+        digits = ""
+        for char in part:
+            if not char.isdigit():
+                break
+            digits += char
+        version.append(int(digits or 0))
+    return tuple(version)
+
+
+DEFERRED_DOWNLOAD_AVAILABLE = _streamlit_version() >= DEFERRED_DOWNLOAD_MIN_VERSION
+
+
+def deferred_download_button(label: str, data, **kwargs):
+    """
+    Download button that hands Streamlit the payload only when it is clicked
+    
+    Eager str/bytes data is registered with Streamlit's media file storage on
+    every rerun; a callable defers that until the user downloads. On Streamlit
+    releases without deferred downloads the callable is evaluated up front.
+    
+    Args:
+        label: Button label
+        data: Text or bytes to download, or a callable returning them
+        **kwargs: Other st.download_button arguments (file_name, mime, key, help)
+    """
+    if callable(data) and not DEFERRED_DOWNLOAD_AVAILABLE:
+        data = data()
+    return st.download_button(label=label, data=data, **kwargs)
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+test_batch_api_grouping.py - Test that concurrent batch transcriptions share one API request
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from config import config
+from ClarifaiUtil import ClarifaiTranscriber
+from clarifai_grpc.grpc.api.status import status_code_pb2
+
+
+def fake_output(text, code=status_code_pb2.SUCCESS):
+    return SimpleNamespace(
+        status=SimpleNamespace(code=code, description="input failed"),
+        data=SimpleNamespace(concepts=[], text=SimpleNamespace(raw=text))
+    )
+
+
+def test_batch_api_grouping():
+    """Test that concurrent transcribe_wav_grouped calls are sent as one multi-input request"""
+    print("🧪 Testing Batch API Grouping")
+    print("=" * 60)
+
+    original_max_inputs = config.BATCH_API_MAX_INPUTS
+    original_window_ms = config.BATCH_API_WINDOW_MS
+    try:
+        transcriber = ClarifaiTranscriber(api_key=os.getenv("CLARIFAI_PAT") or "test-key-for-grouping")
+        config.BATCH_API_MAX_INPUTS = 8
+        config.BATCH_API_WINDOW_MS = 5000
+
+        # Count API requests instead of hitting the network; each output echoes its input
+        requests = []
+        fail_requests = []
+
+        def fake_post(request, metadata=None):
+            requests.append(len(request.inputs))
+            if fail_requests:
+                return SimpleNamespace(status=SimpleNamespace(code=status_code_pb2.FAILURE, description="down"),
+                                       outputs=[])
+            outputs = [
+                fake_output(f"text for {i.data.audio.base64.decode()}",
+                            status_code_pb2.FAILURE if i.data.audio.base64 == b"bad" else status_code_pb2.SUCCESS)
+                for i in request.inputs
+            ]
+            return SimpleNamespace(status=SimpleNamespace(code=status_code_pb2.MIXED_STATUS), outputs=outputs)
+
+        transcriber.stub = SimpleNamespace(PostModelOutputs=fake_post)
+
+        # Individual retries go through transcribe_wav
+        retries = []
+
+        def fake_transcribe_wav(wav, *args):
+            retries.append(wav)
+            if wav == b"bad":
+                raise Exception("Clarifai API error: input failed")
+            return f"retried {wav.decode()}"
+
+        transcriber.transcribe_wav = fake_transcribe_wav
+
+        def run_group(wavs):
+            # Reserve every call first, as the batch does while files convert
+            tickets = [transcriber.reserve_grouped_call() for _ in wavs]
+
+            def call(args):
+                wav, ticket = args
+                try:
+                    return transcriber.transcribe_wav_grouped(wav, "OpenAI Whisper", ticket=ticket)
+                except Exception as e:
+                    return e
+
+            with ThreadPoolExecutor(max_workers=len(wavs)) as pool:
+                return list(pool.map(call, zip(wavs, tickets)))
+
+        print("\n🔧 Test 1: Reserved calls are sent together without waiting for the window")
+        start = time.time()
+        results = run_group([b"a", b"b", b"c", b"bad"])
+        assert requests == [4], f"Expected one request of 4 inputs, got {requests}"
+        assert time.time() - start < 2, "Group waited for the window instead of flushing"
+        assert results[:3] == ["text for a", "text for b", "text for c"], results
+        print("✅ Four files, one request, flushed once every reserved call arrived")
+
+        print("\n🔧 Test 2: A failed output is retried on its own")
+        assert retries == [b"bad"], retries
+        assert isinstance(results[3], Exception), results[3]
+        print("✅ Failed input retried individually and raised for its caller only")
+
+        print("\n🔧 Test 3: A failed request retries every input individually")
+        requests.clear()
+        retries.clear()
+        fail_requests.append(True)
+        results = run_group([b"x", b"y"])
+        assert requests == [2], requests
+        assert sorted(retries) == [b"x", b"y"], retries
+        assert results == ["retried x", "retried y"], results
+        print("✅ Group failure fell back to one request per file")
+
+        print("\n🔧 Test 4: Released tickets stop a group waiting")
+        fail_requests.clear()
+        requests.clear()
+        retries.clear()
+        ticket = transcriber.reserve_grouped_call()
+        other = transcriber.reserve_grouped_call()
+        transcriber.release_grouped_call(other)  # e.g. a cache hit
+        start = time.time()
+        assert transcriber.transcribe_wav_grouped(b"a", "OpenAI Whisper", ticket=ticket) == "retried a"
+        assert time.time() - start < 2, "Lone call waited for a released ticket"
+        assert requests == [], "A single call should be sent without a grouped request"
+        print("✅ Lone call sent immediately")
+
+        print("\n🔧 Test 5: Grouping disabled sends one request per file")
+        config.BATCH_API_MAX_INPUTS = 1
+        retries.clear()
+        assert transcriber.transcribe_wav_grouped(b"a", "OpenAI Whisper") == "retried a"
+        assert retries == [b"a"], retries
+        print("✅ Falls back to transcribe_wav")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ Batch API grouping test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+    finally:
+        config.BATCH_API_MAX_INPUTS = original_max_inputs
+        config.BATCH_API_WINDOW_MS = original_window_ms
+
+
+if __name__ == "__main__":
+    success = test_batch_api_grouping()
+    if success:
+        print("\n🎉 All batch API grouping tests passed!")
+    else:
+        print("\n❌ Batch API grouping tests failed")
+    sys.exit(0 if success else 1)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+test_chunk_cache.py - Test fingerprint deduplication of repeated streaming chunks
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from config import config
+from ClarifaiUtil import create_streaming_transcriber
+
+
+def test_chunk_cache():
+    """Test that byte-identical chunks are transcribed only once"""
+    print("🧪 Testing Streaming Chunk Cache")
+    print("=" * 60)
+
+    try:
+        # Dummy PAT: the only network call, _transcribe_chunk, is replaced below
+        streaming_transcriber = create_streaming_transcriber(os.getenv("CLARIFAI_PAT") or "test-key-for-chunk-cache")
+
+        # Create test audio (6 seconds of silence -> three identical 2s chunks)
+        minimal_wav = (
+            b'RIFF' + (44 + 192000).to_bytes(4, 'little') + b'WAVE' +
+            b'fmt ' + (16).to_bytes(4, 'little') +
+            (1).to_bytes(2, 'little') +  # PCM
+            (1).to_bytes(2, 'little') +  # mono
+            (16000).to_bytes(4, 'little') +  # sample rate
+            (32000).to_bytes(4, 'little') +  # byte rate
+            (2).to_bytes(2, 'little') +   # block align
+            (16).to_bytes(2, 'little') +  # bits per sample
+            b'data' + (192000).to_bytes(4, 'little') +
+            b'\x00' * 192000  # 6 seconds of silence
+        )
+
+        # Count API calls instead of hitting the network
+        api_calls = []
+
+        def fake_transcribe_chunk(chunk_bytes, model_name):
+            api_calls.append(len(chunk_bytes))
+            return "silence"
+
+        streaming_transcriber._transcribe_chunk = fake_transcribe_chunk
+
+        print("\n🔧 Test 1: Repeated chunks hit the cache")
+        results = list(streaming_transcriber.transcribe_streaming(
+            minimal_wav,
+            model_name="OpenAI Whisper Large V3",
+            chunk_duration_ms=2000
+        ))
+        chunk_results = [r for r in results if not r.get("is_final")]
+        cached = [r for r in chunk_results if r.get("from_cache")]
+
+        print(f"  Chunks: {len(chunk_results)}, API calls: {len(api_calls)}, cache hits: {len(cached)}")
+        assert len(chunk_results) == 3, f"Expected 3 chunks, got {len(chunk_results)}"
+        assert len(api_calls) == 1, f"Expected 1 API call, got {len(api_calls)}"
+        assert len(cached) == 2, f"Expected 2 cache hits, got {len(cached)}"
+        assert all(r["text"] == "silence" for r in chunk_results)
+        print("✅ Identical chunks transcribed once")
+
+        print("\n🔧 Test 2: Cache key depends on model")
+        key_a = streaming_transcriber._get_chunk_cache_key(b"chunk", "OpenAI Whisper")
+        key_b = streaming_transcriber._get_chunk_cache_key(b"chunk", "OpenAI Whisper Large V3")
+        assert key_a != key_b, "Different models must not share cache entries"
+        assert len(key_a) == 16
+        print("✅ Cache keys are per-model 16-byte digests")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ Chunk cache test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    success = test_chunk_cache()
+    if success:
+        print("\n🎉 All chunk cache tests passed!")
+    else:
+        print("\n❌ Chunk cache tests failed")
+    sys.exit(0 if success else 1)
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+test_long_audio_chunking.py - Test pause-aligned splitting of long audio
+"""
+
+import io
+import sys
+import wave
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from ClarifaiUtil import EMPTY_RESPONSE_TEXT, create_transcriber, split_wav_at_pauses
+
+
+def make_wav(samples: np.ndarray, rate: int = 16000) -> bytes:
+    """Encode int16 samples as mono 16-bit PCM WAV"""
+    out = io.BytesIO()
+    with wave.open(out, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(samples.astype('<i2').tobytes())
+    return out.getvalue()
+
+
+def test_long_audio_chunking():
+    """Test that long audio is cut at pauses and transcribed chunk by chunk in order"""
+    print("🧪 Testing Long Audio Chunking")
+    print("=" * 60)
+
+    try:
+        rate = 16000
+        # 70s of "speech" (noise) with a 1s pause starting at 27s and 54s
+        rng = np.random.default_rng(0)
+        samples = rng.integers(-8000, 8000, size=70 * rate)
+        samples[27 * rate:28 * rate] = 0
+        samples[54 * rate:55 * rate] = 0
+        wav_bytes = make_wav(samples, rate)
+
+        print("\n🔧 Test 1: Cuts land inside the pauses")
+        chunks = split_wav_at_pauses(wav_bytes, 30)
+        lengths = []
+        for chunk in chunks:
+            with wave.open(io.BytesIO(chunk), 'rb') as wav:
+                lengths.append(wav.getnframes())
+        cuts = np.cumsum(lengths)[:-1] / rate
+        print(f"  Chunks: {len(chunks)}, cuts at: {[f'{c:.2f}s' for c in cuts]}")
+        assert len(chunks) == 3, f"Expected 3 chunks, got {len(chunks)}"
+        assert sum(lengths) == len(samples), "Chunks must cover every sample"
+        assert all(length <= 30 * rate for length in lengths)
+        assert 27 <= cuts[0] <= 28 and 54 <= cuts[1] <= 55, f"Cuts missed the pauses: {cuts}"
+        print("✅ Audio split at the pauses")
+
+        print("\n🔧 Test 2: Short audio is left whole")
+        short_wav = make_wav(samples[:10 * rate], rate)
+        assert split_wav_at_pauses(short_wav, 30) == [short_wav]
+        print("✅ Short audio not split")
+
+        print("\n🔧 Test 3: Chunk transcriptions are joined in order")
+        transcriber = create_transcriber("test-key-for-chunking")
+        order = {chunk: i for i, chunk in enumerate(chunks)}
+
+        def fake_transcribe_audio(audio_bytes, model_name, temperature=0.01, max_tokens=1000):
+            return f"part{order[audio_bytes]}"
+
+        transcriber.transcribe_audio = fake_transcribe_audio
+        text = transcriber.transcribe_audio_chunked(wav_bytes, "OpenAI Whisper Large V3", max_chunk_seconds=30)
+        assert text == "part0 part1 part2", f"Unexpected transcription: {text}"
+        print("✅ Chunks transcribed and stitched in order")
+
+        print("\n🔧 Test 4: Placeholder texts are not stitched into the transcript")
+
+        def fake_transcribe_placeholder(audio_bytes, model_name, temperature=0.01, max_tokens=1000):
+            return EMPTY_RESPONSE_TEXT if order[audio_bytes] == 1 else f"part{order[audio_bytes]}"
+
+        transcriber.transcribe_audio = fake_transcribe_placeholder
+        text = transcriber.transcribe_audio_chunked(wav_bytes, "OpenAI Whisper Large V3", max_chunk_seconds=30)
+        assert text == "part0 part2", f"Unexpected transcription: {text}"
+        transcriber.transcribe_audio = lambda *args, **kwargs: EMPTY_RESPONSE_TEXT
+        text = transcriber.transcribe_audio_chunked(wav_bytes, "OpenAI Whisper Large V3", max_chunk_seconds=30)
+        assert text == EMPTY_RESPONSE_TEXT, f"Model message lost: {text}"
+        print("✅ Placeholders dropped, or reported when no chunk has text")
+
+        print("\n🔧 Test 5: Unknown model raises instead of returning no text")
+        try:
+            transcriber.transcribe_audio_chunked(wav_bytes, "No Such Model", max_chunk_seconds=30)
+            raise AssertionError("Unknown model was not reported")
+        except ValueError as e:
+            assert "Unknown model" in str(e), str(e)
+        print("✅ Unknown model raised ValueError")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ Long audio chunking test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    success = test_long_audio_chunking()
+    if success:
+        print("\n🎉 All long audio chunking tests passed!")
+    else:
+        print("\n❌ Long audio chunking tests failed")
+    sys.exit(0 if success else 1)